@@ -17,6 +17,7 @@ from app.models import (
     otp,
     failed_login_attempts,
     tokens,
+    sync_state,
 )
 from dotenv import load_dotenv
 
@@ -0,0 +1,92 @@
+"""store message and last communication times as timestamptz
+
+Revision ID: 2a6c9e4f7d31
+Revises: 5d7f3b9a2e18
+Create Date: 2026-10-17 16:42:18.517304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2a6c9e4f7d31'
+down_revision = '5d7f3b9a2e18'
+branch_labels = None
+depends_on = None
+
+# The columns held WhatsApp epoch seconds as strings, a few rows hold ISO dates
+TO_TIMESTAMPTZ = """
+    CASE
+        WHEN nullif(trim({column}), '') IS NULL THEN NULL
+        WHEN {column} ~ '^[0-9]+(\\.[0-9]+)?$' THEN to_timestamp({column}::double precision)
+        ELSE {column}::timestamptz
+    END
+"""
+TO_EPOCH_STRING = "floor(extract(epoch FROM {column}))::bigint::varchar"
+
+
+def _has_messages() -> bool:
+    # The messages table is created by the chatbot service, it may not exist yet
+    return sa.inspect(op.get_bind()).has_table('messages')
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'users',
+        'last_communicated',
+        type_=sa.DateTime(timezone=True),
+        postgresql_using=TO_TIMESTAMPTZ.format(column='last_communicated'),
+    )
+    op.create_index(
+        'ix_users_last_communicated',
+        'users',
+        [sa.text('last_communicated DESC NULLS LAST')],
+        unique=False,
+    )
+    if not _has_messages():
+        return
+
+    op.alter_column(
+        'messages',
+        'timestamp',
+        type_=sa.DateTime(timezone=True),
+        postgresql_using=TO_TIMESTAMPTZ.format(column='"timestamp"'),
+    )
+    op.create_index(
+        'ix_messages_phone_number_timestamp',
+        'messages',
+        ['phone_number', sa.text('"timestamp" DESC')],
+        unique=False,
+    )
+    # From here on the Kafka consumer keeps last_communicated current
+    op.execute(
+        """
+        UPDATE users SET last_communicated = latest.latest_at
+        FROM (
+            SELECT phone_number, max("timestamp") AS latest_at
+            FROM messages
+            GROUP BY phone_number
+        ) AS latest
+        WHERE users.phone_number = latest.phone_number
+          AND (users.last_communicated IS NULL OR users.last_communicated < latest.latest_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    if _has_messages():
+        op.drop_index('ix_messages_phone_number_timestamp', table_name='messages')
+        op.alter_column(
+            'messages',
+            'timestamp',
+            type_=sa.String(),
+            postgresql_using=TO_EPOCH_STRING.format(column='"timestamp"'),
+        )
+    op.drop_index('ix_users_last_communicated', table_name='users')
+    op.alter_column(
+        'users',
+        'last_communicated',
+        type_=sa.String(),
+        postgresql_using=TO_EPOCH_STRING.format(column='last_communicated'),
+    )
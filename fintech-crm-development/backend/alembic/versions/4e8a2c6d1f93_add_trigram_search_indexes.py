@@ -0,0 +1,57 @@
+"""add pg_trgm search indexes
+
+Revision ID: 4e8a2c6d1f93
+Revises: 9c4e1a7f5b20
+Create Date: 2026-10-17 12:21:40.913877
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e8a2c6d1f93'
+down_revision = '9c4e1a7f5b20'
+branch_labels = None
+depends_on = None
+
+
+TRIGRAM_COLUMNS = {
+    'users': ['full_name', 'email', 'phone_number', 'pan_number'],
+    'leads': ['full_name', 'email', 'phone_number'],
+    'credit_reports': ['first_name', 'last_name', 'pan_number', 'phone_number'],
+}
+
+# Must match app.repository.lead_query_builder.search_document
+USERS_SEARCH_DOCUMENT = (
+    "coalesce(full_name, '') || ' ' || coalesce(email, '') || ' ' || "
+    "coalesce(phone_number, '') || ' ' || coalesce(pan_number, '') || ' ' || "
+    "coalesce(loan_purpose, '') || ' ' || coalesce(employment_type, '') || ' ' || "
+    "coalesce(source, '') || ' ' || coalesce(raw_data ->> 'loan_type', '') || ' ' || "
+    "coalesce(raw_data ->> 'email', '') || ' ' || coalesce(raw_data ->> 'phone_number', '')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f'ix_{table}_{column}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+    op.execute(
+        'CREATE INDEX ix_users_search_document_trgm ON users '
+        f'USING gin (({USERS_SEARCH_DOCUMENT}) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_search_document_trgm', table_name='users')
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
@@ -0,0 +1,43 @@
+"""add unique (source, source_id) index to leads
+
+Revision ID: 5d7f3b9a2e18
+Revises: b81f3d0c6e47
+Create Date: 2026-10-17 14:02:11.605318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d7f3b9a2e18'
+down_revision = 'b81f3d0c6e47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the most recently updated row of leads synced more than once
+    op.execute(
+        """
+        DELETE FROM leads
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY source, source_id
+                    ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST, id
+                ) AS position
+                FROM leads
+                WHERE source_id IS NOT NULL
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_index(
+        'uq_leads_source_source_id', 'leads', ['source', 'source_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_leads_source_source_id', table_name='leads')
@@ -0,0 +1,32 @@
+"""add sync_state table for lead ingestion watermarks
+
+Revision ID: 7b2d9e41c6a8
+Revises: fd90823b76de
+Create Date: 2026-10-17 10:12:44.218305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2d9e41c6a8'
+down_revision = 'fd90823b76de'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_state',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('last_synced_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('cursor', sa.String(), nullable=True),
+    sa.Column('updated_on', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('source')
+    )
+    op.create_index(op.f('ix_sync_state_source'), 'sync_state', ['source'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sync_state_source'), table_name='sync_state')
+    op.drop_table('sync_state')
@@ -0,0 +1,30 @@
+"""add keyset pagination indexes
+
+Revision ID: 9c4e1a7f5b20
+Revises: 7b2d9e41c6a8
+Create Date: 2026-10-17 11:02:17.540921
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e1a7f5b20'
+down_revision = '7b2d9e41c6a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_updated_on_id', 'users', ['updated_on', 'id'], unique=False)
+    op.create_index(
+        'ix_credit_reports_updated_at_id', 'credit_reports', ['updated_at', 'id'], unique=False
+    )
+    op.create_index('ix_call_log_created_at_id', 'call_log', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_call_log_created_at_id', table_name='call_log')
+    op.drop_index('ix_credit_reports_updated_at_id', table_name='credit_reports')
+    op.drop_index('ix_users_updated_on_id', table_name='users')
@@ -0,0 +1,47 @@
+"""add maintained documents_count to users
+
+Revision ID: b81f3d0c6e47
+Revises: 4e8a2c6d1f93
+Create Date: 2026-10-17 13:05:52.384190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81f3d0c6e47'
+down_revision = '4e8a2c6d1f93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('documents_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.create_index(
+        'ix_documents_user_id_active',
+        'documents',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.execute(
+        """
+        UPDATE users SET documents_count = active.documents_count
+        FROM (
+            SELECT user_id, count(*) AS documents_count
+            FROM documents
+            WHERE is_active
+            GROUP BY user_id
+        ) AS active
+        WHERE users.id = active.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_user_id_active', table_name='documents')
+    op.drop_column('users', 'documents_count')
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from app.core.config import settings
 from app.api.api_v1.endpoints import (
     auditor,
     ca,
@@ -11,6 +12,7 @@ from app.api.api_v1.endpoints import (
     notes,
     credit_report,
     notifications,
+    local_blob_storage,
 )
 
 api_router = APIRouter()
@@ -23,4 +25,10 @@ api_router.include_router(leads.router, prefix="/leads", tags=["Leads"])
 api_router.include_router(notes.router, tags=["note"])
 api_router.include_router(telecaller.router, tags=["telecaller"])
 api_router.include_router(credit_report.router, prefix="/credit-report", tags=["Credit Report"])
-api_router.include_router(notifications.router, tags=["notifications"])
\ No newline at end of file
+api_router.include_router(notifications.router, tags=["notifications"])
+
+if settings.BLOB_STORAGE_BACKEND == "local":
+    # Stands in for Azure behind the pre-signed URLs of upload sessions
+    api_router.include_router(
+        local_blob_storage.router, prefix="/blob-storage", tags=["Local blob storage"]
+    )
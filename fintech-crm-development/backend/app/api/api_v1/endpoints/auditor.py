@@ -1,12 +1,9 @@
-import io
-import os
-import zipfile
 from typing import Any, List, Optional
 from jose import jwt
 import random
 import uuid
 import string
-from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.encoders import jsonable_encoder
 from pydantic import EmailStr
 from starlette.responses import StreamingResponse
@@ -57,8 +54,10 @@ from app.schemas.user import (
     TaxSlab,
     UserUpdateDeatils,
 )
-from app.utils.azur_blob import blob_service_client, container_client
+from app.utils.blob_response import blob_response
+from app.utils.blob_storage import blob_storage
 from app.utils.cryptoUtil import get_password_hash, verify_password
+from app.utils.zip_stream import PRECOMPRESSED_TYPES, stream_zip
 from app.repository.auditor_repository import auditor_repository
 
 router = APIRouter()
@@ -510,19 +509,13 @@ async def get_user_documents(
 ):
     """
     Get list of documents of User, logged in as Auditor"""
-    documents = await document_repository.get_user_documents(user_id)
-    documents_list = []
-    for document in documents:
-        document_type_id = document["document_type_id"]
-        document_type_result = await document_repository.get_documents_type(document_type_id)
-        documents_list.append(
-            DocumentList(**document, document_file_name=document_type_result.document_name)
-        )
-    return documents_list
+    documents = await document_repository.get_user_documents_with_types(user_id)
+    return [DocumentList(**document) for document in documents]
 
 
 @router.get("/download/user_document/{document_id}")
 async def download_user_documents(
+    request: Request,
     document_id: int,
     current_user: auditor = Depends(deps.get_current_active_auditor),
 ):
@@ -540,17 +533,15 @@ async def download_user_documents(
             )
 
         try:
-            # Download the document using azure_image_storage
-            file_contents = await azure_image_storage.download_document(row.document_path)
+            # Locate the document uploaded through azure_image_storage
+            container_name, blob_path = azure_image_storage.document_location(row.document_path)
 
             # Extract filename from the path for the Content-Disposition header
             filename = row.document_path.split("/")[-1]
 
-            # Return as streaming response
-            return StreamingResponse(
-                iter([file_contents]),
-                media_type="application/octet-stream",
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
+            # Stream the blob to the client
+            return await blob_response(
+                request, blob_path, container=container_name, filename=filename
             )
 
         except Exception as storage_error:
@@ -743,8 +734,7 @@ async def update_user_document(
 
         # Update file content if provided
         if file:
-            blob_client = container_client.get_blob_client(document.document_path)
-            blob_client.upload_blob(await file.read(), overwrite=True)
+            await blob_storage.upload(document.document_path, file.file, file.content_type)
 
             # Update document metadata
             doc_type = document_type.value if document_type else document.document_type
@@ -771,12 +761,25 @@ async def download_all_user_documents(
     try:
         # Get all blobs in the user's folder
         user_folder = f"{user_id}/"
-        blobs = container_client.list_blobs(name_starts_with=user_folder)
+        blob_names = await blob_storage.list(user_folder)
+
+        # The file extension is not present in the blob name, it comes from the
+        # document type. Blobs without an active document are left out.
+        document_types = await document_repository.file_extensions(blob_names)
+        entries = [
+            (
+                _zip_entry_name(blob_name, document_types[blob_name]),
+                blob_name,
+                document_types[blob_name] not in PRECOMPRESSED_TYPES,
+            )
+            for blob_name in blob_names
+            if blob_name in document_types
+        ]
 
-        # Stream each file to the client
+        # Stream the archive to the client as it is written
         return StreamingResponse(
-            iter_files(blobs, container_client, user_id),
-            media_type="application/octet-stream",
+            stream_zip(entries),
+            media_type="application/zip",
             headers={"Content-Disposition": f"attachment; filename={user_id}_files.zip"},
         )
 
@@ -784,27 +787,15 @@ async def download_all_user_documents(
         raise HTTPException(status_code=404, detail="Sever isuue while downloading files.")
 
 
-async def iter_files(blobs, container_client, user_id):
-    zip_data = io.BytesIO()
-    with zipfile.ZipFile(zip_data, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for blob in blobs:
-            blob_client = container_client.get_blob_client(blob)
-            file_data = blob_client.download_blob().readall()
-            file_name = os.path.basename(blob.name)
-            file_name = user_id + "/" + file_name
-            # Fetching fie extension
-            # Doing this because the file extension is not present in the blob name
-            # and we need to store the file with the same extension
-            file_extension = await document_repository.file_extension(file_name)
-            split_parts = file_extension.split("/")
-            zip_file.writestr(f"{file_name}.{split_parts[-1]}", file_data)
-
-    zip_data.seek(0)
-    while True:
-        data = zip_data.read(4096)
-        if not data:
-            break
-        yield data
+# File extension by document type, e.g. "pdf" for "application/pdf"
+DOCUMENT_EXTENSIONS = {document_type.value: document_type.name for document_type in DocumentType}
+
+
+def _zip_entry_name(blob_name: str, document_type: str) -> str:
+    extension = DOCUMENT_EXTENSIONS.get(document_type, document_type.split("/")[-1])
+    if blob_name.lower().endswith(f".{extension}"):
+        return blob_name
+    return f"{blob_name}.{extension}"
 
 
 @router.put("/update/user")
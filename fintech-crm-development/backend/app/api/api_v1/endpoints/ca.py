@@ -1,9 +1,8 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.encoders import jsonable_encoder
 from pydantic import EmailStr
-from starlette.responses import StreamingResponse
 
 from app.api.api_v1 import deps
 from app.core.config import settings
@@ -25,7 +24,7 @@ from app.schemas.auditor import (
 from app.schemas.CA import CABase, CACreate, CAId, CAInDBBase, CAUpdate, ProfilePictureCreate
 from app.schemas.common import Successful
 from app.schemas.user import ResetPassword
-from app.utils.azur_blob import blob_service_client
+from app.utils.blob_response import blob_response
 from app.utils.cryptoUtil import get_password_hash, verify_password
 
 router = APIRouter()
@@ -406,15 +405,10 @@ async def delete_profile_picture(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Server issue while deleting profile picture: {str(e)}")
 @router.get("/download/profilePicture")
-async def download_file(filepath: str):
+async def download_file(request: Request, filepath: str):
     try:
-        container_client = blob_service_client.get_container_client(
-            settings.PROFILEPICTURECONTAINER_NAME
-        )
-        blob_client = container_client.get_blob_client(filepath)
-        file_contents = blob_client.download_blob()
-        return StreamingResponse(
-            iter([file_contents.readall()]), media_type="application/octet-stream"
+        return await blob_response(
+            request, filepath, container=settings.PROFILEPICTURECONTAINER_NAME
         )
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Path, Query, status
+from fastapi import APIRouter, HTTPException, Path, Query, Request, status
 from typing import Any, List, Optional
 from starlette.responses import StreamingResponse
 
@@ -9,6 +9,7 @@ from app.schemas.credit_report import (
     CreditReportResponse,
     APIErrorResponse,
     CreditReportListResponse,
+    CibilPdfJobStatus,
 )
 from app.services.credit_report_service import credit_report_service
 from app.services.cibil_pdf_service import cibil_pdf_service
@@ -117,6 +118,8 @@ async def search_credit_reports(
     limit: int = Query(100, description="Limit the number of results"),
     skip: int = Query(0, description="Skip the first N results"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
+    cursor_mode: bool = Query(False, description="Use cursor pagination instead of skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor returned with the previous page"),
 ) -> Any:
     """
     Public endpoint to search credit reports.
@@ -126,9 +129,13 @@ async def search_credit_reports(
     - **limit**: Limit the number of results (default: 100)
     - **skip**: Skip the first N results (default: 0)
     - **user_id**: Optional user ID to filter reports
+    - **cursor_mode**: Page by cursor, follow `next_cursor` until it is null
+    - **cursor**: Cursor of the page to fetch, the total is only returned on the first page
     """
     try:
-        if search:
+        if cursor_mode or cursor:
+            response = await credit_report_service.get_reports_page(limit, cursor, user_id, search)
+        elif search:
             response = await credit_report_service.search_reports(search, limit, skip, user_id)
         else:
             response = await credit_report_service.get_all_reports(limit, skip, user_id)
@@ -341,20 +348,42 @@ async def delete_raw_cibil_data(
         )
 
 
+@router.get(
+    "/pdf-jobs/{job_id}",
+    response_model=CibilPdfJobStatus,
+    responses={404: {"model": APIErrorResponse}},
+    summary="Get the status of a CIBIL report PDF rendering job",
+)
+async def get_cibil_pdf_job(job_id: str = Path(..., description="Job ID")) -> Any:
+    """
+    Status of the PDF rendering started by a credit report fetch.
+
+    - **job_id**: `pdf_job.job_id` of the credit report response
+    """
+    job = credit_report_service.get_pdf_job(job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PDF job not found")
+    return job
+
+
 @router.get(
     "/view-pdf/{document_id}",
     response_class=StreamingResponse,
     responses={404: {"model": APIErrorResponse}, 500: {"model": APIErrorResponse}},
     summary="View CIBIL report PDF",
 )
-async def view_cibil_pdf(document_id: int = Path(..., description="Document ID")) -> Any:
+async def view_cibil_pdf(
+    request: Request, document_id: int = Path(..., description="Document ID")
+) -> Any:
     """
     View a CIBIL report PDF.
 
     - **document_id**: ID of the document to view
+
+    Range requests are supported, so PDF viewers can load pages on demand.
     """
     try:
-        return await cibil_pdf_service.get_cibil_pdf(document_id)
+        return await cibil_pdf_service.get_cibil_pdf(document_id, request)
     except HTTPException:
         raise
     except Exception as e:
@@ -371,14 +400,16 @@ async def view_cibil_pdf(document_id: int = Path(..., description="Document ID")
     responses={404: {"model": APIErrorResponse}, 500: {"model": APIErrorResponse}},
     summary="Download CIBIL report PDF",
 )
-async def download_cibil_pdf(document_id: int = Path(..., description="Document ID")) -> Any:
+async def download_cibil_pdf(
+    request: Request, document_id: int = Path(..., description="Document ID")
+) -> Any:
     """
     Download a CIBIL report PDF.
 
     - **document_id**: ID of the document to download
     """
     try:
-        return await cibil_pdf_service.download_cibil_pdf(document_id)
+        return await cibil_pdf_service.download_cibil_pdf(document_id, request)
     except HTTPException:
         raise
     except Exception as e:
@@ -7,14 +7,13 @@ from app.api.api_v1 import deps
 from app.repository.lead_repository import lead_repository
 from app.schemas.leads import LeadCreate, LeadUpdate, LeadInDB, LeadFilter, LeadCombinedDataResponse, LeadSource, EmploymentType, LeadStatus, NameOrder
 from app.models.user import users as UserModel  # Rename the import
-from app.service.leads_sync_service import LeadSyncService
+from app.service.leads_sync_service import lead_sync_service
 from datetime import datetime
 from app.service.external_service import external_repository
 
 
 
 router = APIRouter()
-lead_sync_service = LeadSyncService()
 
 @router.post("/", response_model=dict[str, str])
 async def create_lead(
@@ -79,16 +78,20 @@ async def get_beehiiv_publications(
             detail=f"Error fetching publications: {str(e)}"
         )
 
-@router.post("/sync", response_model=dict[str, str])
+@router.post("/sync", response_model=Dict[str, Any])
 async def sync_leads(
     strapi_filters: Optional[Dict[str, Any]] = None,
     beehiiv_publication_id: Optional[str] = None,
     form_id: Optional[str] = None,
     subscription_tier: Optional[str] = None,
+    full: bool = Query(default=False, description="Ignore the stored checkpoints"),
     #current_user: Dict[str, Any] = Depends(deps.get_current_active_admin_ca_auditor),
 ):
     """
     Manually trigger lead synchronization from all sources.
+
+    Only records created after the checkpoint of the previous sync with the same
+    filters are fetched unless `full` is set.
     
     Example strapi_filters:
     {
@@ -100,26 +103,28 @@ async def sync_leads(
     try:
         if form_id:
             # Sync specific form submissions from Strapi
-            await lead_sync_service.sync_strapi_leads(form_id=form_id)
+            counts = await lead_sync_service.sync_strapi_leads(form_id=form_id, full=full)
         else:
             # Sync all sources with filters
-            await lead_sync_service.sync_all(
+            counts = await lead_sync_service.sync_all(
                 strapi_filters=strapi_filters,
-                beehiiv_publication_id=beehiiv_publication_id
+                beehiiv_publication_id=beehiiv_publication_id,
+                full=full,
             )
-        return {"message": "Lead synchronization completed successfully"}
+        return {"message": "Lead synchronization completed successfully", "counts": counts}
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error syncing leads: {str(e)}"
         )
 
-@router.post("/sync/{source}", response_model=dict[str, str])
+@router.post("/sync/{source}", response_model=Dict[str, Any])
 async def sync_specific_source(
     source: str,
     form_id: Optional[str] = None,
     publication_id: Optional[str] = None,
     subscription_tier: Optional[str] = None,
+    full: bool = Query(default=False, description="Ignore the stored checkpoint"),
     current_user: Dict[str, Any] = Depends(deps.get_current_active_admin_ca_auditor),
 ):
     """
@@ -127,20 +132,24 @@ async def sync_specific_source(
     """
     try:
         if source.lower() == "strapi":
-            await lead_sync_service.sync_strapi_leads(form_id=form_id)
+            counts = await lead_sync_service.sync_strapi_leads(form_id=form_id, full=full)
         elif source.lower() == "beehiiv":
-            await lead_sync_service.sync_beehiiv_subscribers(
+            counts = await lead_sync_service.sync_beehiiv_subscribers(
                 publication_id=publication_id,
-                subscription_tier=subscription_tier
+                subscription_tier=subscription_tier,
+                full=full,
             )
         elif source.lower() == "whatsapp":
-            await lead_sync_service.sync_whatsapp_contacts()
+            counts = await lead_sync_service.sync_whatsapp_contacts()
         else:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid source. Must be 'strapi', 'beehiiv', or 'whatsapp'"
             )
-        return {"message": f"Lead synchronization from {source} completed successfully"}
+        return {
+            "message": f"Lead synchronization from {source} completed successfully",
+            "counts": counts,
+        }
     except HTTPException:
         raise
     except Exception as e:
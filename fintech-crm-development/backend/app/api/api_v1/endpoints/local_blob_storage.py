@@ -0,0 +1,45 @@
+from tempfile import SpooledTemporaryFile
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app.core.config import settings
+from app.utils.blob_storage import blob_storage
+
+router = APIRouter()
+
+
+@router.put("/{container}/{path:path}", status_code=201)
+async def put_blob(
+    container: str,
+    path: str,
+    request: Request,
+    se: int = Query(..., description="Expiry of the upload URL"),
+    sig: str = Query(..., description="Signature of the upload URL"),
+):
+    """
+    Local stand-in for a PUT to a pre-signed Azure upload URL.
+
+    Only mounted with BLOB_STORAGE_BACKEND=local, so upload sessions work in
+    tests and local runs. Like Azure, it takes the content type from the
+    `x-ms-blob-content-type` header and refuses to overwrite a blob.
+    """
+    if not blob_storage.backend.verify_upload_url(container, path, se, sig):
+        raise HTTPException(status_code=403, detail="Invalid or expired upload URL")
+    if request.headers.get("x-ms-blob-type") != "BlockBlob":
+        raise HTTPException(status_code=400, detail="Only block blobs can be uploaded")
+
+    with SpooledTemporaryFile(max_size=settings.BLOB_CHUNK_SIZE) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+        try:
+            await blob_storage.upload(
+                path,
+                body,
+                request.headers.get("x-ms-blob-content-type"),
+                overwrite=False,
+                container=container,
+            )
+        except FileExistsError:
+            raise HTTPException(status_code=409, detail="The blob already exists")
+    return Response(status_code=201)
@@ -2,7 +2,7 @@ from typing import Any, List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Body, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Body, Path, Query, Response, status
 
 from app.api.api_v1.deps import get_current_active_auditor
 from app.repository.telecaller_repository import TelecallerRepository
@@ -105,17 +105,36 @@ async def click_to_call(
 
 @router.get("/call-logs", response_model=List[CallLog])
 async def read_call_logs(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     lead_id: Optional[str] = None,  # Changed from UUID to str
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor_mode: bool = False,
+    cursor: Optional[str] = None,
     current_user: Any = Depends(get_current_active_auditor),
     repository: TelecallerRepository = Depends(get_telecaller_repository),
 ):
     """
     Retrieve call logs for the current telecaller
+
+    With `cursor_mode=true` the logs are paged by keyset and the cursor of the
+    next page is returned in the `X-Next-Cursor` header (absent on the last page).
     """
+    if cursor_mode or cursor:
+        call_logs, next_cursor = await repository.get_call_logs_keyset(
+            cursor=cursor,
+            limit=limit,
+            user_id=current_user.id,
+            lead_id=lead_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return call_logs
+
     return await repository.get_call_logs(
         skip=skip,
         limit=limit,
@@ -1,7 +1,7 @@
 import os
 import re
 from datetime import datetime
-from typing import Any, List, Union, Optional
+from typing import Any, Dict, List, Union, Optional
 from app.schemas.user import (
     UserId,
     TaxSlab,
@@ -9,14 +9,15 @@ from app.schemas.user import (
     TaxPayerType,
     NameOrder,
     CombinedDataResponse,
+    UserList,
 )
 from app.api.api_v1.deps import get_current_active_user
 from app.schemas.user import (
     UserFull,
     UserCreateManual,
     UserUpdateRequest,
-    UserBulkUpload,
     BulkUploadResponse,
+    BulkImportJobStatus,
 )
 
 from app.repository import credit_report_repository
@@ -24,14 +25,28 @@ from app.services import credit_report_service
 from fastapi import status, HTTPException
 from app.repository.ca_repository import ca_repository
 from app.repository.auditor_repository import auditor_repository
-from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Query, UploadFile
-from starlette.responses import StreamingResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
+from starlette.responses import Response
+from app.core.cache import lead_list_cache
 from app.service.external_service import external_repository
 from app.api.api_v1 import deps
 from app.models.user import documents, documents_type, users
 from app.repository.base_repository import base_repository
 from app.repository.documents_repository import document_repository
 from app.repository.user_repository import user_repository
+from app.db.session import database
+from app.utils.pagination import estimate_count
 from app.schemas.document import (
     DocumentBase,
     DocumentCreate,
@@ -41,9 +56,15 @@ from app.schemas.document import (
     DocumentStatus,
     DocumentType,
     DocumentUpdate,
+    PhoneLookupDocument,
+    UploadSession,
+    UploadSessionComplete,
+    UploadSessionCreate,
 )
 from pydantic import EmailStr
 from app.services.lead_service import lead_service
+from app.services.bulk_import_service import bulk_import_service
+from app.services.upload_session_service import upload_session_service
 
 from app.schemas.user import (
     Category,
@@ -57,7 +78,8 @@ from app.schemas.user import (
     UserId,
     UserInDBBase,
 )
-from app.utils.azur_blob import container_client
+from app.utils.blob_response import blob_response
+from app.utils.blob_storage import blob_storage
 from fastapi import UploadFile, File, Depends, HTTPException, status, Path
 from pydantic import ValidationError
 import csv
@@ -75,7 +97,7 @@ logger.setLevel(logging.DEBUG)
 router = APIRouter()
 
 
-@router.get("/get-users", response_model=dict[str, Union[int, List[UserId]]])
+@router.get("/get-users", response_model=UserList)
 async def get_lists_users(
     query: str = None,
     tax_slab: TaxSlab = None,
@@ -84,11 +106,18 @@ async def get_lists_users(
     name_order: NameOrder = None,
     skip: int = 0,
     limit: int = 100,
+    cursor_mode: bool = False,
+    cursor: Optional[str] = None,
+    approximate_total: bool = False,
     current_user: users = Depends(deps.get_current_active_admin_ca_auditor),
 ) -> Any:
     """
     Retrieve users.
     only admin, CA and auditor can access this endpoint
+
+    Pass `cursor_mode=true` for keyset pagination and follow `next_cursor` for the
+    next pages. In cursor mode the total is only returned with the first page, and
+    `approximate_total=true` returns a planner estimate for unfiltered listings.
     """
     search_query = {}
 
@@ -104,19 +133,36 @@ async def get_lists_users(
     if type:
         search_query["tax_payer_type"] = type
     documents_type_count = await document_repository.get_documents_type_count()
-    list_users = await user_repository.get_list_users(
-        name_order, search_query, skip=skip, limit=limit
+
+    next_cursor = None
+    if cursor_mode or cursor:
+        list_users, next_cursor = await user_repository.get_list_users_keyset(
+            name_order, search_query, cursor=cursor, limit=limit
+        )
+    else:
+        list_users = await user_repository.get_list_users(
+            name_order, search_query, skip=skip, limit=limit
+        )
+
+    if approximate_total and not search_query and not name_order:
+        count = await estimate_count(database, users)
+    elif cursor:
+        count = None
+    else:
+        count = await user_repository.users_count(search_query, name_order)
+
+    documents_counts = await document_repository.get_users_documents_count(
+        [user["id"] for user in list_users]
     )
-    count = await user_repository.users_count(search_query, name_order)
-    temp_users = []
-    for user in list_users:
-        user_id = user["id"]
-        documnets_counts = await document_repository.get_user_documents_count(user_id)
-        temp_users.append(UserId(**user, documents_count=documnets_counts))
+    temp_users = [
+        UserId(**{**user, "documents_count": documents_counts.get(user["id"], 0)})
+        for user in list_users
+    ]
     return {
         "total_users": count,
         "total_documents_type": documents_type_count,
         "users": temp_users,
+        "next_cursor": next_cursor,
     }
 
 
@@ -148,14 +194,14 @@ async def get_user_detail_using_phone(
             status_code=404,
             detail="The user with this username does not exist in the database",
         )
-    documents = await document_repository.get_user_documents(user.id)
-    documents_list = []
-    for document in documents:
-        document_type_id = document["document_type_id"]
-        document_type_result = await document_repository.get_documents_type(document_type_id)
-        documents_list.append(
-            DocumentList(**document, document_name=document_type_result.document_name)
+    documents = await document_repository.get_user_documents_with_types(user.id)
+    documents_list = [
+        PhoneLookupDocument(
+            **{**document, "document_name": document["document_file_name"]},
+            file_name=document["document_name"],
         )
+        for document in documents
+    ]
     return UserInDBBase(
         **user,
         documents=documents_list,
@@ -189,25 +235,77 @@ async def get_combined_lead_data(
         None,
         description="Sources (Facebook, Website, Instagram, chatbot, beehiiv, strapi_loan, strapi_cibil)",
     ),
+    cursor_mode: bool = Query(False, description="Use cursor pagination instead of page numbers"),
+    cursor: Optional[str] = Query(None, description="next_cursor returned with the previous page"),
     current_user: Any = Depends(deps.get_current_active_admin_ca_auditor),
 ):
     """
     Get combined lead data with advanced filtering and pagination.
+
+    Responses are cached per filter combination until the next write to the users
+    store, the X-Cache header tells whether a response was a cache HIT or MISS.
     """
-    combined_data = await lead_service.get_combined_leads(
-        page=page,
-        page_size=page_size,
-        search=search,
-        date_range=date_range,
-        date_from=date_from,
-        date_to=date_to,
-        loan_amount=loan_amount,
-        employment_type=employment_type,
-        cibil_score=cibil_score,
-        sources=sources,
+    key = lead_list_cache.make_key(
+        page,
+        page_size,
+        search,
+        date_range,
+        date_from,
+        date_to,
+        loan_amount,
+        employment_type,
+        cibil_score,
+        sorted(set(sources)) if sources else None,
+        cursor,
+        cursor_mode,
     )
 
-    return combined_data
+    async def build() -> bytes:
+        combined_data = await lead_service.get_combined_leads(
+            page=page,
+            page_size=page_size,
+            search=search,
+            date_range=date_range,
+            date_from=date_from,
+            date_to=date_to,
+            loan_amount=loan_amount,
+            employment_type=employment_type,
+            cibil_score=cibil_score,
+            sources=sources,
+            cursor=cursor,
+            cursor_mode=cursor_mode,
+        )
+        return combined_data.json().encode()
+
+    body, hit = await lead_list_cache.get_or_set(key, build)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": "HIT" if hit else "MISS"},
+    )
+
+
+@router.get("/combined/cache-stats", response_model=Dict[str, Any])
+async def get_combined_cache_stats(
+    current_user: Any = Depends(deps.get_current_active_admin_ca_auditor),
+):
+    """
+    Hit and miss counters of the combined lead list cache in this worker.
+    """
+    return lead_list_cache.stats()
+
+
+@router.get("/search", response_model=List[UnifiedLeadBase])
+async def search_leads(
+    q: str = Query(..., min_length=2, description="Name, email, phone, PAN or loan type"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    current_user: Any = Depends(deps.get_current_active_admin_ca_auditor),
+):
+    """
+    Search leads, best matches first.
+    Close spellings of a name also match, so the results can be used for search-as-you-type.
+    """
+    return await lead_service.search_leads(q, limit)
 
 
 @router.post("/manual-create", response_model=UserFull)
@@ -259,26 +357,15 @@ async def update_user(
         )
 
 
-field_mapping = {
-    "Full Name": "full_name",
-    "Contact Number": "phone_number",
-    "Email ID": "email",
-    "Location": "location",
-    "PAN Number": "pan_number",
-    "CIBIL": "cibil_score",
-    "Lead Source": "source",
-    "Employment Type": "employment_type",
-    "Annual Income": "annual_income",
-    "Loan Type": "loan_purpose",
-    "Loan Amount Required": "loan_amount_required",
-}
-
-
 @router.post("/bulk-upload", response_model=BulkUploadResponse)
 async def bulk_upload_users(
     file: UploadFile = File(...),
     current_user: users = Depends(deps.get_current_active_admin_ca_auditor),
 ):
+    """
+    Create or update users from a .csv or .xlsx sheet.
+    Existing phone numbers are merged, the outcome of every row is returned.
+    """
     try:
         contents = await file.read()
 
@@ -292,70 +379,7 @@ async def bulk_upload_users(
                 detail="Unsupported file format. Only .csv and .xlsx are allowed.",
             )
 
-        rows = df.to_dict("records")
-        created_users = []
-
-        # Normalize field_mapping keys to lowercase
-        normalized_field_mapping = {k.lower(): v for k, v in field_mapping.items()}
-
-        for idx, row in enumerate(rows, start=1):
-            try:
-                # Normalize row keys to lowercase
-                normalized_row = {k.lower(): v for k, v in row.items()}
-
-                # Map headers to model fields, ensuring values are strings and stripped
-                mapped_row = {}
-                for k, v in normalized_row.items():
-                    if k in normalized_field_mapping:
-                        cleaned_value = str(v).strip() if v is not None else ""
-                        mapped_row[normalized_field_mapping[k]] = cleaned_value
-                logger.debug(f"Processed Row {idx}: Mapped Row: {mapped_row}")
-
-                # Check if at least one of email or phone_number is present
-                if not mapped_row.get("email") and not mapped_row.get("phone_number"):
-                    logger.error(
-                        f"Processed Row {idx}: Validation Error: Either email or phone_number must be present"
-                    )
-                    continue  # Skip this row
-
-                # Validate row using Pydantic schema
-                user_bulk = UserBulkUpload.parse_obj(mapped_row)
-                logger.debug(f"Processed Row {idx}: Validated User Bulk: {user_bulk}")
-
-                # Convert annual income to monthly
-                monthly_income = user_bulk.annual_income / 12 if user_bulk.annual_income else None
-                user_manual = UserCreateManual(
-                    full_name=user_bulk.full_name,
-                    phone_number=user_bulk.phone_number,
-                    email=user_bulk.email,
-                    pan_number=user_bulk.pan_number,
-                    cibil_score=user_bulk.cibil_score,
-                    source=user_bulk.source,
-                    employment_type=user_bulk.employment_type,
-                    loan_purpose=user_bulk.loan_purpose,
-                    loan_amount=user_bulk.loan_amount_required,
-                    location=user_bulk.location,
-                    monthly_income=monthly_income,
-                    country_code=user_bulk.phone_number[:2] if user_bulk.phone_number else None,
-                )
-                logger.debug(f"Processed Row {idx}: Created User Manual: {user_manual}")
-
-                # Create user
-                created_user = await user_repository.create_manual(user_manual)
-                created_users.append(user_manual.full_name)
-                logger.debug(
-                    f"Processed Row {idx}: User Created Successfully: {user_manual.full_name}"
-                )
-
-            except ValidationError as e:
-                logger.error(f"Processed Row {idx}: Validation Error: {e}")
-            except HTTPException as http_exc:
-                logger.error(f"Processed Row {idx}: HTTP Exception: {http_exc.detail}")
-            except Exception as e:
-                logger.error(f"Processed Row {idx}: Error Processing Row: {e}")
-
-        logger.info(f"Total Users Created: {len(created_users)}")
-        return BulkUploadResponse(detail=f"{len(created_users)} users created successfully")
+        return await bulk_import_service.import_users(df)
 
     except HTTPException as he:
         raise he
@@ -367,6 +391,46 @@ async def bulk_upload_users(
         )
 
 
+@router.post(
+    "/bulk-upload/jobs",
+    response_model=BulkImportJobStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_bulk_upload_job(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    current_user: users = Depends(deps.get_current_active_admin_ca_auditor),
+):
+    """
+    Import a large .csv or .xlsx sheet in the background.
+    The upload is spooled to disk and committed in batches, poll the returned job for progress.
+    """
+    if not file.filename.endswith((".csv", ".xlsx")):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported file format. Only .csv and .xlsx are allowed.",
+        )
+
+    path = await bulk_import_service.spool_upload(file)
+    job = bulk_import_service.create_job(file.filename)
+    background_tasks.add_task(bulk_import_service.run_import_job, job.job_id, path)
+    return job
+
+
+@router.get("/bulk-upload/jobs/{job_id}", response_model=BulkImportJobStatus)
+async def get_bulk_upload_job(
+    job_id: str,
+    current_user: users = Depends(deps.get_current_active_admin_ca_auditor),
+):
+    """
+    Progress and result of a bulk upload job.
+    """
+    job = bulk_import_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Bulk upload job not found")
+    return job
+
+
 @router.get("/get-using-id", response_model=UserInDBBase)
 async def get_user_detail_using_id(
     user_id: Optional[str] = None,
@@ -389,14 +453,8 @@ async def get_user_detail_using_id(
             status_code=404,
             detail="The user with this ID does not exist in the database",
         )
-    documents = await document_repository.get_user_documents(user.id)
-    documents_list = []
-    for document in documents:
-        document_type_id = document["document_type_id"]
-        document_type_result = await document_repository.get_documents_type(document_type_id)
-        documents_list.append(
-            DocumentList(**document, document_names=document_type_result.document_name)
-        )
+    documents = await document_repository.get_user_documents_with_types(user.id)
+    documents_list = [DocumentList(**document) for document in documents]
     return UserInDBBase(
         **user,
         documents=documents_list,
@@ -498,14 +556,40 @@ async def upload_file_as_user(
     path += f"_{id}"
     await document_repository.update_document_path(path, id)
     try:
-        blob_client = container_client.get_blob_client(path)
-        blob_client.upload_blob(await file.read())
+        await blob_storage.upload(path, file.file, file.content_type, overwrite=False)
         return DocumentId(**payload.dict(), id=id)
     except Exception:
         await document_repository.update_document_status(False, id)
         raise HTTPException(status_code=404, detail="Sever isuue while uploading file.")
 
 
+@router.post("/upload-sessions", response_model=UploadSession)
+async def create_upload_session(
+    payload: UploadSessionCreate,
+    current_user: users = Depends(deps.get_current_active_user),
+):
+    """
+    Start a direct upload of a document as User, logged in as user.
+
+    PUT the file to `upload_url` with `upload_headers` before `expires_at`,
+    then complete the upload with `session_token`. The file never passes
+    through the API.
+    """
+    return await upload_session_service.create_session(current_user.id, payload)
+
+
+@router.post("/upload-sessions/complete", response_model=DocumentId)
+async def complete_upload_session(
+    payload: UploadSessionComplete,
+    current_user: users = Depends(deps.get_current_active_user),
+):
+    """
+    Record the document of a direct upload once the file is in storage.
+    The file must have the size and type declared when the session started.
+    """
+    return await upload_session_service.complete_session(current_user.id, payload.session_token)
+
+
 @router.put("/update/document")
 async def update_document_as_user(
     document_id: int = Form(...),
@@ -535,8 +619,7 @@ async def update_document_as_user(
 
         # Update file content if provided
         if file:
-            blob_client = container_client.get_blob_client(document.document_path)
-            blob_client.upload_blob(await file.read(), overwrite=True)
+            await blob_storage.upload(document.document_path, file.file, file.content_type)
 
             # Update document metadata
             document_size = file.size
@@ -555,6 +638,7 @@ async def update_document_as_user(
 
 @router.get("/download/{document_type_id}")
 async def download_file_as_user(
+    request: Request,
     document_type_id: int,
     current_user: users = Depends(deps.get_current_active_user),
 ):
@@ -569,11 +653,7 @@ async def download_file_as_user(
                 detail="The document with this id does not exist in the database",
             )
 
-        blob_client = container_client.get_blob_client(row.document_path)
-        file_contents = blob_client.download_blob()
-        return StreamingResponse(
-            iter([file_contents.readall()]), media_type="application/octet-stream"
-        )
+        return await blob_response(request, row.document_path)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
 
@@ -0,0 +1,165 @@
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import redis.asyncio as redis
+from cachetools import TTLCache
+
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class LocalCacheBackend:
+    """
+    In-process LRU cache whose entries expire after `ttl` seconds.
+
+    Invalidations only reach the current process. The backend has the same
+    interface as `RedisCacheBackend`, so it also stands in for Redis in tests.
+    """
+
+    name = "local"
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generation = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes):
+        self._entries[key] = value
+
+    async def get_generation(self) -> int:
+        return self._generation
+
+    async def bump_generation(self):
+        self._generation += 1
+        # Entries of older generations can never be read again
+        self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    async def close(self):
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Cache shared by every worker through Redis, entries expire after `ttl` seconds.
+
+    The generation is a Redis counter, so an invalidation in one worker is seen
+    by all of them. Entries of old generations are left to expire.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl: int, namespace: str):
+        self._redis = redis.from_url(url)
+        self._ttl = ttl
+        self._namespace = namespace
+        self._generation_key = f"{namespace}:generation"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._redis.get(f"{self._namespace}:{key}")
+
+    async def set(self, key: str, value: bytes):
+        await self._redis.set(f"{self._namespace}:{key}", value, ex=self._ttl)
+
+    async def get_generation(self) -> int:
+        return int(await self._redis.get(self._generation_key) or 0)
+
+    async def bump_generation(self):
+        await self._redis.incr(self._generation_key)
+
+    def size(self) -> Optional[int]:
+        return None
+
+    async def close(self):
+        await self._redis.close()
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses keyed by their normalized request parameters.
+
+    Every key is prefixed with the current generation, and `invalidate` moves to
+    the next one. A response built while an invalidation happens is therefore
+    stored under the old generation and never served. Backend errors are logged
+    and treated as misses, so a Redis outage only costs the cache.
+    """
+
+    def __init__(self, name: str, backend):
+        self.name = name
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return json.dumps(parts, default=str, separators=(",", ":"))
+
+    async def get_or_set(
+        self, key: str, build: Callable[[], Awaitable[bytes]]
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a cached response, building and storing it on a miss.
+
+        Args:
+            key (str): Key of the request, see `make_key`.
+            build (Callable): Coroutine function returning the serialized response.
+
+        Returns:
+            Tuple[bytes, bool]: The response and whether it came from the cache.
+        """
+        versioned_key = None
+        try:
+            generation = await self.backend.get_generation()
+            versioned_key = f"{generation}:{key}"
+            cached = await self.backend.get(versioned_key)
+        except Exception as e:
+            logger.error(f"Error reading {self.name} cache: {e}")
+            cached = None
+        if cached is not None:
+            self.hits += 1
+            return cached, True
+
+        self.misses += 1
+        value = await build()
+        if versioned_key is not None:
+            try:
+                await self.backend.set(versioned_key, value)
+            except Exception as e:
+                logger.error(f"Error writing {self.name} cache: {e}")
+        return value, False
+
+    async def invalidate(self):
+        """Drop every cached response, call after writes to the underlying data."""
+        try:
+            await self.backend.bump_generation()
+        except Exception as e:
+            logger.error(f"Error invalidating {self.name} cache: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "size": self.backend.size(),
+        }
+
+    async def close(self):
+        await self.backend.close()
+
+
+def _lead_list_backend():
+    if settings.LEAD_CACHE_REDIS_URL:
+        return RedisCacheBackend(
+            settings.LEAD_CACHE_REDIS_URL, settings.LEAD_CACHE_TTL, namespace="lead_list"
+        )
+    return LocalCacheBackend(settings.LEAD_CACHE_MAXSIZE, settings.LEAD_CACHE_TTL)
+
+
+# Responses of the combined lead list, invalidated on every write to users
+lead_list_cache = ResponseCache("lead_list", _lead_list_backend())
@@ -33,6 +33,45 @@ class Settings(BaseSettings):
     KAFKA_WEBSOCKET_GROUP_ID: str
     TEXTLOCAL_KEY: str
     LEAD_SYNC_INTERVAL: int = 3600  # Sync interval in seconds, default 1 hour
+    DOCUMENT_TYPE_CACHE_TTL: int = 300  # Seconds document types are cached in process
+    BULK_IMPORT_CHUNK_SIZE: int = 5000  # Rows parsed and committed per batch by import jobs
+    CREDIT_REPORT_PAGE_SIZE: int = 1000  # Credit report summaries read per query by lead sync
+    LEAD_CACHE_TTL: int = 60  # Seconds a combined lead list response is cached
+    LEAD_CACHE_MAXSIZE: int = 1024  # Responses kept by the in-process lead list cache
+    LEAD_CACHE_REDIS_URL: Optional[str] = None  # Share the lead list cache through Redis
+    PDF_RENDER_WORKERS: int = 2  # Processes rendering credit report PDFs
+    PDF_RENDER_QUEUE_SIZE: int = 20  # Renders allowed to wait for a worker before rejecting
+    PDF_RENDER_TIMEOUT: float = 60.0  # Seconds a single PDF render may take
+
+    # Blob storage
+    BLOB_STORAGE_BACKEND: str = "azure"  # "azure", or "local" to keep blobs on disk in tests
+    BLOB_STORAGE_LOCAL_ROOT: str = "blob_storage"  # Directory of the local backend
+    BLOB_IO_THREADS: int = 8  # Threads running blocking storage calls off the event loop
+    BLOB_MAX_CONCURRENCY: int = 4  # Parallel block transfers of a single upload or download
+    BLOB_CHUNK_SIZE: int = 4 * 1024 * 1024  # Bytes per block, larger blobs are sent in blocks
+    ZIP_EXPORT_PREFETCH: int = 3  # Blobs downloaded ahead of the one being zipped
+    UPLOAD_SESSION_TTL: int = 900  # Seconds a pre-signed upload URL stays valid
+    UPLOAD_MAX_SIZE: int = 100 * 1024 * 1024  # Largest file accepted by an upload session
+
+    # asyncpg connection pool
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # 0 disables the server side timeout
+    DB_STATEMENT_CACHE_SIZE: int = 100  # Prepared statements cached per connection, 0 disables
+    DB_CONNECTION_MAX_INACTIVE_LIFETIME: float = 300  # Seconds before idle connections close
+    DB_CONNECTION_MAX_QUERIES: int = 50000  # Queries before a connection is replaced
+    DB_METRICS_ENABLED: bool = True  # Per-request query count/time headers and logs
+
+    # Shared outbound HTTP clients, limits apply per integration
+    HTTP_CLIENT_HTTP2: bool = True
+    HTTP_CLIENT_TIMEOUT: float = 30.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 20
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 60.0  # Seconds an idle connection is kept open
+    EXTERNAL_FETCH_CONCURRENCY: int = 5  # Pages of an external collection fetched at once
+    EXTERNAL_FETCH_PAGE_RETRIES: int = 3  # Attempts per page on network/5xx/429 errors
+
     TEXTLOCAL_SENDER: str
     TEXTLOCAL_URL: str
     AZURE_APPINSIGHTS_INSTRUMENTATIONKEY: str
@@ -0,0 +1,68 @@
+from typing import Dict
+
+import httpx
+
+from app.core.config import settings
+from app.core.logger import logger
+
+# Outbound integrations, each gets its own connection pool so a slow host
+# cannot use up the connections of the others
+INTEGRATIONS = ("alohaa", "credit_report", "strapi", "beehiiv")
+
+
+class HTTPClientRegistry:
+    """
+    Application-lifetime `httpx.AsyncClient`s, one per outbound integration.
+
+    Clients keep connections alive between requests and negotiate HTTP/2 where the
+    host supports it, so the TCP and TLS handshakes are paid once per connection
+    instead of once per call. Clients are opened at startup and closed at shutdown,
+    `get` opens a missing client on first use for code running outside the app.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _build(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=settings.HTTP_CLIENT_HTTP2,
+            timeout=httpx.Timeout(
+                settings.HTTP_CLIENT_TIMEOUT, connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+        )
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        Get the shared client of an integration.
+
+        Args:
+            name (str): One of INTEGRATIONS.
+
+        Returns:
+            httpx.AsyncClient: The client, do not close it.
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._build()
+        return client
+
+    async def start(self):
+        for name in INTEGRATIONS:
+            self.get(name)
+        logger.info(f"Opened HTTP clients: {', '.join(INTEGRATIONS)}")
+
+    async def close(self):
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing HTTP client {name}: {e}")
+
+
+http_clients = HTTPClientRegistry()
@@ -0,0 +1,64 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+from app.db.metrics import RequestDBMetrics, request_db_metrics
+from app.db.session import database
+
+
+class DBMetricsMiddleware:
+    """
+    Records the query count, total query time and pool wait time of every HTTP request.
+
+    The totals are returned as X-DB-Query-Count, X-DB-Time-Ms and X-DB-Pool-Wait-Ms
+    headers and logged with custom dimensions once the request finishes. The headers
+    only cover queries made before the response started, the log entry also includes
+    streamed bodies and background tasks. Statements sent on the raw asyncpg connection,
+    like the COPY and executemany of the bulk upserts, are counted too.
+
+    Written as plain ASGI so the metrics context variable is shared with the endpoint.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestDBMetrics()
+        token = request_db_metrics.set(metrics)
+        status_code = 500
+
+        async def send_with_metrics(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(metrics.query_count)
+                headers["X-DB-Time-Ms"] = f"{metrics.db_time * 1000:.1f}"
+                headers["X-DB-Pool-Wait-Ms"] = f"{metrics.pool_wait * 1000:.1f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            request_db_metrics.reset(token)
+            if metrics.query_count:
+                route = scope.get("route")
+                logger.info(
+                    f"DB metrics {scope['method']} {scope['path']}: {metrics.query_count} "
+                    f"queries, {metrics.db_time * 1000:.1f} ms",
+                    extra={
+                        "custom_dimensions": {
+                            "route": getattr(route, "path", scope["path"]),
+                            "method": scope["method"],
+                            "status_code": status_code,
+                            "db_query_count": metrics.query_count,
+                            "db_time_ms": round(metrics.db_time * 1000, 1),
+                            "db_pool_wait_ms": round(metrics.pool_wait * 1000, 1),
+                            **database.pool_stats(),
+                        }
+                    },
+                )
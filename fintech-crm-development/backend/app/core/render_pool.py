@@ -0,0 +1,83 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+from app.core.logger import logger
+
+
+class RenderQueueFull(Exception):
+    """Raised when PDF_RENDER_QUEUE_SIZE renders are already waiting for a worker."""
+
+
+class RenderPool:
+    """
+    Process pool for CPU-bound document rendering, kept off the event loop.
+
+    At most PDF_RENDER_WORKERS renders run at once and PDF_RENDER_QUEUE_SIZE more
+    may wait, further renders are rejected with `RenderQueueFull`. A render that
+    exceeds PDF_RENDER_TIMEOUT raises `asyncio.TimeoutError`, its slot is freed
+    once the worker actually finishes. Workers are spawned rather than forked so
+    they do not inherit the threads and connections of the app process.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(
+            settings.PDF_RENDER_WORKERS + settings.PDF_RENDER_QUEUE_SIZE
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def render(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a module-level function in a worker process.
+
+        Args:
+            fn (Callable): Picklable function doing the rendering.
+            *args: Picklable arguments of `fn`.
+
+        Returns:
+            Any: The return value of `fn`.
+        """
+        if self._slots.locked():
+            raise RenderQueueFull("Render queue is full")
+        await self._slots.acquire()
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker died, start over with a fresh pool
+            self._executor = None
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._slots.release))
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), settings.PDF_RENDER_TIMEOUT
+            )
+        except BrokenProcessPool:
+            self._executor = None
+            raise
+
+    def start(self):
+        self._get_executor()
+        logger.info(f"Started render pool with {settings.PDF_RENDER_WORKERS} workers")
+
+    async def close(self):
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+render_pool = RenderPool()
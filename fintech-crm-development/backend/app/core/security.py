@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import re
 from datetime import datetime, timedelta
 from typing import Any, Union
@@ -42,6 +44,14 @@ async def decode_token(token: str, secret: str):
     except jwt.InvalidTokenError:
         return None
 
+def derive_key(purpose: str) -> str:
+    """
+    Derive a signing key for `purpose` from SECRET_KEY.
+
+    Tokens signed with it can never be mistaken for access tokens.
+    """
+    return hmac.new(settings.SECRET_KEY.encode(), purpose.encode(), hashlib.sha256).hexdigest()
+
 def password_regex(password: str):
     """
     Validate password with the given regex
@@ -0,0 +1,149 @@
+import time
+import typing
+from contextvars import ContextVar
+from typing import Optional
+
+from databases import Database
+from databases.core import Connection
+
+
+class RequestDBMetrics:
+    """Database usage of a single request."""
+
+    __slots__ = ("query_count", "db_time", "pool_wait")
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+
+
+# Set by DBMetricsMiddleware for the duration of a request
+request_db_metrics: ContextVar[Optional[RequestDBMetrics]] = ContextVar(
+    "request_db_metrics", default=None
+)
+
+
+def _record_query(started: float):
+    metrics = request_db_metrics.get()
+    if metrics is not None:
+        metrics.query_count += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+class InstrumentedRawConnection:
+    """
+    Proxy of an asyncpg connection that adds its statements, including COPY and
+    executemany, to the metrics of the current request.
+    """
+
+    TIMED_METHODS = frozenset(
+        (
+            "execute",
+            "executemany",
+            "fetch",
+            "fetchrow",
+            "fetchval",
+            "copy_records_to_table",
+            "copy_to_table",
+            "copy_from_table",
+            "copy_from_query",
+        )
+    )
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._connection, name)
+        if name not in self.TIMED_METHODS:
+            return attribute
+
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await attribute(*args, **kwargs)
+            finally:
+                _record_query(started)
+
+        return timed
+
+
+class InstrumentedConnection(Connection):
+    """
+    Connection that adds its query count, query time and the time spent waiting
+    for a pooled connection to the metrics of the current request. Statements sent
+    through `raw_connection` are counted as well.
+    """
+
+    @property
+    def raw_connection(self) -> InstrumentedRawConnection:
+        return InstrumentedRawConnection(super().raw_connection)
+
+    async def __aenter__(self) -> "InstrumentedConnection":
+        if self._connection_counter > 0:
+            return await super().__aenter__()
+
+        started = time.perf_counter()
+        await super().__aenter__()
+        metrics = request_db_metrics.get()
+        if metrics is not None:
+            metrics.pool_wait += time.perf_counter() - started
+        return self
+
+    async def fetch_all(self, query, values: typing.Optional[dict] = None):
+        started = time.perf_counter()
+        try:
+            return await super().fetch_all(query, values)
+        finally:
+            _record_query(started)
+
+    async def fetch_one(self, query, values: typing.Optional[dict] = None):
+        started = time.perf_counter()
+        try:
+            return await super().fetch_one(query, values)
+        finally:
+            _record_query(started)
+
+    async def fetch_val(self, query, values: typing.Optional[dict] = None, column: int = 0):
+        started = time.perf_counter()
+        try:
+            return await super().fetch_val(query, values, column=column)
+        finally:
+            _record_query(started)
+
+    async def execute(self, query, values: typing.Optional[dict] = None):
+        started = time.perf_counter()
+        try:
+            return await super().execute(query, values)
+        finally:
+            _record_query(started)
+
+    async def execute_many(self, query, values: list):
+        started = time.perf_counter()
+        try:
+            return await super().execute_many(query, values)
+        finally:
+            _record_query(started)
+
+
+class InstrumentedDatabase(Database):
+    """`databases.Database` handing out `InstrumentedConnection`s."""
+
+    def connection(self) -> Connection:
+        if self._global_connection is not None:
+            return self._global_connection
+
+        try:
+            return self._connection_context.get()
+        except LookupError:
+            connection = InstrumentedConnection(self._backend)
+            self._connection_context.set(connection)
+            return connection
+
+    def pool_stats(self) -> dict:
+        """Size and idle connections of the asyncpg pool, empty before connect."""
+        pool = getattr(self._backend, "_pool", None)
+        if pool is None:
+            return {}
+        return {"pool_size": pool.get_size(), "pool_idle": pool.get_idle_size()}
@@ -1,21 +1,37 @@
 import databases
 import sqlalchemy
 from sqlalchemy import create_engine, MetaData
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.db.metrics import InstrumentedDatabase
 
 # Convert the URI format for the databases library
 # databases expects postgresql:// not postgresql+psycopg2://
 DATABASE_URI = str(settings.DATABASE_URI).replace("postgresql+psycopg2://", "postgresql://")
 
+# Passed through to asyncpg.create_pool
+POOL_OPTIONS = {
+    "min_size": settings.DB_POOL_MIN_SIZE,
+    "max_size": settings.DB_POOL_MAX_SIZE,
+    "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    "max_inactive_connection_lifetime": settings.DB_CONNECTION_MAX_INACTIVE_LIFETIME,
+    "max_queries": settings.DB_CONNECTION_MAX_QUERIES,
+    "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)},
+}
+
 # Use the converted URI for the databases library
-database = databases.Database(DATABASE_URI)
+if settings.DB_METRICS_ENABLED:
+    database = InstrumentedDatabase(DATABASE_URI, **POOL_OPTIONS)
+else:
+    database = databases.Database(DATABASE_URI, **POOL_OPTIONS)
 
 # Define metadata only once
 metadata = MetaData()
 
 # Use the original URI with the driver for SQLAlchemy
-engine = create_engine(settings.DATABASE_URI)
+# Only used for create_all at startup, so it does not keep a second pool open
+engine = create_engine(settings.DATABASE_URI, poolclass=NullPool)
 
 
 async def get_database():
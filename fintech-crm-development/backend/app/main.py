@@ -18,10 +18,17 @@ import os
 from app.utils.generate_welcome_page import generate_welcome_page
 from app.api.api_v1 import deps
 from app.api.api_v1.api import api_router
+from app.core.cache import lead_list_cache
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.core.kafka import KafkaConsumer
+from app.core.middleware import DBMetricsMiddleware
+from app.core.render_pool import render_pool
 from app.core.websocket import websocket_manager,websocket_manager_notifications
 from app.db.session import database, engine, metadata
+from app.service.leads_sync_service import lead_sync_service
+from app.services.lead_ingestion_service import lead_ingestion_service
+from app.utils.blob_storage import blob_storage
 
 loop = asyncio.get_event_loop()
 metadata.create_all(engine)
@@ -40,13 +47,23 @@ async def root():
 @app.on_event("startup")
 async def startup():
     await database.connect()
+    await http_clients.start()
+    render_pool.start()
     consume_kafka()
     consume_websocket_kafka()
     metadata.create_all(engine)
+    lead_ingestion_service.start()
+    lead_sync_service.start()
 
 
 @app.on_event("shutdown")
 async def shutdown():
+    await lead_sync_service.stop()
+    await lead_ingestion_service.stop()
+    await http_clients.close()
+    await lead_list_cache.close()
+    await render_pool.close()
+    blob_storage.close()
     await database.disconnect()
 
 
@@ -57,8 +74,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor",
+        "X-Cache",
+        "X-DB-Query-Count",
+        "X-DB-Time-Ms",
+        "X-DB-Pool-Wait-Ms",
+    ],
 )
 
+if settings.DB_METRICS_ENABLED:
+    app.add_middleware(DBMetricsMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
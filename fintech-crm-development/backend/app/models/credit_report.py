@@ -35,4 +35,6 @@ credit_reports = sa.Table(
     sa.Column("delinquent_accounts", sa.Integer, nullable=True),
     # Flags
     sa.Column("is_valid", sa.Boolean, default=True),
+    # Keyset pagination on (updated_at, id)
+    sa.Index("ix_credit_reports_updated_at_id", "updated_at", "id"),
 )
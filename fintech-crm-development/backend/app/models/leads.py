@@ -18,5 +18,7 @@ leads = sqlalchemy.Table(
     sqlalchemy.Column("created_at", sqlalchemy.DateTime(timezone=True), server_default=sqlalchemy.func.now()),
     sqlalchemy.Column("updated_at", sqlalchemy.DateTime(timezone=True), onupdate=sqlalchemy.func.now()),
     sqlalchemy.Column("last_contact", sqlalchemy.DateTime(timezone=True), nullable=True),
-    sqlalchemy.Column("is_active", sqlalchemy.Boolean, default=True)
+    sqlalchemy.Column("is_active", sqlalchemy.Boolean, default=True),
+    # Conflict target of the bulk sync merge, NULL source_ids never conflict
+    sqlalchemy.Index("uq_leads_source_source_id", "source", "source_id", unique=True),
 )
\ No newline at end of file
@@ -13,9 +13,13 @@ sqlalchemy.Column("message_text", sqlalchemy.String),
 sqlalchemy.Column("message_id", sqlalchemy.String),
 sqlalchemy.Column("message_type", sqlalchemy.String),
 sqlalchemy.Column("message_sender", sqlalchemy.String),
-sqlalchemy.Column("timestamp", sqlalchemy.String),
+sqlalchemy.Column("timestamp", sqlalchemy.DateTime(timezone=True)),
 sqlalchemy.Column("media_id", sqlalchemy.String, nullable=True),
 sqlalchemy.Column("latitude", sqlalchemy.Float, nullable=True),
 sqlalchemy.Column("longitude", sqlalchemy.Float, nullable=True),
 sqlalchemy.Column("read", sqlalchemy.Boolean, default=False),
+# Conversation history and the latest message of a phone number
+sqlalchemy.Index(
+    "ix_messages_phone_number_timestamp", "phone_number", sqlalchemy.text('"timestamp" DESC')
+),
 )
\ No newline at end of file
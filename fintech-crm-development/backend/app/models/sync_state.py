@@ -0,0 +1,13 @@
+import sqlalchemy
+from app.db.session import metadata
+
+sync_state = sqlalchemy.Table(
+    "sync_state",
+    metadata,
+    sqlalchemy.Column("source", sqlalchemy.String, primary_key=True, index=True),
+    sqlalchemy.Column("last_synced_at", sqlalchemy.DateTime(timezone=True), nullable=True),
+    sqlalchemy.Column("cursor", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column(
+        "updated_on", sqlalchemy.DateTime(timezone=True), default=sqlalchemy.func.now()
+    ),
+)
@@ -50,6 +50,8 @@ call_log = metadata.tables.get("call_log") or sqlalchemy.Table(
     Column("call_end_time", DateTime, nullable=True),
     Column("created_at", DateTime, default=func.now()),
     Column("updated_at", DateTime, default=func.now(), onupdate=func.now()),
+    # Keyset pagination on (created_at, id)
+    sqlalchemy.Index("ix_call_log_created_at_id", "created_at", "id"),
 )
 
 call_note = metadata.tables.get("call_note") or sqlalchemy.Table(
@@ -24,7 +24,8 @@ users = sqlalchemy.Table(
     sqlalchemy.Column("status", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("is_active", sqlalchemy.Boolean,default=True),
     sqlalchemy.Column("role", sqlalchemy.String, nullable=True),
-    sqlalchemy.Column("last_communicated", sqlalchemy.String),
+    # Time of the latest WhatsApp message, maintained by the Kafka consumer
+    sqlalchemy.Column("last_communicated", sqlalchemy.DateTime(timezone=True), nullable=True),
     sqlalchemy.Column("source", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("loan_amount", sqlalchemy.Float, nullable=True),
     sqlalchemy.Column("employment_type", sqlalchemy.String, nullable=True),
@@ -43,6 +44,16 @@ users = sqlalchemy.Table(
     sqlalchemy.Column(
         "updated_on", sqlalchemy.DateTime(timezone=True), default=sqlalchemy.func.now()
     ),
+    # Active documents of the user, maintained by the document repository. Only a server
+    # default: `databases` sends NULL for Python-side defaults of omitted columns
+    sqlalchemy.Column("documents_count", sqlalchemy.Integer, nullable=False, server_default="0"),
+    # Keyset pagination on (updated_on, id)
+    sqlalchemy.Index("ix_users_updated_on_id", "updated_on", "id"),
+    # Recency sorting and date range filters on the last communication
+    sqlalchemy.Index(
+        "ix_users_last_communicated",
+        sqlalchemy.text("last_communicated DESC NULLS LAST"),
+    ),
 )
 
 
@@ -68,6 +79,12 @@ documents = sqlalchemy.Table(
     ),
     sqlalchemy.Column("status", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("is_active", sqlalchemy.Boolean),
+    # Per-user active document counts
+    sqlalchemy.Index(
+        "ix_documents_user_id_active",
+        "user_id",
+        postgresql_where=sqlalchemy.text("is_active"),
+    ),
 )
 
 documents_type = sqlalchemy.Table(
@@ -1,9 +1,10 @@
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 
 from app.db.session import database
+from app.utils.pagination import keyset_paginate, split_page
 
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 
@@ -29,6 +30,25 @@ class BaseRepository:
         query = model.select().offset(skip).limit(limit)
         return await database.fetch_all(query=query)
 
+    async def get_multi_keyset(
+        self, model, cursor: Optional[str] = None, limit: int = 100, sort_column: str = "created_at"
+    ):
+        """
+        Keyset paginated variant of `get_multi`, ordered by (sort_column, id) newest first.
+
+        Returns:
+            Tuple[List, Optional[str]]: The page of rows and the cursor of the next page.
+        """
+        query = keyset_paginate(
+            model.select().where(model.c[sort_column].isnot(None)),
+            model.c[sort_column],
+            model.c.id,
+            cursor=cursor,
+            limit=limit,
+        )
+        rows = await database.fetch_all(query=query)
+        return split_page(rows, limit, sort_column)
+
     async def create(self, model, obj_in: CreateSchemaType):
         obj_in_data = jsonable_encoder(obj_in)
         query = model.insert().values(**obj_in_data)
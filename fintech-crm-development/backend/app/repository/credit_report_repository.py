@@ -1,9 +1,23 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy import select, and_, desc, func, or_
 from app.models.credit_report import credit_reports
 from app.db.session import database
 from app.core.logger import logger
+from app.utils.pagination import keyset_paginate, split_page
+
+# Columns leads are built from, everything except the report payload
+SUMMARY_COLUMNS = [
+    credit_reports.c.id,
+    credit_reports.c.user_id,
+    credit_reports.c.first_name,
+    credit_reports.c.last_name,
+    credit_reports.c.phone_number,
+    credit_reports.c.pan_number,
+    credit_reports.c.credit_score,
+    credit_reports.c.created_at,
+    credit_reports.c.updated_at,
+]
 
 
 class CreditReportRepository:
@@ -300,6 +314,75 @@ class CreditReportRepository:
         results = await database.fetch_all(query)
         return [dict(result) for result in results]
 
+    async def get_reports_keyset(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        user_id: Optional[str] = None,
+        search_term: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of credit reports ordered by (updated_at, id), newest first,
+        optionally filtered by a search term like `search_reports`
+        """
+        conditions = [credit_reports.c.is_valid == True, credit_reports.c.updated_at.isnot(None)]
+
+        if search_term:
+            search_pattern = f"%{search_term}%"
+            conditions.append(
+                or_(
+                    credit_reports.c.first_name.ilike(search_pattern),
+                    credit_reports.c.last_name.ilike(search_pattern),
+                    credit_reports.c.pan_number.ilike(search_pattern),
+                    credit_reports.c.phone_number.ilike(search_pattern),
+                )
+            )
+
+        if user_id:
+            conditions.append(credit_reports.c.user_id == user_id)
+
+        query = keyset_paginate(
+            select([credit_reports]).where(and_(*conditions)),
+            credit_reports.c.updated_at,
+            credit_reports.c.id,
+            cursor=cursor,
+            limit=limit,
+        )
+
+        results = await database.fetch_all(query)
+        reports, next_cursor = split_page(results, limit, "updated_at")
+        return [dict(result) for result in reports], next_cursor
+
+    async def get_report_summaries(
+        self,
+        limit: int = 1000,
+        cursor: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of valid credit report summaries ordered by (updated_at, id), oldest first.
+
+        Only SUMMARY_COLUMNS are selected, the large `raw_data` JSON is never read.
+        Pass the returned cursor back to read the next page, it is None after the last.
+        """
+        conditions = [credit_reports.c.is_valid == True, credit_reports.c.updated_at.isnot(None)]
+
+        if updated_since:
+            conditions.append(credit_reports.c.updated_at > updated_since)
+
+        query = keyset_paginate(
+            select(SUMMARY_COLUMNS).where(and_(*conditions)),
+            credit_reports.c.updated_at,
+            credit_reports.c.id,
+            cursor=cursor,
+            limit=limit,
+            descending=False,
+        )
+
+        results = await database.fetch_all(query)
+        reports, next_cursor = split_page(results, limit, "updated_at")
+        return [dict(result) for result in reports], next_cursor
+
     async def count_reports(self, user_id: Optional[str] = None) -> int:
         """
         Count total number of valid credit reports with optional user filtering
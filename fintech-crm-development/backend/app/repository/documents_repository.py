@@ -1,11 +1,14 @@
 import datetime
 import uuid
+from typing import Any, Dict, List
 
+from cachetools import TTLCache
 from sqlalchemy import func, select
 
 from app.core.config import settings
 from app.db.session import database
 from app.models.user import documents, documents_type
+from app.repository.user_repository import user_repository
 from app.schemas.document import DocumentCreate, DocumentUpdate
 
 
@@ -14,8 +17,31 @@ class DocumentRepository:
     Repository class for managing documents in the system.
 
     This class provides methods to create, retrieve, and update documents in the system.
+    Document types are a small, rarely changing table and are cached in process for
+    DOCUMENT_TYPE_CACHE_TTL seconds.
     """
 
+    def __init__(self):
+        self._document_types_cache = TTLCache(maxsize=1, ttl=settings.DOCUMENT_TYPE_CACHE_TTL)
+
+    async def _get_document_types(self) -> Dict[int, Any]:
+        """
+        Retrieve all document types keyed by ID, from the cache when still fresh.
+
+        Returns:
+            Dict[int, Any]: The document type records keyed by their ID.
+        """
+        document_types = self._document_types_cache.get("all")
+        if document_types is None:
+            rows = await database.fetch_all(query=documents_type.select())
+            document_types = {row["id"]: row for row in rows}
+            self._document_types_cache["all"] = document_types
+        return document_types
+
+    def invalidate_document_types(self):
+        """Drop the cached document types, e.g. after the table was changed."""
+        self._document_types_cache.clear()
+
     async def create(self, obj_in: DocumentCreate):
         """
         Create a new document in the system.
@@ -37,7 +63,11 @@ class DocumentRepository:
             is_active=True,
             document_name=obj_in.document_name,
         )
-        return await database.execute(query=query)
+        async with database.transaction():
+            document_id = await database.execute(query=query)
+            if obj_in.user_id:
+                await user_repository.increment_documents_count(obj_in.user_id, 1)
+        return document_id
 
     async def update_document(self, document_type: str, document_size: int, document_type_id: int):
         """
@@ -86,21 +116,29 @@ class DocumentRepository:
         """
         Update a document's active status in the system.
 
+        The owner's documents counter is only adjusted when the status actually changes.
+
         Args:
             status (bool): The active status to set.
             document_id (str): The ID of the document.
 
         Returns:
-            int: The ID of the updated document.
+            str: The user ID of the updated document, None if the status was unchanged.
         """
+        changed = documents.c.is_active.isnot(True) if status else documents.c.is_active.is_(True)
         query = (
             documents.update()
-            .where(document_id == documents.c.id)
+            .where(document_id == documents.c.id, changed)
             .values(
                 is_active=status,
             )
+            .returning(documents.c.user_id)
         )
-        return await database.execute(query=query)
+        async with database.transaction():
+            user_id = await database.execute(query=query)
+            if user_id:
+                await user_repository.increment_documents_count(user_id, 1 if status else -1)
+        return user_id
 
     async def update_document_with_id(
         self, document_type: str, document_size: int, document_id: int, document_name: str = None
@@ -150,22 +188,48 @@ class DocumentRepository:
         )
         return await database.fetch_all(query=query)
 
-    async def file_extension(self, document_path: str):
+    async def get_user_documents_with_types(self, user_id: str):
         """
-        Retrieve document type based on document path.
+        Retrieve active documents of a user together with their document type name.
 
         Args:
-            document_path (str): The path of the document.
+            user_id (str): The ID of the user.
 
         Returns:
-            str: The document type.
+            List[Document]: The documents, each with the type name as `document_file_name`.
         """
         query = (
-            documents.select()
-            .where(document_path == documents.c.document_path, documents.c.is_active == True)
-            .with_only_columns([documents.c.document_type])
+            select([documents, documents_type.c.document_name.label("document_file_name")])
+            .select_from(
+                documents.outerjoin(
+                    documents_type, documents.c.document_type_id == documents_type.c.id
+                )
+            )
+            .where(
+                user_id == documents.c.user_id,
+                documents.c.is_active == True,
+            )
+            .order_by(documents.c.updated_on.desc())
         )
-        return await database.fetch_val(query=query)
+        return await database.fetch_all(query=query)
+
+    async def file_extensions(self, document_paths: List[str]) -> Dict[str, str]:
+        """
+        Retrieve the document types of active documents in one query.
+
+        Args:
+            document_paths (List[str]): The paths of the documents.
+
+        Returns:
+            Dict[str, str]: Document type by path, inactive or unknown paths are left out.
+        """
+        if not document_paths:
+            return {}
+        query = select([documents.c.document_path, documents.c.document_type]).where(
+            documents.c.document_path.in_(document_paths), documents.c.is_active == True
+        )
+        rows = await database.fetch_all(query=query)
+        return {row["document_path"]: row["document_type"] for row in rows}
 
     async def get_user_documents_count(self, user_id: str):
         """
@@ -184,6 +248,27 @@ class DocumentRepository:
         )
         return await database.fetch_val(query=query)
 
+    async def get_users_documents_count(self, user_ids: List[str]) -> Dict[str, int]:
+        """
+        Retrieve the count of active documents of several users in one query.
+
+        Args:
+            user_ids (List[str]): The user IDs.
+
+        Returns:
+            Dict[str, int]: Count of documents per user ID, users without documents are omitted.
+        """
+        if not user_ids:
+            return {}
+
+        query = (
+            select([documents.c.user_id, func.count().label("documents_count")])
+            .where(documents.c.user_id.in_(user_ids), documents.c.is_active == True)
+            .group_by(documents.c.user_id)
+        )
+        rows = await database.fetch_all(query=query)
+        return {row["user_id"]: row["documents_count"] for row in rows}
+
     async def get_documents_type(self, document_type_id: int):
         """
         Retrieve document type using document type id.
@@ -195,8 +280,8 @@ class DocumentRepository:
             dict: The retrieved document type object.
             eg: {'id': 1, 'document_name': 'National ID'}
         """
-        query = documents_type.select().where(document_type_id == documents_type.c.id)
-        return await database.fetch_one(query=query)
+        document_types = await self._get_document_types()
+        return document_types.get(document_type_id)
 
     async def get_documents_type_count(self):
         """
@@ -205,8 +290,7 @@ class DocumentRepository:
         Returns:
             int: Count of document types.
         """
-        query = select([func.count()]).select_from(documents_type)
-        return await database.fetch_val(query=query)
+        return len(await self._get_document_types())
 
     async def get_documents_using_id(self, user_id: str, document_type_id: int):
         """
@@ -265,8 +349,7 @@ class DocumentRepository:
         Returns:
             List[dict]: A list of all document types.
         """
-        query = documents_type.select()
-        return await database.fetch_all(query=query)
+        return list((await self._get_document_types()).values())
 
     async def get_document_type_by_id(self, document_type_id: int):
         """
@@ -278,8 +361,7 @@ class DocumentRepository:
         Returns:
             dict: The document type data or None if not found.
         """
-        query = documents_type.select().where(documents_type.c.id == document_type_id)
-        result = await database.fetch_one(query)
+        result = await self.get_documents_type(document_type_id)
         if result:
             document_type_data = dict(result)
             return document_type_data
@@ -300,6 +382,19 @@ class DocumentRepository:
         )
         return await database.fetch_one(query=query)
 
+    async def get_document_by_path(self, document_path: str):
+        """
+        Retrieve a document by its blob path.
+
+        Args:
+            document_path (str): The path of the document in blob storage.
+
+        Returns:
+            dict: The retrieved document object, or None if not found.
+        """
+        query = documents.select().where(documents.c.document_path == document_path)
+        return await database.fetch_one(query=query)
+
     async def update_document_name(self, document_id: int, document_name: str):
         """
         Update a document's name in the system.
@@ -0,0 +1,205 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Table, and_, func, literal, literal_column, or_, select
+
+from app.models.user import users
+from app.utils.pagination import keyset_paginate
+
+
+# Columns concatenated into the trigram indexed search document, the expression
+# must stay identical to ix_users_search_document_trgm for the index to be used
+SEARCH_DOCUMENT_COLUMNS = (
+    "full_name",
+    "email",
+    "phone_number",
+    "pan_number",
+    "loan_purpose",
+    "employment_type",
+    "source",
+)
+SEARCH_DOCUMENT_RAW_DATA_KEYS = ("loan_type", "email", "phone_number")
+
+
+def search_document(table: Table = users):
+    """
+    Build the searchable text of a lead, all search columns joined by spaces.
+
+    Constants are rendered inline rather than as bind parameters so the
+    expression matches the GIN trigram index.
+    """
+    empty = literal_column("''")
+    parts = [func.coalesce(table.c[column], empty) for column in SEARCH_DOCUMENT_COLUMNS]
+    parts.extend(
+        func.coalesce(table.c.raw_data.op("->>")(literal_column(f"'{key}'")), empty)
+        for key in SEARCH_DOCUMENT_RAW_DATA_KEYS
+    )
+
+    document = parts[0]
+    for part in parts[1:]:
+        document = document.concat(literal_column("' '")).concat(part)
+    return document
+
+
+class LeadQueryBuilder:
+    """
+    Builds the single SQL query behind the combined leads view.
+
+    Every filter of /users/combined is translated into a WHERE condition over the
+    users store, so only the requested page is read from the database. The total
+    is returned on every row as `total_count` via COUNT(*) OVER().
+
+    Usage:
+        query = (
+            LeadQueryBuilder()
+            .search("john")
+            .sources(["beehiiv"])
+            .paginate(page=1, page_size=10)
+        )
+    """
+
+    SPECIAL_SOURCES = ("beehiiv", "strapi_loan", "strapi_cibil")
+    EMPLOYMENT_KEYWORDS = ("salaried", "business")
+
+    def __init__(self, table: Table = users):
+        self.table = table
+        self.conditions = [table.c.is_active == True]
+
+    def search(self, search: Optional[str]) -> "LeadQueryBuilder":
+        """Match the term against name, contact, PAN, loan and source columns."""
+        if not search:
+            return self
+
+        c = self.table.c
+        pattern = f"%{search}%"
+        term = search.lower()
+        search_conditions = [search_document(self.table).ilike(pattern)]
+
+        # "website" covers every lead captured through the website forms
+        if "website" in term:
+            search_conditions.append(c.source.in_(self.SPECIAL_SOURCES))
+
+        # Searching for an employment keyword lists all salaried and business leads
+        if any(keyword in term for keyword in self.EMPLOYMENT_KEYWORDS):
+            search_conditions.extend(
+                c.employment_type.ilike(f"%{keyword}%") for keyword in self.EMPLOYMENT_KEYWORDS
+            )
+
+        self.conditions.append(or_(*search_conditions))
+        return self
+
+    def created_between(
+        self, start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> "LeadQueryBuilder":
+        if start_date:
+            self.conditions.append(self.table.c.created_on >= start_date)
+        if end_date:
+            self.conditions.append(self.table.c.created_on <= end_date)
+        return self
+
+    def loan_amount_ranges(
+        self, ranges: List[Tuple[Optional[float], Optional[float]]]
+    ) -> "LeadQueryBuilder":
+        """Keep leads whose loan amount falls in any of the (min, max) buckets."""
+        loan_amount = self.table.c.loan_amount
+        range_conditions = []
+        for min_amount, max_amount in ranges:
+            bounds = [loan_amount.isnot(None)]
+            if min_amount is not None:
+                bounds.append(loan_amount >= min_amount)
+            if max_amount is not None:
+                bounds.append(loan_amount <= max_amount)
+            range_conditions.append(and_(*bounds))
+
+        if range_conditions:
+            self.conditions.append(or_(*range_conditions))
+        return self
+
+    def employment_types(self, employment_type: Optional[str]) -> "LeadQueryBuilder":
+        """Filter on a comma separated, case-insensitive list of employment types."""
+        if not employment_type:
+            return self
+
+        values = {emp.strip().lower() for emp in employment_type.split(",") if emp.strip()}
+        if values:
+            self.conditions.append(func.lower(self.table.c.employment_type).in_(values))
+        return self
+
+    def cibil_score_ranges(self, ranges: List[Tuple[int, int]]) -> "LeadQueryBuilder":
+        cibil_score = self.table.c.cibil_score
+        range_conditions = [
+            and_(cibil_score >= min_score, cibil_score <= max_score)
+            for min_score, max_score in ranges
+        ]
+        if range_conditions:
+            self.conditions.append(or_(*range_conditions))
+        return self
+
+    def sources(self, sources: Optional[Iterable[str]]) -> "LeadQueryBuilder":
+        """Filter on lead sources, "website" expands to all website sources."""
+        if not sources:
+            return self
+
+        sources_lower = {source.lower() for source in sources}
+        if "website" in sources_lower:
+            sources_lower |= set(self.SPECIAL_SOURCES)
+
+        self.conditions.append(func.lower(self.table.c.source).in_(sources_lower))
+        return self
+
+    def order_by(self):
+        return (self.table.c.updated_on.desc(), self.table.c.id.desc())
+
+    def paginate(self, page: int, page_size: int):
+        """
+        Build the page query, each row carries the total match count as `total_count`.
+        """
+        return (
+            select([self.table, func.count().over().label("total_count")])
+            .where(and_(*self.conditions))
+            .order_by(*self.order_by())
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+        )
+
+    def keyset(self, cursor: Optional[str], limit: int):
+        """
+        Build a keyset page query on (updated_on, id), fetching one look-ahead row.
+
+        Unlike `paginate` no total is computed, so every page costs O(limit).
+        """
+        query = select([self.table]).where(and_(*self._keyset_conditions()))
+        return keyset_paginate(
+            query, self.table.c.updated_on, self.table.c.id, cursor=cursor, limit=limit
+        )
+
+    def ranked(self, term: str, limit: int):
+        """
+        Build a relevance ranked search query.
+
+        Leads containing the term or fuzzily matching it (pg_trgm word similarity)
+        are returned best match first, each row carries its `score`.
+        """
+        document = search_document(self.table)
+        score = func.word_similarity(literal(term), document)
+        # <% binds as tightly as ||, the document must be parenthesized
+        fuzzy_match = literal(term).op("<%")(document.self_group())
+        return (
+            select([self.table, score.label("score")])
+            .where(and_(*self.conditions, or_(document.ilike(f"%{term}%"), fuzzy_match)))
+            .order_by(score.desc(), *self.order_by())
+            .limit(limit)
+        )
+
+    def _keyset_conditions(self):
+        # Rows without updated_on have no place in the (updated_on, id) order
+        return [*self.conditions, self.table.c.updated_on.isnot(None)]
+
+    def count(self, keyset: bool = False):
+        """
+        Build the COUNT(*) query, used when the requested page is past the end.
+
+        With `keyset`, only the rows `keyset` can page through are counted.
+        """
+        conditions = self._keyset_conditions() if keyset else self.conditions
+        return select([func.count()]).select_from(self.table).where(and_(*conditions))
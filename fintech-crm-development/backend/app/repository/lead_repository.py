@@ -1,13 +1,51 @@
 # app/repository/leads_repository.py
+import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
-from sqlalchemy import and_, or_, select, func
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import String, and_, any_, bindparam, literal_column, or_, select, func
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 from app.db.session import database
 from app.models.leads import leads
 from app.schemas.leads import LeadCreate, LeadUpdate, LeadFilter, LeadSource
 
+# Columns refreshed from the source when a synced lead already exists. status and
+# last_contact belong to the CRM workflow and are never overwritten by a sync.
+SYNC_MERGE_COLUMNS = (
+    "full_name",
+    "email",
+    "phone_number",
+    "loan_amount",
+    "employment_type",
+    "metadata",
+)
+SYNC_BATCH_SIZE = 1000
+
+# Statements of merge_leads_bulk, run with asyncpg executemany. Updates only
+# overwrite the columns the incoming lead has a value for, like merge_or_update_lead,
+# and status only when the lead sets it explicitly.
+BULK_INSERT_LEAD = """
+    INSERT INTO leads (
+        id, full_name, email, phone_number, source, source_id,
+        loan_amount, employment_type, status, metadata, is_active
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10::jsonb, true)
+"""
+BULK_UPDATE_LEAD = """
+    UPDATE leads SET
+        full_name = COALESCE($2, full_name),
+        email = COALESCE($3, email),
+        phone_number = COALESCE($4, phone_number),
+        loan_amount = COALESCE($5, loan_amount),
+        employment_type = COALESCE($6, employment_type),
+        status = COALESCE($7, status),
+        metadata = COALESCE($8::jsonb, metadata),
+        updated_at = now()
+    WHERE id = $1
+"""
+
 class LeadRepository:
     async def create(self, obj_in: LeadCreate) -> str:
         """Create a new lead"""
@@ -126,4 +164,166 @@ class LeadRepository:
             # Create new lead
             return await self.create(lead_data)
 
+    async def _find_merge_candidates(self, leads_in: List[LeadCreate]) -> List[Any]:
+        """Fetch every lead sharing a source_id, phone number or email with the batch."""
+        source_ids = list({lead.source_id for lead in leads_in if lead.source_id})
+        phones = list({lead.phone_number for lead in leads_in if lead.phone_number})
+        emails = list({lead.email for lead in leads_in if lead.email})
+        query = select(
+            [leads.c.id, leads.c.source, leads.c.source_id, leads.c.phone_number, leads.c.email]
+        ).where(
+            or_(
+                leads.c.source_id == any_(bindparam("source_ids", source_ids, ARRAY(String))),
+                leads.c.phone_number == any_(bindparam("phones", phones, ARRAY(String))),
+                leads.c.email == any_(bindparam("emails", emails, ARRAY(String))),
+            )
+        ).order_by(leads.c.created_at, leads.c.id)
+        return await database.fetch_all(query)
+
+    async def merge_leads_bulk(self, leads_in: List[LeadCreate]) -> List[str]:
+        """
+        Batch variant of `merge_or_update_lead`.
+
+        Every lead is matched by (source, source_id), then phone number, then email
+        like `merge_or_update_lead`, but all candidates of the batch are read with one
+        `= ANY(...)` query. Inserts and updates are then sent with asyncpg executemany
+        in one transaction. Leads earlier in the batch are matched by later ones.
+
+        Args:
+            leads_in (List[LeadCreate]): The leads to merge.
+
+        Returns:
+            List[str]: The id of the created or updated lead of each input lead.
+        """
+        if not leads_in:
+            return []
+
+        by_source_id: Dict[Any, str] = {}
+        by_phone: Dict[str, str] = {}
+        by_email: Dict[str, str] = {}
+
+        def remember(lead_id, source, source_id, phone_number, email):
+            if source_id:
+                by_source_id.setdefault((source, source_id), lead_id)
+            if phone_number:
+                by_phone.setdefault(phone_number, lead_id)
+            if email:
+                by_email.setdefault(email, lead_id)
+
+        for row in await self._find_merge_candidates(leads_in):
+            remember(
+                row["id"], row["source"], row["source_id"], row["phone_number"], row["email"]
+            )
+
+        lead_ids, inserts, updates = [], [], []
+        for lead in leads_in:
+            data = jsonable_encoder(lead)
+            lead_id = (
+                (data["source_id"] and by_source_id.get((data["source"], data["source_id"])))
+                or (data["phone_number"] and by_phone.get(data["phone_number"]))
+                or (data["email"] and by_email.get(data["email"]))
+            )
+            metadata = json.dumps(data["metadata"]) if data["metadata"] is not None else None
+            if lead_id:
+                updates.append(
+                    (
+                        lead_id,
+                        data["full_name"],
+                        data["email"],
+                        data["phone_number"],
+                        data["loan_amount"],
+                        data["employment_type"],
+                        # The NEW default must not reset the status of a worked lead
+                        data["status"] if "status" in lead.__fields_set__ else None,
+                        metadata,
+                    )
+                )
+            else:
+                lead_id = str(uuid.uuid4())
+                inserts.append(
+                    (
+                        lead_id,
+                        data["full_name"],
+                        data["email"],
+                        data["phone_number"],
+                        data["source"],
+                        data["source_id"],
+                        data["loan_amount"],
+                        data["employment_type"],
+                        data["status"],
+                        metadata,
+                    )
+                )
+            remember(
+                lead_id, data["source"], data["source_id"], data["phone_number"], data["email"]
+            )
+            lead_ids.append(lead_id)
+
+        async with database.connection() as connection:
+            async with connection.transaction():
+                raw_connection = connection.raw_connection
+                if inserts:
+                    await raw_connection.executemany(BULK_INSERT_LEAD, inserts)
+                if updates:
+                    await raw_connection.executemany(BULK_UPDATE_LEAD, updates)
+        return lead_ids
+
+    async def upsert_by_source_id(self, leads_in: List[LeadCreate]) -> Dict[str, int]:
+        """
+        Insert or refresh synced leads keyed on (source, source_id).
+
+        Leads already synced before are refreshed in batches of SYNC_BATCH_SIZE, each
+        one multi-row INSERT ... ON CONFLICT on `uq_leads_source_source_id`, all
+        batches in one transaction. Existing leads take the new non-NULL
+        SYNC_MERGE_COLUMNS values. Leads seen for the first time go through
+        `merge_leads_bulk`, so they are merged into a lead with the same phone
+        number or email instead of duplicating it.
+
+        Args:
+            leads_in (List[LeadCreate]): Leads with a source_id, later duplicates win.
+
+        Returns:
+            Dict[str, int]: Number of `inserted` and `updated` synced leads, and of new
+            leads `merged` by phone number or email, or created.
+        """
+        latest = {(lead.source, lead.source_id): lead for lead in leads_in if lead.source_id}
+        if not latest:
+            return {"inserted": 0, "updated": 0, "merged": 0}
+
+        synced = {
+            (row["source"], row["source_id"])
+            for row in await self._find_merge_candidates(list(latest.values()))
+        }
+        new_leads = [lead for key, lead in latest.items() if key not in synced]
+        merged = len(await self.merge_leads_bulk(new_leads))
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                **jsonable_encoder(lead),
+                "is_active": True,
+                "updated_at": now,
+            }
+            for key, lead in latest.items()
+            if key in synced
+        ]
+
+        inserted = 0
+        async with database.transaction():
+            for start in range(0, len(rows), SYNC_BATCH_SIZE):
+                query = insert(leads).values(rows[start : start + SYNC_BATCH_SIZE])
+                update_values = {
+                    name: func.coalesce(query.excluded[name], leads.c[name])
+                    for name in SYNC_MERGE_COLUMNS
+                }
+                update_values["updated_at"] = query.excluded.updated_at
+                query = query.on_conflict_do_update(
+                    index_elements=[leads.c.source, leads.c.source_id], set_=update_values
+                ).returning(literal_column("(xmax = 0)").label("inserted"))
+                result = await database.fetch_all(query=query)
+                inserted += sum(1 for row in result if row["inserted"])
+
+        return {"inserted": inserted, "updated": len(rows) - inserted, "merged": merged}
+
 lead_repository = LeadRepository()
\ No newline at end of file
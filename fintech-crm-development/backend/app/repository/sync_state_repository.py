@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.session import database
+from app.models.sync_state import sync_state
+
+
+class SyncStateRepository:
+    """
+    Repository class for the per-source sync checkpoints.
+
+    Each external source keeps one row holding the high-water mark of the
+    records that have already been copied into the local store.
+    """
+
+    async def get(self, source: str):
+        """
+        Retrieve the sync checkpoint of a source.
+
+        Args:
+            source (str): The source key, e.g. "strapi_loan".
+
+        Returns:
+            Record: The checkpoint row or None if the source was never synced.
+        """
+        query = sync_state.select().where(sync_state.c.source == source)
+        return await database.fetch_one(query=query)
+
+    async def get_watermark(self, source: str) -> Optional[datetime]:
+        """
+        Retrieve the high-water mark of a source.
+
+        Args:
+            source (str): The source key.
+
+        Returns:
+            datetime: The last synced timestamp or None for a full sync.
+        """
+        row = await self.get(source)
+        return row["last_synced_at"] if row else None
+
+    async def set_watermark(
+        self, source: str, last_synced_at: Optional[datetime], cursor: Optional[str] = None
+    ):
+        """
+        Create or move the high-water mark of a source.
+
+        Args:
+            source (str): The source key.
+            last_synced_at (datetime): The newest timestamp that has been synced.
+            cursor (str, optional): Source specific resume cursor.
+        """
+        now = datetime.now(timezone.utc)
+        query = insert(sync_state).values(
+            source=source, last_synced_at=last_synced_at, cursor=cursor, updated_on=now
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[sync_state.c.source],
+            set_={"last_synced_at": last_synced_at, "cursor": cursor, "updated_on": now},
+        )
+        return await database.execute(query=query)
+
+
+sync_state_repository = SyncStateRepository()
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -6,6 +6,7 @@ from app.db.session import database
 from app.models.telecallers import telecallers, call_log, call_note, call_disposition
 from app.repository.base_repository import base_repository
 from app.enum.telecaller_status import TelecallerStatus
+from app.utils.pagination import keyset_paginate, split_page
 
 
 class TelecallerRepository:
@@ -94,15 +95,13 @@ class TelecallerRepository:
         query = call_log.select().where(call_log.c.call_id == call_id)
         return await database.fetch_one(query)
 
-    async def get_call_logs(
+    def _call_logs_query(
         self,
-        skip: int = 0,
-        limit: int = 100,
         user_id: Optional[str] = None,
         lead_id: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> List[Dict[str, Any]]:
+    ):
         query = call_log.select()
 
         if user_id:
@@ -117,9 +116,44 @@ class TelecallerRepository:
         if end_date:
             query = query.where(call_log.c.created_at <= end_date)
 
+        return query
+
+    async def get_call_logs(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        lead_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        query = self._call_logs_query(user_id, lead_id, start_date, end_date)
         query = query.order_by(call_log.c.created_at.desc()).offset(skip).limit(limit)
         return await database.fetch_all(query)
 
+    async def get_call_logs_keyset(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        lead_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get a page of call logs ordered by (created_at, id), newest first.
+
+        Call logs without created_at cannot be placed in that order, nor resumed
+        from a cursor, so they are left out.
+        """
+        query = self._call_logs_query(user_id, lead_id, start_date, end_date)
+        query = query.where(call_log.c.created_at.isnot(None))
+        query = keyset_paginate(
+            query, call_log.c.created_at, call_log.c.id, cursor=cursor, limit=limit
+        )
+        rows = await database.fetch_all(query)
+        return split_page(rows, limit, "created_at")
+
     async def update_call_log(self, id: UUID, obj_in: Dict[str, Any]) -> Dict[str, Any]:
         # Ensure call_end_time is a datetime object
         if "call_end_time" in obj_in and isinstance(obj_in["call_end_time"], str):
@@ -1,14 +1,19 @@
 import datetime
+import json
 import uuid
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+import sqlalchemy
 from fastapi.responses import JSONResponse
-from sqlalchemy import func, select
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from app.core.cache import lead_list_cache
 from app.db.session import database
 from app.models.user import users
 from app.schemas.user import UserCreate, UserCreateKafka, UserUpdate, UserUpdateDeatils
 from app.utils.cryptoUtil import verify_password
+from app.utils.pagination import keyset_paginate, split_page
 from app.schemas.user import UserCreateManual
 from app.schemas.user import UserCreateManual
 from app.db.session import database
@@ -19,6 +24,34 @@ from fastapi import HTTPException, status
 from app.schemas.user import UserUpdateRequest
 
 
+# Session-local staging table used by `bulk_upsert`, it is created per transaction
+# with CREATE TEMP TABLE, so it is kept out of the shared metadata
+users_staging = sqlalchemy.Table(
+    "users_staging",
+    sqlalchemy.MetaData(),
+    *[sqlalchemy.Column(column.name, column.type) for column in users.columns],
+)
+
+
+def _parse_message_time(value: Union[str, int, float, datetime, None]) -> Optional[datetime]:
+    """Read a message time given as epoch seconds or ISO 8601 as an aware datetime."""
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            value = float(value)
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    return None
+
+
 class UserRepository:
 
     def __init__(self, database):
@@ -62,6 +95,7 @@ class UserRepository:
             source=obj_in.source,
         )
         await database.execute(query=query)
+        await lead_list_cache.invalidate()
         return obj_in
 
     async def update_basic_details(self, obj_in: UserCreate, id=str):
@@ -83,7 +117,9 @@ class UserRepository:
                 updated_on=datetime.now(),
             )
         )
-        return await database.execute(query=query)
+        result = await database.execute(query=query)
+        await lead_list_cache.invalidate()
+        return result
 
     async def get_by_phone(self, phone: str):
         """
@@ -120,7 +156,7 @@ class UserRepository:
         elif name_order == "Z-A":
             query = query.where(users.c.full_name.isnot(None)).order_by(users.c.full_name.desc())
         else:
-            query = query.order_by(users.c.last_communicated.desc())
+            query = query.order_by(users.c.last_communicated.desc().nullslast())
 
         if search_query:
             for column, value in search_query.items():
@@ -128,6 +164,52 @@ class UserRepository:
 
         return await database.fetch_all(query=query)
 
+    async def get_list_users_keyset(
+        self,
+        name_order: str = None,
+        search_query: dict = None,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+    ):
+        """
+        Retrieve a page of users using keyset pagination.
+
+        Users are ordered by (updated_on, id) newest first, or by (full_name, id)
+        when a name order is requested, so deep pages cost the same as the first.
+
+        Args:
+            name_order (str, optional): Sorting order by name (A-Z or Z-A).
+            search_query (dict, optional): Search filters.
+            cursor (str, optional): The `next_cursor` returned with the previous page.
+            limit (int, optional): Number of records to return per page.
+
+        Returns:
+            Tuple[List[users], Optional[str]]: The page of users and the cursor of the next page.
+        """
+        query = users.select().where(users.c.is_active == True)
+
+        if search_query:
+            for column, value in search_query.items():
+                query = query.where(users.c[column].ilike(f"%{value}%"))
+
+        if name_order in ("A-Z", "Z-A"):
+            sort_key = "full_name"
+            query = query.where(users.c.full_name.isnot(None))
+        else:
+            sort_key = "updated_on"
+            query = query.where(users.c.updated_on.isnot(None))
+
+        query = keyset_paginate(
+            query,
+            users.c[sort_key],
+            users.c.id,
+            cursor=cursor,
+            limit=limit,
+            descending=name_order != "A-Z",
+        )
+        rows = await database.fetch_all(query=query)
+        return split_page(rows, limit, sort_key)
+
     async def users_count(self, search_query: dict = None, name_order: str = None):
         query = select([func.count()]).select_from(users).where(users.c.is_active == True)
         if search_query:
@@ -163,28 +245,59 @@ class UserRepository:
             )
             .returning(users.c.id)
         )
-        return await database.execute(query=query)
+        result = await database.execute(query=query)
+        await lead_list_cache.invalidate()
+        return result
 
-    async def update_last_communication(self, phone_number: str, response: str):
+    async def update_last_communication(
+        self, phone_number: str, response: Union[str, int, float, datetime]
+    ):
         """
-        Update last communication details in the system.
+        Move the last communication time of a user forward to a newer message.
+
+        Messages can be consumed out of order, so the stored time is only replaced
+        when the message is newer, keeping `last_communicated` equal to the time of
+        the latest message of the phone number.
 
         Args:
             phone_number (str): The phone number of the user to update.
-            response: The timestamps.
+            response: The message time, WhatsApp epoch seconds or an ISO 8601 string.
 
         Returns:
             str: The ID of the user.
         """
+        communicated_at = _parse_message_time(response)
+        if communicated_at is None:
+            return None
         query = (
             users.update()
             .where(phone_number == users.c.phone_number)
             .values(
-                last_communicated=response,
+                # GREATEST skips NULL, so the first message sets the time
+                last_communicated=func.greatest(users.c.last_communicated, communicated_at),
             )
             .returning(users.c.id)
         )
-        return await database.execute(query=query)
+        result = await database.execute(query=query)
+        await lead_list_cache.invalidate()
+        return result
+
+    async def increment_documents_count(self, user_id: str, delta: int):
+        """
+        Adjust the maintained active documents counter of a user.
+
+        Args:
+            user_id (str): The ID of the user.
+            delta (int): The number of documents added (or removed when negative).
+        """
+        query = (
+            users.update()
+            .where(users.c.id == user_id)
+            .values(documents_count=func.greatest(users.c.documents_count + delta, 0))
+        )
+        result = await database.execute(query=query)
+        await lead_list_cache.invalidate()
+        return result
 
     async def is_active(self, user: users):
         """
@@ -217,7 +330,9 @@ class UserRepository:
             )
             .returning(users.c.id)
         )
-        return await database.execute(query=query)
+        result = await database.execute(query=query)
+        await lead_list_cache.invalidate()
+        return result
 
     async def get_recent_users(self, days: int):
         """
@@ -250,7 +365,9 @@ class UserRepository:
                 updated_on=datetime.now(),
             )
         )
-        return await database.execute(query=query)
+        result = await database.execute(query=query)
+        await lead_list_cache.invalidate()
+        return result
 
     async def get_by_email_and_source(self, email: str, source: str):
         query = users.select().where((users.c.email == email) & (users.c.source == source))
@@ -275,7 +392,9 @@ class UserRepository:
             created_on=datetime.now(),
             updated_on=datetime.now(),
         )
-        return await self.database.execute(query)
+        result = await self.database.execute(query)
+        await lead_list_cache.invalidate()
+        return result
 
     async def create_manual(self, obj_in: UserCreateManual):
         print("Starting user creation process...")
@@ -336,6 +455,7 @@ class UserRepository:
         try:
             await self.database.execute(query=query)
             print("User inserted successfully.")
+            await lead_list_cache.invalidate()
         except Exception as e:
             print(f"Error inserting user into the database: {e}")
             raise HTTPException(
@@ -355,6 +475,113 @@ class UserRepository:
         print("User creation process completed successfully.")
         return created_user
 
+    async def bulk_upsert(
+        self,
+        records: List[Dict[str, Any]],
+        merge_columns: Sequence[str],
+        keep_existing: bool = False,
+        refresh_columns: Sequence[str] = (),
+    ) -> List[Any]:
+        """
+        Insert or merge many users in a single set-based statement.
+
+        The records are loaded with COPY into a temporary staging table and merged with
+        one INSERT ... SELECT ... ON CONFLICT (phone_number). On conflict the
+        `merge_columns` take the new value unless it is NULL, so blank cells never wipe
+        existing data. Records without a phone number are always inserted.
+
+        Args:
+            records (List[Dict[str, Any]]): User rows with the same keys, including a
+                generated `id`. Phone numbers must be unique within the batch.
+            merge_columns (Sequence[str]): Columns updated when the phone number exists.
+            keep_existing (bool, optional): Only fill columns that are still NULL instead
+                of overwriting them with the new values.
+            refresh_columns (Sequence[str], optional): Merge columns that take the new
+                value even when `keep_existing` is set.
+
+        Returns:
+            List[Record]: `id`, `phone_number` and `inserted` (False when merged) per row.
+        """
+        if not records:
+            return []
+
+        columns = list(records[0].keys())
+        json_columns = {
+            name for name in columns if isinstance(users.c[name].type, sqlalchemy.JSON)
+        }
+        rows = [
+            tuple(
+                json.dumps(record[name])
+                if name in json_columns and record[name] is not None
+                else record[name]
+                for name in columns
+            )
+            for record in records
+        ]
+
+        # Rows are locked in phone number order, so concurrent upserts cannot deadlock
+        query = pg_insert(users).from_select(
+            columns,
+            select([users_staging.c[name] for name in columns]).order_by(
+                users_staging.c.phone_number
+            ),
+        )
+        kept_columns = set(merge_columns) - set(refresh_columns) if keep_existing else set()
+        update_values = {
+            name: func.coalesce(users.c[name], query.excluded[name])
+            if name in kept_columns
+            else func.coalesce(query.excluded[name], users.c[name])
+            for name in merge_columns
+        }
+        if "updated_on" in columns:
+            update_values["updated_on"] = query.excluded.updated_on
+        query = query.on_conflict_do_update(
+            index_elements=[users.c.phone_number], set_=update_values
+        ).returning(
+            users.c.id, users.c.phone_number, literal_column("(xmax = 0)").label("inserted")
+        )
+
+        async with self.database.connection() as connection:
+            async with connection.transaction():
+                raw_connection = connection.raw_connection
+                await raw_connection.execute(
+                    "CREATE TEMP TABLE users_staging "
+                    "(LIKE users INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await raw_connection.copy_records_to_table(
+                    "users_staging", records=rows, columns=columns
+                )
+                upserted = await connection.fetch_all(query=query)
+        await lead_list_cache.invalidate()
+        return upserted
+
+    async def insert_many(self, records: List[Dict[str, Any]], batch_size: int = 1000):
+        """
+        Insert new users in batches with executemany.
+
+        Args:
+            records (List[Dict[str, Any]]): User rows holding every column of the statement,
+                `raw_data` already serialized to JSON.
+            batch_size (int, optional): Rows sent per executemany.
+        """
+        query = """
+            INSERT INTO users (
+                id, phone_number, full_name, country_code, email,
+                pan_number, loan_amount, employment_type, company_name,
+                monthly_income, loan_purpose, loan_tenure, raw_data,
+                cibil_score, source, created_on, updated_on
+            )
+            VALUES (
+                :id, :phone_number, :full_name, :country_code, :email,
+                :pan_number, :loan_amount, :employment_type, :company_name,
+                :monthly_income, :loan_purpose, :loan_tenure, :raw_data,
+                :cibil_score, :source, :created_on, :updated_on
+            )
+        """
+        for start in range(0, len(records), batch_size):
+            await self.database.execute_many(query, records[start : start + batch_size])
+        await lead_list_cache.invalidate()
+
     async def get_by_id(self, user_id: str):
         query = users.select().where(users.c.id == user_id)
         return await self.database.fetch_one(query=query)
@@ -395,6 +622,7 @@ class UserRepository:
             print(f"Updating user with ID {obj_in.id} in the database...")
             await self.database.execute(query=query)
             print("User updated successfully.")
+            await lead_list_cache.invalidate()
         except Exception as e:
             print(f"Error updating user in the database: {e}")
             raise HTTPException(
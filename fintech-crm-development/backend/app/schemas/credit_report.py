@@ -1,3 +1,4 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 
@@ -38,6 +39,20 @@ class CreditReportRequest(BaseModel):
     lead_source: Optional[str] = Field("Website", description="Source of the lead")
 
 
+class CibilPdfJobStatus(BaseModel):
+    """
+    Status of the background rendering of a credit report PDF
+    """
+
+    job_id: str
+    status: str  # queued, running, completed or failed
+    document_id: Optional[int] = Field(None, description="ID of the stored PDF once completed")
+    document_path: Optional[str] = None
+    detail: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
 class CreditReportResponse(BaseModel):
     """
     Response model for credit report
@@ -50,6 +65,9 @@ class CreditReportResponse(BaseModel):
     from_database: Optional[bool] = Field(
         None, description="Whether the report was retrieved from database"
     )
+    pdf_job: Optional[CibilPdfJobStatus] = Field(
+        None, description="PDF rendering job of a newly fetched report, poll it for the document"
+    )
 
 
 class CreditReportListItem(BaseModel):
@@ -81,9 +99,10 @@ class CreditReportListData(BaseModel):
     """
 
     reports: List[CreditReportListItem]
-    total: int
+    total: Optional[int]
     limit: int
     skip: int
+    next_cursor: Optional[str] = None
 
 
 class CreditReportListResponse(BaseModel):
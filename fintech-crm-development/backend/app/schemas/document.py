@@ -1,6 +1,6 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 
 
@@ -89,5 +89,32 @@ class DocumentList(DocumentBase):
     status: str
     is_active: bool
     document_name: str|None 
-    document_file_name: str|None 
-    
\ No newline at end of file
+    document_file_name: str|None
+
+
+class PhoneLookupDocument(DocumentList):
+    """
+    Document listed by /users/get-by-phone, where `document_name` has always held
+    the document type name. The name of the stored file is `file_name`.
+    """
+
+    file_name: Optional[str] = None
+
+
+class UploadSessionCreate(BaseModel):
+    document_type_id: int
+    document_type: DocumentType
+    document_size: int = Field(..., gt=0, example=200)
+    document_name: Optional[str] = None
+
+
+class UploadSession(BaseModel):
+    upload_url: str = Field(..., description="Pre-signed URL to PUT the file to")
+    upload_headers: Dict[str, str] = Field(..., description="Headers to send with the PUT")
+    session_token: str = Field(..., description="Token to complete the upload with")
+    document_path: str
+    expires_at: datetime
+
+
+class UploadSessionComplete(BaseModel):
+    session_token: str
@@ -53,11 +53,18 @@ class UserUpdate(UserCreate):
 
 class UserId(UserBase):
     id: str
-    last_communicated: Optional[str] = None
+    last_communicated: Optional[datetime] = None
     documents_count: Optional[int] = None
     created_on: datetime
 
 
+class UserList(BaseModel):
+    total_users: Optional[int] = None
+    total_documents_type: int
+    users: List[UserId]
+    next_cursor: Optional[str] = None
+
+
 class UserInDBBase(UserId):
     documents: list
 
@@ -175,8 +182,13 @@ class NewsletterSubscriberLead(UnifiedLeadBase):
 
 
 class CombinedDataResponse(BaseModel):
-    total_records: int = Field(..., description="Total number of records across all sources")
+    total_records: Optional[int] = Field(
+        ..., description="Total number of records across all sources"
+    )
     leads: List[UnifiedLeadBase] = Field(..., description="Combined list of leads from all sources")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page in cursor mode, null on the last page"
+    )
 
     class Config:
         json_schema_extra = {
@@ -257,7 +269,7 @@ class UserFull(UserBase):
     id: str
     created_on: datetime
     updated_on: datetime
-    last_communicated: Optional[str] = None
+    last_communicated: Optional[datetime] = None
     phone_number: Optional[str] = None  # Make phone_number optional
     is_active: Optional[bool] = True
     role: Optional[str] = "User"
@@ -332,5 +344,31 @@ class UserBulkUpload(BaseModel):
         return values
 
 
+class BulkUploadRowResult(BaseModel):
+    row: int
+    status: str  # created, updated or failed
+    user_id: Optional[str] = None
+    phone_number: Optional[str] = None
+    error: Optional[str] = None
+
+
 class BulkUploadResponse(BaseModel):
     detail: str
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    results: List[BulkUploadRowResult] = []
+
+
+class BulkImportJobStatus(BaseModel):
+    job_id: str
+    filename: str
+    status: str  # queued, running, completed or failed
+    processed_rows: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[BulkUploadRowResult] = []  # failed rows, capped
+    detail: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
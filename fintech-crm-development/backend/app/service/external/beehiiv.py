@@ -1,7 +1,7 @@
-import httpx
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.schemas.leads import LeadCreate, LeadSource
 
 class BeehiivService:
@@ -15,13 +15,13 @@ class BeehiivService:
 
     async def fetch_publications(self) -> List[Dict[str, Any]]:
         """Fetch all available publications"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/publications",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()["data"]
+        client = http_clients.get("beehiiv")
+        response = await client.get(
+            f"{self.base_url}/publications",
+            headers=self.headers
+        )
+        response.raise_for_status()
+        return response.json()["data"]
 
     async def fetch_subscribers(
         self, 
@@ -32,51 +32,64 @@ class BeehiivService:
     ) -> List[Dict[str, Any]]:
         """
         Fetch subscribers from Beehiiv with filters
-        
+
+        Subscribers are read oldest first, following the page cursor to the last page.
+
         Args:
             publication_id: Optional specific publication ID
             last_sync: Optional last sync timestamp
             status: Subscriber status (active, pending, etc.)
             subscription_tier: Optional specific tier
         """
-        async with httpx.AsyncClient() as client:
-            params = {
-                "limit": 100,
-                "status": status
-            }
+        client = http_clients.get("beehiiv")
+        params = {
+            "limit": 100,
+            "status": status,
+            "order_by": "created",
+            "direction": "asc"
+        }
             
-            if publication_id:
-                params["publication_id"] = publication_id
+        if publication_id:
+            params["publication_id"] = publication_id
             
-            if last_sync:
-                params["created_after"] = last_sync.isoformat()
+        if last_sync:
+            params["created_after"] = last_sync.isoformat()
             
-            if subscription_tier:
-                params["subscription_tier"] = subscription_tier
+        if subscription_tier:
+            params["subscription_tier"] = subscription_tier
 
+        subscribers = []
+        while True:
             response = await client.get(
                 f"{self.base_url}/subscribers",
                 headers=self.headers,
                 params=params
             )
             response.raise_for_status()
-            
-            return response.json()["data"]
+
+            data = response.json()
+            subscribers.extend(data["data"])
+
+            pagination = data.get("pagination", {})
+            cursor = pagination.get("next_cursor")
+            if not cursor or not pagination.get("has_more"):
+                return subscribers
+            params["cursor"] = cursor
 
     async def fetch_subscriptions_by_email(
         self,
         email: str
     ) -> List[Dict[str, Any]]:
         """Fetch all subscriptions for a specific email"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/subscribers/email/{email}",
-                headers=self.headers
-            )
-            if response.status_code == 404:
-                return []
-            response.raise_for_status()
-            return response.json()["data"]
+        client = http_clients.get("beehiiv")
+        response = await client.get(
+            f"{self.base_url}/subscribers/email/{email}",
+            headers=self.headers
+        )
+        if response.status_code == 404:
+            return []
+        response.raise_for_status()
+        return response.json()["data"]
 
     def transform_subscriber(
         self, 
@@ -0,0 +1,91 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.core.config import settings
+
+FetchPage = Callable[[int], Awaitable[Dict[str, Any]]]
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry network errors, rate limiting and server errors, not client errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+async def fetch_page_with_retry(fetch_page: FetchPage, page: int) -> Dict[str, Any]:
+    """Fetch a single page, retrying only that page on transient errors."""
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(settings.EXTERNAL_FETCH_PAGE_RETRIES),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    ):
+        with attempt:
+            return await fetch_page(page)
+
+
+def strapi_snapshot_filters(
+    field: str, since: Optional[datetime], until: datetime
+) -> Dict[str, str]:
+    """
+    Build the Strapi filters that pin a timestamp window for `fetch_strapi_pages`.
+
+    Records changed after `until` are left to the next sync, so the pages cannot
+    shift while they are fetched. `since` is inclusive, records sharing the
+    previous sync's last timestamp are read again rather than lost.
+
+    Args:
+        field (str): The timestamp field, e.g. "createdAt".
+        since (datetime, optional): Start of the window, None for a full sync.
+        until (datetime): End of the window, usually the start of the sync.
+    """
+    filters = {f"filters[{field}][$lte]": until.isoformat()}
+    if since:
+        filters[f"filters[{field}][$gte]"] = since.isoformat()
+    return filters
+
+
+async def fetch_strapi_pages(
+    fetch_page: FetchPage, concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every page of a Strapi collection.
+
+    The first page is read on its own to learn `meta.pagination.pageCount`, the
+    remaining pages are then requested concurrently, at most `concurrency` at a time.
+
+    Pages are plain offsets, so `fetch_page` must see the same ordered result set
+    on every call: sort on a unique key last and pin the rows with
+    `strapi_snapshot_filters`. Otherwise a record written or updated between two
+    page requests shifts the offsets and another record is skipped.
+
+    Args:
+        fetch_page (FetchPage): Coroutine returning the decoded response of a 1-based page.
+        concurrency (int, optional): Pages in flight, EXTERNAL_FETCH_CONCURRENCY by default.
+
+    Returns:
+        List[Dict[str, Any]]: The responses of all pages in page order.
+    """
+    first = await fetch_page_with_retry(fetch_page, 1)
+    page_count = first.get("meta", {}).get("pagination", {}).get("pageCount") or 1
+    if page_count <= 1:
+        return [first]
+
+    semaphore = asyncio.Semaphore(concurrency or settings.EXTERNAL_FETCH_CONCURRENCY)
+
+    async def bounded(page: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch_page_with_retry(fetch_page, page)
+
+    rest = await asyncio.gather(*(bounded(page) for page in range(2, page_count + 1)))
+    return [first, *rest]
@@ -1,8 +1,12 @@
-import httpx
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.schemas.leads import LeadCreate, LeadSource
+from app.service.external.paginator import fetch_strapi_pages, strapi_snapshot_filters
+
+# Largest page Strapi serves with its default maxLimit
+PAGE_SIZE = 100
 
 class StrapiService:
     def __init__(self):
@@ -28,37 +32,24 @@ class StrapiService:
             "loan_amount_gt": 50000
         }
         """
-        async with httpx.AsyncClient() as client:
-            # Build query parameters
-            params = {
-                "populate": "*",  # Get all relationships
-                "sort": "createdAt:desc"
-            }
-            
-            if last_sync:
-                params["filters[createdAt][$gt]"] = last_sync.isoformat()
+        # Build query parameters
+        params = {
+            "populate": "*",  # Get all relationships
+        }
 
-            # Add custom filters
-            if filters:
-                for key, value in filters.items():
-                    if key.endswith('_gt'):
-                        base_key = key[:-3]
-                        params[f"filters[{base_key}][$gt]"] = value
-                    elif key.endswith('_lt'):
-                        base_key = key[:-3]
-                        params[f"filters[{base_key}][$lt]"] = value
-                    else:
-                        params[f"filters[{key}][$eq]"] = value
+        # Add custom filters
+        if filters:
+            for key, value in filters.items():
+                if key.endswith('_gt'):
+                    base_key = key[:-3]
+                    params[f"filters[{base_key}][$gt]"] = value
+                elif key.endswith('_lt'):
+                    base_key = key[:-3]
+                    params[f"filters[{base_key}][$lt]"] = value
+                else:
+                    params[f"filters[{key}][$eq]"] = value
 
-            response = await client.get(
-                f"{self.base_url}/api/leads",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            
-            data = response.json()["data"]
-            return data
+        return await self._fetch_created_since("/api/leads", params, last_sync)
 
     async def fetch_specific_form_submissions(
         self,
@@ -66,23 +57,41 @@ class StrapiService:
         last_sync: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """Fetch submissions from a specific form"""
-        async with httpx.AsyncClient() as client:
-            params = {
-                "populate": "*",
-                "filters[form][id][$eq]": form_id
-            }
-            
-            if last_sync:
-                params["filters[createdAt][$gt]"] = last_sync.isoformat()
+        params = {
+            "populate": "*",
+            "filters[form][id][$eq]": form_id
+        }
+        return await self._fetch_created_since("/api/form-submissions", params, last_sync)
+
+    async def _fetch_created_since(
+        self, path: str, params: Dict[str, Any], last_sync: Optional[datetime]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every record of a collection created since `last_sync`, oldest first.
 
+        All pages are read within one `strapi_snapshot_filters` window, so the
+        newest createdAt returned is a safe checkpoint for the next sync.
+        """
+        client = http_clients.get("strapi")
+        params = {
+            **params,
+            **strapi_snapshot_filters("createdAt", last_sync, datetime.now(timezone.utc)),
+            "sort[0]": "createdAt:asc",
+            "sort[1]": "id:asc",
+            "pagination[pageSize]": PAGE_SIZE,
+        }
+
+        async def fetch_page(page: int) -> Dict[str, Any]:
             response = await client.get(
-                f"{self.base_url}/api/form-submissions",
+                f"{self.base_url}{path}",
                 headers=self.headers,
-                params=params
+                params={**params, "pagination[page]": page}
             )
             response.raise_for_status()
-            
-            return response.json()["data"]
+            return response.json()
+
+        pages = await fetch_strapi_pages(fetch_page)
+        return [record for page in pages for record in page["data"]]
 
     def transform_lead(self, strapi_lead: Dict[str, Any]) -> LeadCreate:
         """Transform Strapi lead data to our lead schema"""
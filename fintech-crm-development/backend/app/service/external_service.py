@@ -4,7 +4,8 @@ import httpx
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from app.core.config import settings
-import asyncio
+from app.core.http_client import http_clients
+from app.service.external.paginator import fetch_strapi_pages, strapi_snapshot_filters
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 class ExternalDataRepository:
@@ -23,114 +24,111 @@ class ExternalDataRepository:
                    self.beehiiv_api_key, self.beehiiv_publication_id]):
             raise ValueError("Missing required environment variables")
 
-        # Initialize HTTP client with default timeout
-        self.timeout = httpx.Timeout(30.0)
 
 
-
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def fetch_strapi_loan_applications(self) -> List[Dict]:
+    async def fetch_strapi_loan_applications(self, since: Optional[datetime] = None) -> List[Dict]:
         """
-        Fetch all loan applications from Strapi using pagination with retry logic.
+        Fetch all loan applications from Strapi, the pages after the first concurrently.
+        Only applications created after `since` are fetched when it is given.
         """
-        headers = {
-            'Authorization': f'Bearer {self.strapi_api_token}',
-            'Content-Type': 'application/json'
-        }
-        
         url = f"{self.strapi_base_url}/api/loan-applies"
-        page = 1
-        page_size = 100  # Max records per request
-        all_applications = []
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                while True:
-                    params = {
-                        'pagination[page]': page,
-                        'pagination[pageSize]': page_size,
-                        'sort': 'createdAt:desc'
-                    }
-
-                    response = await client.get(url, headers=headers, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    applications = [
-                        {
-                            'id': app.get('id'),
-                            'documentId': app.get('documentId'),
-                            'name': app.get('name'),
-                            'email': app.get('email'),
-                            'phone_number': app.get('phone_number'),
-                            'amount': app.get('amount'),
-                            'loan_type': app.get('loan_type'),
-                            'createdAt': app.get('createdAt'),
-                            'source': 'strapi_loan'
-                        }
-                        for app in data.get('data', [])
-                    ]
-
-                    if not applications:
-                        break  # Stop fetching if no more records
-
-                    all_applications.extend(applications)
-                    page += 1  # Move to the next page
-
-            return all_applications
+        pages = await self._fetch_strapi_collection(url, page_size=100, since=since)
+        return [
+            {
+                'id': app.get('id'),
+                'documentId': app.get('documentId'),
+                'name': app.get('name'),
+                'email': app.get('email'),
+                'phone_number': app.get('phone_number'),
+                'amount': app.get('amount'),
+                'loan_type': app.get('loan_type'),
+                'createdAt': app.get('createdAt'),
+                'source': 'strapi_loan'
+            }
+            for data in pages
+            for app in data.get('data', [])
+        ]
 
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(status_code=e.response.status_code, detail=f"Strapi REST error: {e.response.text}")
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Network error occurred: {e}")
+    async def fetch_strapi_cibil_users(
+        self, page_size: int = 1000, since: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Fetch all CIBIL users from Strapi, the pages after the first concurrently.
+        CIBIL scores are refreshed in place, so users are read by `updatedAt` and only
+        users changed after `since` are fetched when it is given.
+        """
+        url = f"{self.strapi_base_url}/api/cibil-check-users"
+        pages = await self._fetch_strapi_collection(
+            url, page_size=page_size, since=since, watermark_field='updatedAt'
+        )
+        return [
+            {
+                'id': user.get('id'),
+                'documentId': user.get('documentId'),
+                'name': f"{user.get('first_name')} {user.get('last_name')}".strip(),
+                'phone_number': user.get('mobile_number'),
+                'pan_number': user.get('pan_number'),
+                'cibil_score': user.get('CIBIL_score'),
+                'createdAt': user.get('createdAt'),
+                'updatedAt': user.get('updatedAt'),
+                'source': 'strapi_cibil'
+            }
+            for data in pages
+            for user in data.get('data', [])
+        ]
+
+    async def _fetch_strapi_collection(
+        self,
+        url: str,
+        page_size: int,
+        since: Optional[datetime] = None,
+        watermark_field: str = 'createdAt',
+    ) -> List[Dict]:
+        """
+        Fetch every page of a Strapi collection with `fetch_strapi_pages`.
 
+        Records are read in ascending (`watermark_field`, id) order within a window
+        ending when the fetch starts. An update during the fetch moves a record out
+        of the window instead of shifting the pages, the next sync picks it up. The
+        window starts at `since` inclusive, so records sharing the watermark are
+        read again rather than dropped.
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def fetch_strapi_cibil_users(self, page: int = 1, page_size: int = 1000) -> List[Dict]:
-        """
-        Fetch CIBIL users from Strapi with retry logic
+        Returns:
+            List[Dict]: The decoded responses of all pages.
         """
         headers = {
             'Authorization': f'Bearer {self.strapi_api_token}',
             'Content-Type': 'application/json'
         }
-
-        url = f"{self.strapi_base_url}/api/cibil-check-users"
-        params = {
-            'pagination[page]': page,
-            'pagination[pageSize]': page_size,
-            'sort': 'first_name:asc'
-        }
+        client = http_clients.get("strapi")
+        window = strapi_snapshot_filters(watermark_field, since, datetime.now(timezone.utc))
+
+        async def fetch_page(page: int) -> Dict:
+            params = {
+                'pagination[page]': page,
+                'pagination[pageSize]': page_size,
+                'sort[0]': f'{watermark_field}:asc',
+                'sort[1]': 'id:asc',
+                **window,
+            }
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            return response.json()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                users = []
-                for user in data.get('data', []):
-                    user_data = {
-                        'id': user.get('id'),
-                        'documentId': user.get('documentId'),
-                        'name': f"{user.get('first_name')} {user.get('last_name')}".strip(),
-                        'phone_number': user.get('mobile_number'),
-                        'pan_number': user.get('pan_number'),
-                        'cibil_score': user.get('CIBIL_score'),
-                        'createdAt': user.get('createdAt'),
-                        'source': 'strapi_cibil'
-                    }
-                    users.append(user_data)
-                return users
-            
+            return await fetch_strapi_pages(fetch_page)
         except httpx.HTTPStatusError as e:
             raise HTTPException(status_code=e.response.status_code, detail=f"Strapi REST error: {e.response.text}")
-        
+        except httpx.RequestError as e:
+            raise HTTPException(status_code=503, detail=f"Network error occurred: {e}")
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    async def fetch_beehiiv_subscribers(self) -> List[Dict]:
+    async def fetch_beehiiv_subscribers(self, since: Optional[datetime] = None) -> List[Dict]:
         """
-        Fetch subscribers from Beehiiv with retry logic and pagination
+        Fetch subscribers from Beehiiv with retry logic and pagination.
+        Subscriptions are read newest first, so paging stops at the first
+        subscriber created before `since` when it is given. Subscribers created
+        in the same second as `since` are read again, the upsert is idempotent.
         """
         headers = {
             "Authorization": f"Bearer {self.beehiiv_api_key}",
@@ -141,38 +139,43 @@ class ExternalDataRepository:
         cursor: Optional[str] = None
         
         try:
+            client = http_clients.get("beehiiv")
             while True:
                 endpoint = f"/publications/{self.beehiiv_publication_id}/subscriptions"
-                params = {"limit": 100}
+                params = {"limit": 100, "order_by": "created", "direction": "desc"}
                 if cursor:
                     params["cursor"] = cursor
                 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(
-                        f"{self.beehiiv_base_url}{endpoint}",
-                        headers=headers,
-                        params=params
-                    )
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    
-                    for subscriber in data.get('data', []):
-                        subscriber_data = {
-                            'id': subscriber.get('id'),
-                            'email': subscriber.get('email'),
-                            'status': subscriber.get('status'),
-                            'createdAt': self.parse_unix_timestamp(subscriber.get('created')),
-                            'source': 'beehiiv'
-                        }
-                        all_subscribers.append(subscriber_data)
-                    
-                    pagination = data.get("pagination", {})
-                    cursor = pagination.get("next_cursor")
-                    
-                    if not cursor or not pagination.get("has_more"):
+                response = await client.get(
+                    f"{self.beehiiv_base_url}{endpoint}",
+                    headers=headers,
+                    params=params
+                )
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                reached_watermark = False
+                for subscriber in data.get('data', []):
+                    created = subscriber.get('created')
+                    if since and created and created < int(since.timestamp()):
+                        reached_watermark = True
                         break
-            
+                    subscriber_data = {
+                        'id': subscriber.get('id'),
+                        'email': subscriber.get('email'),
+                        'status': subscriber.get('status'),
+                        'createdAt': self.parse_unix_timestamp(subscriber.get('created')),
+                        'source': 'beehiiv'
+                    }
+                    all_subscribers.append(subscriber_data)
+                
+                pagination = data.get("pagination", {})
+                cursor = pagination.get("next_cursor")
+                
+                if reached_watermark or not cursor or not pagination.get("has_more"):
+                    break
+        
             return all_subscribers
 
         except httpx.HTTPStatusError as e:
@@ -182,29 +185,6 @@ class ExternalDataRepository:
             raise HTTPException(status_code=503, 
                               detail="Service temporarily unavailable")
 
-    async def get_all_external_data(self) -> Dict:
-        """
-        Fetch all external data concurrently from different sources
-        """
-        try:
-            # Fetch all data concurrently
-             #cibil_users,
-            loan_applications, cibil_users, subscribers = await asyncio.gather(
-                self.fetch_strapi_loan_applications(),
-                self.fetch_strapi_cibil_users(),
-                self.fetch_beehiiv_subscribers()
-            )
-            
-            return {
-                'loan_applications': loan_applications,
-                'cibil_users': cibil_users,
-                'subscribers': subscribers
-            }
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error fetching external data: {str(e)}"
-            )
     def parse_unix_timestamp(self,timestamp: int) -> str:
         """Convert Unix timestamp to formatted datetime string with timezone +0530"""
         dt_utc = datetime.fromtimestamp(timestamp, tz=timezone.utc)  # Convert to UTC
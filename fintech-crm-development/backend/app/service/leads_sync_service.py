@@ -1,40 +1,123 @@
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import asyncio
+from app.core.config import settings
 from app.repository.lead_repository import lead_repository
+from app.repository.sync_state_repository import sync_state_repository
 from app.service.external.strapi import StrapiService
 from app.service.external.beehiiv import BeehiivService
 from app.core.logger import logger
 
 class LeadSyncService:
+    """
+    Delta sync of Strapi leads and Beehiiv subscribers into the `leads` table.
+
+    Every sync scope (source plus its filters) keeps a checkpoint in `sync_state`
+    holding the newest creation time already synced, so each run only requests
+    records created since it. Leads are merged in bulk on (source, source_id), new
+    ones by phone number or email.
+    """
+
     def __init__(self):
         self.strapi_service = StrapiService()
         self.beehiiv_service = BeehiivService()
+        self.sync_state_repository = sync_state_repository
+        self._task: Optional[asyncio.Task] = None
+
+    def _checkpoint_key(self, source: str, **scope: Any) -> str:
+        """Build the sync_state key of a source and the filters it is synced with."""
+        parts = [f"leads:{source}"]
+        for name, value in sorted(scope.items()):
+            if isinstance(value, dict):
+                value = ",".join(f"{k}={v}" for k, v in sorted(value.items()))
+            if value:
+                parts.append(f"{name}={value}")
+        return ":".join(parts)
+
+    def _parse_created(self, value: Any) -> Optional[datetime]:
+        """Read an ISO 8601 string or unix timestamp as an aware datetime."""
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+        if isinstance(value, str):
+            try:
+                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+        return None
+
+    async def _sync(
+        self,
+        key: str,
+        last_sync: Optional[datetime],
+        full: bool,
+        fetch,
+        transform,
+        created_of,
+    ) -> Dict[str, int]:
+        """
+        Fetch, merge and checkpoint one sync scope.
+
+        An explicit `last_sync` wins over the stored checkpoint, `full` ignores both.
+        `fetch` returns every record since the checkpoint, across all pages. The
+        checkpoint only moves forward after the merge committed, so a failed run is
+        retried from the same point.
+        """
+        since = last_sync
+        if since is None and not full:
+            since = await self.sync_state_repository.get_watermark(key)
+
+        records = await fetch(since)
+        leads_in = [transform(record) for record in records]
+        counts = await lead_repository.upsert_by_source_id(
+            [lead for lead in leads_in if lead.source_id]
+        )
+        # Leads without a source id can only be matched by phone number or email
+        unkeyed = [lead for lead in leads_in if not lead.source_id]
+        if unkeyed:
+            counts["merged"] += len(await lead_repository.merge_leads_bulk(unkeyed))
+
+        watermark = since
+        for record in records:
+            created = self._parse_created(created_of(record))
+            if created and (watermark is None or created > watermark):
+                watermark = created
+        if watermark is not None:
+            await self.sync_state_repository.set_watermark(key, watermark)
+        return {"fetched": len(records), **counts}
 
     async def sync_strapi_leads(
-        self, 
+        self,
         last_sync: Optional[datetime] = None,
         filters: Optional[Dict[str, Any]] = None,
-        form_id: Optional[str] = None
-    ):
+        form_id: Optional[str] = None,
+        full: bool = False,
+    ) -> Dict[str, int]:
         """Sync leads from Strapi with filters"""
         try:
             if form_id:
-                leads = await self.strapi_service.fetch_specific_form_submissions(
+                key = self._checkpoint_key("strapi", form=form_id)
+                fetch = lambda since: self.strapi_service.fetch_specific_form_submissions(
                     form_id=form_id,
-                    last_sync=last_sync
+                    last_sync=since
                 )
             else:
-                leads = await self.strapi_service.fetch_leads(
-                    last_sync=last_sync,
+                key = self._checkpoint_key("strapi", filters=filters)
+                fetch = lambda since: self.strapi_service.fetch_leads(
+                    last_sync=since,
                     filters=filters
                 )
 
-            for lead_data in leads:
-                transformed_lead = self.strapi_service.transform_lead(lead_data)
-                await lead_repository.merge_or_update_lead(transformed_lead)
-            
-            logger.info(f"Successfully synced {len(leads)} leads from Strapi")
+            counts = await self._sync(
+                key,
+                last_sync,
+                full,
+                fetch,
+                self.strapi_service.transform_lead,
+                lambda lead: (lead.get("attributes") or lead).get("createdAt"),
+            )
+            logger.info(f"Successfully synced leads from Strapi: {counts}")
+            return counts
         except Exception as e:
             logger.error(f"Error syncing Strapi leads: {str(e)}")
             raise
@@ -43,8 +126,9 @@ class LeadSyncService:
         self,
         publication_id: Optional[str] = None,
         last_sync: Optional[datetime] = None,
-        subscription_tier: Optional[str] = None
-    ):
+        subscription_tier: Optional[str] = None,
+        full: bool = False,
+    ) -> Dict[str, int]:
         """Sync subscribers from Beehiiv for specific publication"""
         try:
             # Fetch publication details if ID provided
@@ -56,20 +140,25 @@ class LeadSyncService:
                     None
                 )
 
-            subscribers = await self.beehiiv_service.fetch_subscribers(
-                publication_id=publication_id,
-                last_sync=last_sync,
-                subscription_tier=subscription_tier
-            )
-
-            for subscriber in subscribers:
-                transformed_lead = self.beehiiv_service.transform_subscriber(
+            counts = await self._sync(
+                self._checkpoint_key(
+                    "beehiiv", publication=publication_id, tier=subscription_tier
+                ),
+                last_sync,
+                full,
+                lambda since: self.beehiiv_service.fetch_subscribers(
+                    publication_id=publication_id,
+                    last_sync=since,
+                    subscription_tier=subscription_tier
+                ),
+                lambda subscriber: self.beehiiv_service.transform_subscriber(
                     subscriber,
                     publication_data
-                )
-                await lead_repository.merge_or_update_lead(transformed_lead)
-
-            logger.info(f"Successfully synced {len(subscribers)} subscribers from Beehiiv")
+                ),
+                lambda subscriber: subscriber.get("created") or subscriber.get("created_at"),
+            )
+            logger.info(f"Successfully synced subscribers from Beehiiv: {counts}")
+            return counts
         except Exception as e:
             logger.error(f"Error syncing Beehiiv subscribers: {str(e)}")
             raise
@@ -78,10 +167,41 @@ class LeadSyncService:
         self,
         last_sync: Optional[datetime] = None,
         strapi_filters: Optional[Dict[str, Any]] = None,
-        beehiiv_publication_id: Optional[str] = None
-    ):
+        beehiiv_publication_id: Optional[str] = None,
+        full: bool = False,
+    ) -> Dict[str, Dict[str, int]]:
         """Sync leads from all sources with filters"""
-        await asyncio.gather(
-            self.sync_strapi_leads(last_sync, strapi_filters),
-            self.sync_beehiiv_subscribers(beehiiv_publication_id, last_sync)
-        )
\ No newline at end of file
+        strapi, beehiiv = await asyncio.gather(
+            self.sync_strapi_leads(last_sync, strapi_filters, full=full),
+            self.sync_beehiiv_subscribers(beehiiv_publication_id, last_sync, full=full)
+        )
+        return {"strapi": strapi, "beehiiv": beehiiv}
+
+    async def run_forever(self):
+        """Run a delta sync of all sources every LEAD_SYNC_INTERVAL seconds until cancelled."""
+        while True:
+            try:
+                await self.sync_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Scheduled lead sync failed")
+            await asyncio.sleep(settings.LEAD_SYNC_INTERVAL)
+
+    def start(self):
+        """Schedule the sync loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self):
+        """Cancel the sync loop and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+lead_sync_service = LeadSyncService()
@@ -0,0 +1,314 @@
+import asyncio
+import os
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from cachetools import TTLCache
+from fastapi import UploadFile
+from openpyxl import load_workbook
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.repository.user_repository import user_repository
+from app.schemas.user import BulkImportJobStatus, BulkUploadResponse, BulkUploadRowResult
+
+# Spreadsheet headers (case-insensitive) mapped to UserBulkUpload fields
+FIELD_MAPPING = {
+    "Full Name": "full_name",
+    "Contact Number": "phone_number",
+    "Email ID": "email",
+    "Location": "location",
+    "PAN Number": "pan_number",
+    "CIBIL": "cibil_score",
+    "Lead Source": "source",
+    "Employment Type": "employment_type",
+    "Annual Income": "annual_income",
+    "Loan Type": "loan_purpose",
+    "Loan Amount Required": "loan_amount_required",
+}
+
+# Columns refreshed from the sheet when the phone number already exists
+MERGE_COLUMNS = (
+    "full_name",
+    "email",
+    "country_code",
+    "pan_number",
+    "cibil_score",
+    "source",
+    "employment_type",
+    "loan_purpose",
+    "loan_amount",
+    "monthly_income",
+    "location",
+)
+
+TEXT_COLUMNS = (
+    "full_name",
+    "phone_number",
+    "email",
+    "location",
+    "pan_number",
+    "source",
+    "employment_type",
+    "loan_purpose",
+)
+
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+SPOOL_CHUNK_BYTES = 1024 * 1024
+MAX_JOB_ERRORS = 1000
+
+
+class BulkImportService:
+    """
+    Set-based import of users from partner spreadsheets.
+
+    Rows are validated column by column with pandas instead of one pydantic model per
+    row, then every valid row is written with a single COPY + INSERT ... ON CONFLICT
+    through `user_repository.bulk_upsert`.
+
+    Large sheets are imported by background jobs that spool the upload to disk and
+    parse and commit it in BULK_IMPORT_CHUNK_SIZE row batches, so memory use does not
+    grow with the file. Job status is kept in process for a day.
+    """
+
+    def __init__(self):
+        self.user_repository = user_repository
+        self._jobs: TTLCache = TTLCache(maxsize=100, ttl=24 * 60 * 60)
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Map the sheet headers to field names and strip every value."""
+        normalized_field_mapping = {k.lower(): v for k, v in FIELD_MAPPING.items()}
+        columns = {
+            column: normalized_field_mapping[str(column).strip().lower()]
+            for column in df.columns
+            if str(column).strip().lower() in normalized_field_mapping
+        }
+        df = df[list(columns)].rename(columns=columns)
+        df = df.loc[:, ~df.columns.duplicated()]
+        df = df.reindex(columns=list(FIELD_MAPPING.values()), fill_value="")
+        return df.fillna("").astype(str).apply(lambda column: column.str.strip())
+
+    def validate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Validate all rows of the sheet in one vectorised pass.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.Series]: The normalized rows and the first validation
+            error of each row, an empty string for valid rows.
+        """
+        has_full_name = any(str(column).strip().lower() == "full name" for column in df.columns)
+        df = self._normalize(df)
+        errors = pd.Series("", index=df.index)
+
+        def add_error(mask: pd.Series, message: str):
+            errors[mask & (errors == "")] = message
+
+        if not has_full_name:
+            add_error(pd.Series(True, index=df.index), "Full Name is required")
+
+        add_error(
+            (df["email"] == "") & (df["phone_number"] == ""),
+            "Either email or phone_number must be present",
+        )
+        add_error(
+            (df["email"] != "") & ~df["email"].str.match(EMAIL_PATTERN),
+            "Invalid email address",
+        )
+        for column in ("cibil_score", "annual_income", "loan_amount_required"):
+            values = pd.to_numeric(df[column].where(df[column] != ""), errors="coerce")
+            add_error((df[column] != "") & values.isna(), f"Invalid number for {column}")
+            df[column] = values
+        add_error(df["cibil_score"].notna() & (df["cibil_score"] % 1 != 0), "Invalid CIBIL score")
+
+        # ON CONFLICT can only touch a row once per statement, the first occurrence wins
+        add_error(
+            (errors == "")
+            & (df["phone_number"] != "")
+            & df["phone_number"].where(errors == "").duplicated(keep="first"),
+            "Duplicate phone number in file",
+        )
+        return df, errors
+
+    def build_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Convert validated rows to `users` records."""
+        now = datetime.now(timezone.utc)
+        text = df[list(TEXT_COLUMNS)]
+        text = text.where(text != "", None)
+        records = pd.DataFrame(
+            {
+                "id": [str(uuid.uuid4()) for _ in range(len(df))],
+                **{column: text[column] for column in TEXT_COLUMNS},
+                "country_code": text["phone_number"].str[:2],
+                "cibil_score": df["cibil_score"].astype("Int64"),
+                "loan_amount": df["loan_amount_required"],
+                "monthly_income": df["annual_income"] / 12,
+                "status": "New",
+                "is_active": True,
+                "role": "User",
+            },
+            index=df.index,
+        )
+        records = records.astype(object).where(records.notna(), None).to_dict("records")
+        for record in records:
+            if record["cibil_score"] is not None:
+                record["cibil_score"] = int(record["cibil_score"])
+            record["created_on"] = now
+            record["updated_on"] = now
+        return records
+
+    async def import_users(self, df: pd.DataFrame, row_offset: int = 0) -> BulkUploadResponse:
+        """
+        Validate and upsert all rows of a sheet.
+
+        Args:
+            df (pd.DataFrame): The sheet rows, read as strings.
+            row_offset (int, optional): Rows of the sheet before this chunk.
+
+        Returns:
+            BulkUploadResponse: Totals and the outcome of every row (1-based).
+        """
+        df, errors = self.validate(df.reset_index(drop=True))
+        valid = errors == ""
+        results: Dict[int, BulkUploadRowResult] = {
+            row_offset + index + 1: BulkUploadRowResult(
+                row=row_offset + index + 1, status="failed", error=error
+            )
+            for index, error in errors[~valid].items()
+        }
+
+        records = self.build_records(df[valid])
+        row_by_key = {}
+        for index, record in zip(df.index[valid], records):
+            row_by_key[record["phone_number"] or record["id"]] = row_offset + index + 1
+
+        upserted = await self.user_repository.bulk_upsert(records, MERGE_COLUMNS)
+        for user in upserted:
+            row = row_by_key[user["phone_number"] or user["id"]]
+            results[row] = BulkUploadRowResult(
+                row=row,
+                status="created" if user["inserted"] else "updated",
+                user_id=user["id"],
+                phone_number=user["phone_number"],
+            )
+
+        ordered = [results[row] for row in sorted(results)]
+        created = sum(result.status == "created" for result in ordered)
+        updated = sum(result.status == "updated" for result in ordered)
+        failed = sum(result.status == "failed" for result in ordered)
+        logger.info(f"Bulk upload: {created} created, {updated} updated, {failed} failed")
+        return BulkUploadResponse(
+            detail=f"{created} users created successfully, {updated} updated, {failed} failed",
+            created=created,
+            updated=updated,
+            failed=failed,
+            results=ordered,
+        )
+
+    async def spool_upload(self, file: UploadFile) -> str:
+        """
+        Copy an upload to a temporary file in fixed-size blocks.
+
+        Returns:
+            str: Path of the spooled file, removed by `run_import_job`.
+        """
+        suffix = os.path.splitext(file.filename or "")[1]
+        fd, path = tempfile.mkstemp(prefix="bulk-upload-", suffix=suffix)
+        with os.fdopen(fd, "wb") as spool:
+            while True:
+                block = await file.read(SPOOL_CHUNK_BYTES)
+                if not block:
+                    break
+                spool.write(block)
+        return path
+
+    def create_job(self, filename: str) -> BulkImportJobStatus:
+        job = BulkImportJobStatus(job_id=str(uuid.uuid4()), filename=filename, status="queued")
+        self._jobs[job.job_id] = job
+        return job
+
+    def get_job(self, job_id: str) -> Optional[BulkImportJobStatus]:
+        return self._jobs.get(job_id)
+
+    def _iter_csv_chunks(self, path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        return pd.read_csv(path, dtype=str, chunksize=chunk_size)
+
+    def _iter_xlsx_chunks(self, path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Read the first worksheet with openpyxl's read-only row iterator."""
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = ["" if value is None else str(value) for value in header]
+
+            batch = []
+            for row in rows:
+                values = ["" if value is None else str(value) for value in row[: len(columns)]]
+                if not any(values):
+                    continue
+                batch.append(values + [""] * (len(columns) - len(values)))
+                if len(batch) >= chunk_size:
+                    yield pd.DataFrame(batch, columns=columns)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=columns)
+        finally:
+            workbook.close()
+
+    async def run_import_job(self, job_id: str, path: str):
+        """
+        Import a spooled sheet chunk by chunk, each chunk is committed on its own.
+
+        Parsing runs in a worker thread so the event loop keeps serving requests.
+        """
+        job = self._jobs[job_id]
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+
+        chunk_size = settings.BULK_IMPORT_CHUNK_SIZE
+        chunks = None
+        try:
+            # read_csv parses the header right away, an empty or broken file fails here
+            if path.endswith(".xlsx"):
+                chunks = self._iter_xlsx_chunks(path, chunk_size)
+            else:
+                chunks = self._iter_csv_chunks(path, chunk_size)
+
+            while True:
+                df = await asyncio.to_thread(next, chunks, None)
+                if df is None:
+                    break
+
+                result = await self.import_users(df.fillna(""), row_offset=job.processed_rows)
+                job.processed_rows += len(df)
+                job.created += result.created
+                job.updated += result.updated
+                job.failed += result.failed
+                remaining = MAX_JOB_ERRORS - len(job.errors)
+                if remaining > 0:
+                    job.errors.extend(
+                        [row for row in result.results if row.status == "failed"][:remaining]
+                    )
+
+            job.status = "completed"
+            job.detail = (
+                f"{job.created} users created successfully, "
+                f"{job.updated} updated, {job.failed} failed"
+            )
+        except Exception as e:
+            logger.error(f"Bulk import job {job_id} failed: {e}")
+            job.status = "failed"
+            job.detail = str(e)
+        finally:
+            if chunks is not None:
+                chunks.close()
+            job.finished_at = datetime.now(timezone.utc)
+            os.remove(path)
+
+
+bulk_import_service = BulkImportService()
@@ -1,10 +1,10 @@
 import json
-import httpx
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.repository.call_repository import (
     telecaller_repository,
     call_log_repository,
@@ -89,35 +89,35 @@ class AlohaaService:
 
         # Make the API call to Alohaa
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://outgoing-call.alohaa.ai/v1/external/click-2-call",
-                    json=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "x-metro-api-key": settings.ALOHAA_API_KEY,
-                    },
-                )
-
-                response_data = response.json()
-
-                # Create a call log entry
-                call_log_data = {
-                    "telecaller_id": telecaller_id,
-                    "lead_id": lead_id,
-                    "caller_number": telecaller["phone_number"],
-                    "receiver_number": receiver_number,
-                    "did_number": settings.ALOHAA_DID_NUMBER,
-                    "call_start_time": datetime.now(),
-                }
+            client = http_clients.get("alohaa")
+            response = await client.post(
+                "https://outgoing-call.alohaa.ai/v1/external/click-2-call",
+                json=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "x-metro-api-key": settings.ALOHAA_API_KEY,
+                },
+            )
+
+            response_data = response.json()
+
+            # Create a call log entry
+            call_log_data = {
+                "telecaller_id": telecaller_id,
+                "lead_id": lead_id,
+                "caller_number": telecaller["phone_number"],
+                "receiver_number": receiver_number,
+                "did_number": settings.ALOHAA_DID_NUMBER,
+                "call_start_time": datetime.now(),
+            }
 
-                if response_data.get("success"):
-                    call_log_data["reference_id"] = response_data["response"]["reference_id"]
+            if response_data.get("success"):
+                call_log_data["reference_id"] = response_data["response"]["reference_id"]
 
-                # Save the call log
-                await call_log_repository.create(call_log_data)
+            # Save the call log
+            await call_log_repository.create(call_log_data)
 
-                return response_data
+            return response_data
 
         except Exception as e:
             return {"success": False, "error": {"code": 1000, "reason": f"Error: {str(e)}"}}
@@ -127,17 +127,17 @@ class AlohaaService:
         Get a signed URL for call recording
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://outgoing-call.alohaa.ai/v1/external/get-signed-url",
-                    json={"document_id": document_id},
-                    headers={
-                        "Content-Type": "application/json",
-                        "x-metro-api-key": settings.ALOHAA_API_KEY,
-                    },
-                )
-
-                return response.json()
+            client = http_clients.get("alohaa")
+            response = await client.post(
+                "https://outgoing-call.alohaa.ai/v1/external/get-signed-url",
+                json={"document_id": document_id},
+                headers={
+                    "Content-Type": "application/json",
+                    "x-metro-api-key": settings.ALOHAA_API_KEY,
+                },
+            )
+
+            return response.json()
 
         except Exception as e:
             return {"success": False, "error": {"code": 1000, "reason": f"Error: {str(e)}"}}
@@ -7,11 +7,10 @@ from app.db.session import database
 from app.models.user import documents
 from app.repository.user_repository import user_repository
 from app.repository.documents_repository import document_repository
-from app.utils.azur_blob import container_client
+from app.utils.blob_response import blob_response
+from app.utils.blob_storage import blob_storage
 from app.schemas.document import DocumentCreate, DocumentType
-from fastapi import HTTPException, status
-from fastapi.responses import StreamingResponse
-import io
+from fastapi import HTTPException, Request, Response, status
 
 
 class CibilPdfService:
@@ -85,8 +84,7 @@ class CibilPdfService:
             await document_repository.update_document_path(path, document_id)
 
             # Upload PDF to blob storage
-            blob_client = container_client.get_blob_client(path)
-            blob_client.upload_blob(pdf_data, overwrite=True)
+            await blob_storage.upload(path, pdf_data, content_type="application/pdf")
 
             return {
                 "id": document_id,
@@ -105,15 +103,16 @@ class CibilPdfService:
                 detail=f"Error storing CIBIL PDF: {str(e)}",
             )
 
-    async def get_cibil_pdf(self, document_id: int) -> StreamingResponse:
+    async def get_cibil_pdf(self, document_id: int, request: Request) -> Response:
         """
         Get a CIBIL report PDF for viewing or downloading
 
         Args:
             document_id: The ID of the document
+            request: The incoming request, its Range and If-None-Match headers are honoured
 
         Returns:
-            StreamingResponse containing the PDF data
+            Response streaming the PDF data
         """
         try:
             # Get document information
@@ -123,32 +122,37 @@ class CibilPdfService:
                     status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
                 )
 
-            # Get the file from blob storage
-            blob_client = container_client.get_blob_client(document.document_path)
-            file_content = blob_client.download_blob().readall()
-
-            # Return as a streaming response
-            return StreamingResponse(
-                io.BytesIO(file_content),
+            # Stream the file from blob storage
+            return await blob_response(
+                request,
+                document.document_path,
                 media_type="application/pdf",
-                headers={"Content-Disposition": f"inline; filename=CIBIL_Report.pdf"},
+                filename="CIBIL_Report.pdf",
+                disposition="inline",
             )
 
+        except HTTPException:
+            raise
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="CIBIL PDF not found in storage"
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error retrieving CIBIL PDF: {str(e)}",
             )
 
-    async def download_cibil_pdf(self, document_id: int) -> StreamingResponse:
+    async def download_cibil_pdf(self, document_id: int, request: Request) -> Response:
         """
         Download a CIBIL report PDF
 
         Args:
             document_id: The ID of the document
+            request: The incoming request, its Range and If-None-Match headers are honoured
 
         Returns:
-            StreamingResponse with attachment disposition for download
+            Response streaming the PDF with attachment disposition for download
         """
         try:
             # Get document information
@@ -158,17 +162,20 @@ class CibilPdfService:
                     status_code=status.HTTP_404_NOT_FOUND, detail="Document not found"
                 )
 
-            # Get the file from blob storage
-            blob_client = container_client.get_blob_client(document.document_path)
-            file_content = blob_client.download_blob().readall()
-
-            # Return as a streaming response with attachment disposition
-            return StreamingResponse(
-                io.BytesIO(file_content),
+            # Stream the file from blob storage with attachment disposition
+            return await blob_response(
+                request,
+                document.document_path,
                 media_type="application/pdf",
-                headers={"Content-Disposition": f"attachment; filename=CIBIL_Report.pdf"},
+                filename="CIBIL_Report.pdf",
             )
 
+        except HTTPException:
+            raise
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="CIBIL PDF not found in storage"
+            )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -195,8 +202,7 @@ class CibilPdfService:
 
             # Delete from blob storage
             try:
-                blob_client = container_client.get_blob_client(document.document_path)
-                blob_client.delete_blob()
+                await blob_storage.delete(document.document_path)
             except Exception as e:
                 # Log error but continue (soft delete from DB)
                 print(f"Error deleting blob: {str(e)}")
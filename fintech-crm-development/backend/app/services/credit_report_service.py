@@ -1,20 +1,31 @@
+import asyncio
+import uuid
 import httpx
-from typing import Dict, Any, Optional
-from datetime import datetime
+from cachetools import TTLCache
+from typing import Dict, Any, Optional, Set
+from datetime import datetime, timezone
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.core.logger import logger
+from app.core.render_pool import RenderQueueFull, render_pool
 from app.repository.credit_report_repository import credit_report_repository
+from app.schemas.credit_report import CibilPdfJobStatus
 from app.services.cibil_pdf_service import cibil_pdf_service
-from app.services.pdfGenerationService import generateCibilReportPDF
-from io import BytesIO
+from app.services.pdfGenerationService import renderCibilReportPDF
 
 
 class CreditReportService:
     """
     Service to handle credit report API interactions and database operations
+
+    PDFs of new reports are rendered by background jobs in the render pool, so the
+    report is returned as soon as it is saved. Job status is kept in process for a day.
     """
 
     def __init__(self):
+        self._pdf_jobs: TTLCache = TTLCache(maxsize=1000, ttl=24 * 60 * 60)
+        self._pdf_tasks: Set[asyncio.Task] = set()
+
         # API credentials - these should come from environment variables in settings
         # Add these to your .env file and update the Settings class in config.py
         self.apiid = settings.CREDIT_REPORT_API_ID
@@ -49,10 +60,10 @@ class CreditReportService:
 
             logger.info(f"Generating OTP for phone number: {phone_number}")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(self.otp_api_url, json=payload)
-                response.raise_for_status()
-                return response.json()
+            client = http_clients.get("credit_report")
+            response = await client.post(self.otp_api_url, json=payload)
+            response.raise_for_status()
+            return response.json()
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during OTP generation: {str(e)}")
@@ -128,32 +139,24 @@ class CreditReportService:
                 "otp": otp,
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.credit_report_api_url, json=payload)
-                response.raise_for_status()
-                api_response = response.json()
-
-                # If API call was successful, store the response in the database
-                if api_response.get("status") == "success":
-                    # Insert or update in the database
-                    saved_report = await self._save_report_to_db(
-                        api_response, fname, lname, dob, phone_number, pan_num, user_id
-                    )
+            client = http_clients.get("credit_report")
+            response = await client.post(self.credit_report_api_url, json=payload)
+            response.raise_for_status()
+            api_response = response.json()
 
-                    # Generate and store the PDF if requested
-                    if generate_pdf:
-                        pdf_document = await self._generate_and_store_pdf(
-                            api_response, phone_number, pan_num, user_id
-                        )
+            # If API call was successful, store the response in the database
+            if api_response.get("status") == "success":
+                # Insert or update in the database
+                saved_report = await self._save_report_to_db(
+                    api_response, fname, lname, dob, phone_number, pan_num, user_id
+                )
 
-                        if pdf_document:
-                            # Add PDF info to the response
-                            api_response["pdf_document"] = {
-                                "id": pdf_document.get("id"),
-                                "document_path": pdf_document.get("document_path"),
-                            }
+                # Render and store the PDF in the background if requested
+                if generate_pdf:
+                    job = self._start_pdf_job(api_response, phone_number, pan_num, user_id)
+                    api_response["pdf_job"] = job.dict()
 
-                return api_response
+            return api_response
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during credit report fetch: {str(e)}")
@@ -162,65 +165,76 @@ class CreditReportService:
             logger.error(f"Error fetching credit report: {str(e)}")
             raise
 
+    def _start_pdf_job(
+        self,
+        api_response: Dict[str, Any],
+        phone_number: str,
+        pan_num: str,
+        user_id: Optional[str] = None,
+    ) -> CibilPdfJobStatus:
+        """Queue the rendering of a report PDF and return its job."""
+        job = CibilPdfJobStatus(
+            job_id=str(uuid.uuid4()), status="queued", created_at=datetime.now(timezone.utc)
+        )
+        self._pdf_jobs[job.job_id] = job
+
+        task = asyncio.create_task(
+            self._generate_and_store_pdf(job, api_response, phone_number, pan_num, user_id)
+        )
+        # Keep a reference until the job is done, the loop only holds weak ones
+        self._pdf_tasks.add(task)
+        task.add_done_callback(self._pdf_tasks.discard)
+        return job
+
+    def get_pdf_job(self, job_id: str) -> Optional[CibilPdfJobStatus]:
+        return self._pdf_jobs.get(job_id)
+
     async def _generate_and_store_pdf(
         self,
+        job: CibilPdfJobStatus,
         api_response: Dict[str, Any],
         phone_number: str,
         pan_num: str,
         user_id: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
+    ):
         """
         Generate a PDF from the credit report data and store it
 
+        Parsing and rendering run in the render pool, the outcome is recorded on `job`.
+
         Args:
+            job: The job to update
             api_response: The credit report API response
             phone_number: User's phone number
             pan_num: User's PAN number
             user_id: Optional user ID
-
-        Returns:
-            Dictionary with PDF document information
         """
+        job.status = "running"
         try:
-            # Extract data needed for PDF generation
-            data = api_response.get("data", {})
-
-            # Parse data for PDF generation
-            from app.services.credit_report_service import (
-                parsePersonalInfo,
-                parseCreditScore,
-                parseCreditSummary,
-                parseAccountDetails,
-                parseEnquiries,
-            )
-
-            # Extract and parse data
-            personal_info = parsePersonalInfo(data)
-            credit_score = parseCreditScore(data)
-            credit_summary = parseCreditSummary(data)
-            account_details = parseAccountDetails(data)
-            enquiries = parseEnquiries(data)
-
-            # Generate PDF
-            pdf_doc = generateCibilReportPDF(
-                personal_info, credit_score, credit_summary, account_details, enquiries
-            )
-
-            # Convert PDF to bytes
-            pdf_buffer = BytesIO()
-            pdf_doc.output(pdf_buffer)
-            pdf_bytes = pdf_buffer.getvalue()
+            pdf_bytes = await render_pool.render(renderCibilReportPDF, api_response.get("data", {}))
 
             # Store PDF
             pdf_document = await cibil_pdf_service.store_cibil_pdf(
                 pdf_data=pdf_bytes, phone_number=phone_number, pan_number=pan_num, user_id=user_id
             )
-
-            return pdf_document
-
+            job.document_id = pdf_document.get("id")
+            job.document_path = pdf_document.get("document_path")
+            job.status = "completed"
+
+        except RenderQueueFull:
+            logger.error(f"PDF render queue full, skipped PDF for PAN: {pan_num}")
+            job.status = "failed"
+            job.detail = "Too many reports are being rendered, try again later"
+        except asyncio.TimeoutError:
+            logger.error(f"PDF rendering timed out for PAN: {pan_num}")
+            job.status = "failed"
+            job.detail = "Rendering the PDF timed out"
         except Exception as e:
             logger.error(f"Error generating and storing PDF: {str(e)}")
-            return None
+            job.status = "failed"
+            job.detail = str(getattr(e, "detail", e))
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
 
     async def _save_report_to_db(
         self,
@@ -371,6 +385,43 @@ class CreditReportService:
                 "data": None,
             }
 
+    async def get_reports_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        user_id: Optional[str] = None,
+        search_term: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get credit reports with keyset pagination, the total is only counted on the first page
+        """
+        try:
+            reports, next_cursor = await credit_report_repository.get_reports_keyset(
+                limit, cursor, user_id, search_term
+            )
+            total_count = None if cursor else await credit_report_repository.count_reports(user_id)
+
+            return {
+                "status": "success",
+                "code": "TXN",
+                "mess": "success",
+                "data": {
+                    "reports": reports,
+                    "total": total_count,
+                    "limit": limit,
+                    "skip": 0,
+                    "next_cursor": next_cursor,
+                },
+            }
+        except Exception as e:
+            logger.error(f"Error getting reports page: {str(e)}")
+            return {
+                "status": "error",
+                "code": "ERR",
+                "mess": f"Error getting reports page: {str(e)}",
+                "data": None,
+            }
+
     async def delete_report(self, report_id: int) -> Dict[str, Any]:
         """
         Delete a credit report by ID
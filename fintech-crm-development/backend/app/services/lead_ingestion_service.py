@@ -0,0 +1,144 @@
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.repository.sync_state_repository import sync_state_repository
+from app.service.external_service import external_repository
+from app.services.lead_service import lead_service
+
+# Record field each source is fetched by, sources not listed use createdAt
+WATERMARK_FIELDS = {"strapi_cibil": "updatedAt", "credit_reports": "updated_at"}
+
+
+class LeadIngestionService:
+    """
+    Background engine that keeps a local copy of every external lead source.
+
+    Each run pulls only the records created after the per-source watermark
+    stored in `sync_state`, upserts them into the `users` store and then moves
+    the watermark forward. Request handlers read from `users` only.
+    """
+
+    def __init__(self):
+        self.external_repository = external_repository
+        self.sync_state_repository = sync_state_repository
+        self.lead_service = lead_service
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _sources(self) -> Dict[str, Callable[[Optional[datetime]], Awaitable[List[Dict]]]]:
+        """Map each watermarked source key to its incremental fetcher."""
+        return {
+            "strapi_loan": lambda since: self.external_repository.fetch_strapi_loan_applications(
+                since=since
+            ),
+            "strapi_cibil": lambda since: self.external_repository.fetch_strapi_cibil_users(
+                since=since
+            ),
+            "beehiiv": lambda since: self.external_repository.fetch_beehiiv_subscribers(
+                since=since
+            ),
+            # Credit reports live in our own database and are read by their updated_at
+            "credit_reports": lambda since: self.lead_service.fetch_direct_cibil_users(
+                since=since
+            ),
+        }
+
+    async def _fetch_source(
+        self, source: str, fetch: Callable[[Optional[datetime]], Awaitable[List[Dict]]]
+    ) -> Tuple[Optional[datetime], List[Dict]]:
+        """
+        Fetch the delta of a single source since its watermark.
+
+        Returns:
+            Tuple[Optional[datetime], List[Dict]]: The watermark and the records after it,
+            no records when the fetch failed.
+        """
+        since = await self.sync_state_repository.get_watermark(source)
+        try:
+            return since, await fetch(since)
+        except Exception as e:
+            # Keep the old watermark so the next run retries the same window
+            logger.error(f"Lead ingestion fetch failed for {source}: {str(e)}")
+            return since, []
+
+    async def _store_source(
+        self, source: str, since: Optional[datetime], records: List[Dict]
+    ) -> int:
+        """
+        Store the fetched delta of a source and advance its watermark.
+
+        Returns:
+            int: Number of records stored.
+        """
+        if not records:
+            return 0
+
+        try:
+            await self.lead_service.store_external_leads(source, records)
+        except Exception as e:
+            # Keep the old watermark so the next run retries the same window
+            logger.error(f"Lead ingestion store failed for {source}: {str(e)}")
+            return 0
+
+        watermark = since
+        watermark_field = WATERMARK_FIELDS.get(source, "createdAt")
+        for record in records:
+            value = self.lead_service._parse_date(record.get(watermark_field))
+            if value and (watermark is None or value > watermark):
+                watermark = value
+        await self.sync_state_repository.set_watermark(source, watermark)
+        return len(records)
+
+    async def run_once(self) -> Dict[str, int]:
+        """
+        Run a single ingestion pass over all sources.
+
+        The sources are fetched concurrently but stored one after another. Sources
+        share phone numbers, concurrent upserts of the same users could deadlock.
+
+        Returns:
+            Dict[str, int]: Number of records ingested per source.
+        """
+        async with self._lock:
+            sources = self._sources()
+            fetched = await asyncio.gather(
+                *(self._fetch_source(source, fetch) for source, fetch in sources.items())
+            )
+            result = {}
+            for source, (since, records) in zip(sources, fetched):
+                result[source] = await self._store_source(source, since, records)
+
+        logger.info(f"Lead ingestion completed: {result}")
+        return result
+
+    async def run_forever(self):
+        """Run ingestion passes every LEAD_SYNC_INTERVAL seconds until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Lead ingestion pass failed")
+            await asyncio.sleep(settings.LEAD_SYNC_INTERVAL)
+
+    def start(self):
+        """Schedule the ingestion loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self):
+        """Cancel the ingestion loop and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+lead_ingestion_service = LeadIngestionService()
@@ -0,0 +1,25 @@
+from app.schemas.user import UnifiedLeadBase
+
+LEAD_FIELDS = tuple(UnifiedLeadBase.__fields__)
+
+
+class LeadRecord:
+    """
+    Compact lead used while converting, consolidating and storing external records.
+
+    Has the fields of `UnifiedLeadBase` but stores them in slots without validation,
+    which makes it several times cheaper to build for every record of a sync.
+    The converters in `LeadService` coerce the values the pydantic model would.
+    """
+
+    __slots__ = LEAD_FIELDS
+
+    def __init__(self, **values):
+        unknown = values.keys() - LEAD_FIELDS
+        if unknown:
+            raise TypeError(f"Unknown lead fields: {', '.join(sorted(unknown))}")
+        for name in LEAD_FIELDS:
+            setattr(self, name, values.get(name))
+
+    def __repr__(self) -> str:
+        return f"LeadRecord(id={self.id!r}, lead_source={self.lead_source!r})"
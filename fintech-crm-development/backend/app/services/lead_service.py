@@ -4,26 +4,30 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Any, Union
 import json
+import re
 from venv import logger
 from sqlalchemy import bindparam, insert, or_, and_, text, update
+from app.core.config import settings
 from app.db.session import database
 from app.models.user import users
 from app.models.consolidate_users import consolidate_users
 from app.repository.user_repository import user_repository
 from app.repository.documents_repository import document_repository
-from app.service.external_service import external_repository
+from app.repository.lead_query_builder import LeadQueryBuilder
 from app.schemas.user import UnifiedLeadBase, CombinedDataResponse
+from app.services.bulk_import_service import EMAIL_PATTERN
+from app.services.lead_record import LeadRecord
+from app.utils.pagination import split_page
 from sqlalchemy import select, join, func, and_
-import time
-from app.models.message import messages
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Union
 import asyncio
 
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+
 
 class LeadService:
     def __init__(self):
         self.user_repository = user_repository
-        self.external_repository = external_repository
         self.document_repository = document_repository
 
     async def get_combined_leads(
@@ -38,52 +42,47 @@ class LeadService:
         employment_type: Optional[str] = None,
         cibil_score: Optional[str] = None,
         sources: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        cursor_mode: bool = False,
     ) -> CombinedDataResponse:
         """
         Get combined lead data from internal and external sources with filtering and pagination.
+
+        In cursor mode (`cursor_mode` or a `cursor` is given) pages are read with keyset
+        pagination and the total is only counted on the first page.
         """
         # Calculate date range based on selection
         start_date, end_date = self._calculate_date_range(date_range, date_from, date_to)
 
-        # Get loan amount range boundaries
-        min_amount, max_amount = self._parse_loan_amount_range(loan_amount)
-
-        # Get all data from different sources
-        all_data = await self._fetch_and_filter_all_sources(
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            min_amount=min_amount,
-            max_amount=max_amount,
-            employment_type=employment_type,
-            min_score=None,
-            max_score=None,
-            sources=None,
-            cibil_score=cibil_score,
-            loan_amount=loan_amount,
+        # External sources are copied into the users store by the ingestion engine,
+        # so filtering, sorting and pagination all happen in a single SQL query
+        query = (
+            LeadQueryBuilder()
+            .search(search)
+            .created_between(start_date, end_date)
+            .loan_amount_ranges(self._parse_loan_amount_ranges(loan_amount))
+            .employment_types(employment_type)
+            .cibil_score_ranges(self._parse_cibil_score_range(cibil_score))
+            .sources(sources)
         )
+        if cursor_mode or cursor:
+            rows = await database.fetch_all(query.keyset(cursor, page_size))
+            rows, next_cursor = split_page(rows, page_size, "updated_on")
+            total_records = None if cursor else await database.fetch_val(query.count(keyset=True))
+            return CombinedDataResponse(
+                total_records=total_records,
+                leads=[self._convert_internal_user_to_lead(row) for row in rows],
+                next_cursor=next_cursor,
+            )
 
-        # Filter external the data based on the provided filters
-        filtered_data = self._filter_leads(
-            all_data,
-            search=search,
-            start_date=None,
-            end_date=None,
-            min_amount=min_amount,
-            max_amount=max_amount,
-            employment_type=employment_type,
-            cibil_score=cibil_score,
-            sources=sources,
-            loan_amount=loan_amount,
-        )
-        # Calculate total records count
-        total_records = len(filtered_data)
-        # await self.store_users(filtered_data)
-
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = min(start_idx + page_size, total_records)
-        paginated_data = filtered_data[start_idx:end_idx] if start_idx < total_records else []
+        rows = await database.fetch_all(query.paginate(page, page_size))
+
+        if rows:
+            total_records = rows[0]["total_count"]
+        else:
+            total_records = await database.fetch_val(query.count())
+
+        paginated_data = [self._convert_internal_user_to_lead(row) for row in rows]
         return CombinedDataResponse(
             total_records=total_records,
             leads=paginated_data,
@@ -92,6 +91,14 @@ class LeadService:
             total_pages=(total_records // page_size) + (1 if total_records % page_size else 0),
         )
 
+    async def search_leads(self, term: str, limit: int = 20) -> List[UnifiedLeadBase]:
+        """
+        Relevance ranked lead search over name, email, phone, PAN and loan type,
+        tolerant to typos through pg_trgm similarity.
+        """
+        rows = await database.fetch_all(LeadQueryBuilder().ranked(term, limit))
+        return [self._convert_internal_user_to_lead(row) for row in rows]
+
     async def store_users(self, filtered_data: List[UnifiedLeadBase]):
         """
         Store data from filtered_data into the users table, avoiding duplicates.
@@ -157,152 +164,6 @@ class LeadService:
         else:
             return data
 
-    def _filter_leads(
-        self,
-        leads: List[UnifiedLeadBase],
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_amount: Optional[float] = None,
-        max_amount: Optional[float] = None,
-        employment_type: Optional[str] = None,
-        cibil_score: Optional[str] = None,
-        sources: Optional[List[str]] = None,
-        loan_amount: Optional[str] = None,
-    ) -> List[UnifiedLeadBase]:
-        """
-        Filter leads based on the provided criteria.
-        """
-        filtered = leads
-
-        # Apply search filter
-        if search:
-            search_term = search.lower()
-            special_sources = {"beehiiv", "strapi_loan", "strapi_cibil"}
-            employment_keywords = {"salaried", "business"}
-
-            filtered = [
-                lead
-                for lead in filtered
-                if (
-                    (lead.full_name and search_term in lead.full_name.lower())
-                    or (lead.email and search_term in lead.email.lower())
-                    or (lead.phone_number and search_term in lead.phone_number.lower())
-                    or (lead.loan_type and search_term in lead.loan_type.lower())
-                    or (lead.lead_source and search_term in lead.lead_source.lower())
-                    or (
-                        "website" in search_term and lead.lead_source in special_sources
-                    )  # Include all special sources when searching for "website"
-                    or (
-                        any(
-                            keyword in search_term for keyword in employment_keywords
-                        )  # Search contains "salaried" or "business"
-                        and lead.employment_type
-                        and any(
-                            keyword in lead.employment_type.lower()
-                            for keyword in employment_keywords
-                        )  # Lead contains either "salaried" or "business"
-                    )
-                    or (
-                        hasattr(lead, "raw_data")  # Ensure `raw_data` exists
-                        and lead.raw_data is not None
-                        and (
-                            (
-                                lead.raw_data.get("loan_type")
-                                and search_term in lead.raw_data["loan_type"].lower()
-                            )
-                            or (
-                                lead.raw_data.get("email")
-                                and search_term in lead.raw_data["email"].lower()
-                            )
-                            or (
-                                lead.raw_data.get("phone_number")
-                                and search_term in lead.raw_data["phone_number"].lower()
-                            )
-                        )
-                    )
-                )
-            ]
-
-        # Apply date range filter based on Last communicated date
-        if start_date:
-            filtered = [
-                lead
-                for lead in filtered
-                if (lead.last_communicated is not None and lead.last_communicated >= start_date)
-            ]
-
-        if end_date:
-            filtered = [
-                lead
-                for lead in filtered
-                if (lead.last_communicated is not None and lead.last_communicated <= end_date)
-            ]
-
-        # Apply loan amount filter
-        if loan_amount:
-            loan_ranges = self._parse_loan_amount_ranges(loan_amount)
-
-            if loan_ranges:
-                filtered = [
-                    lead
-                    for lead in filtered
-                    if any(
-                        lead.loan_amount is not None
-                        and (min_amount is None or lead.loan_amount >= min_amount)
-                        and (max_amount is None or lead.loan_amount <= max_amount)
-                        for min_amount, max_amount in loan_ranges
-                    )
-                ]
-
-        # Apply employment type filter
-        if employment_type:
-            employment_values = {emp.strip().lower() for emp in employment_type.split(",")}
-            filtered = [
-                lead
-                for lead in filtered
-                if (lead.employment_type and lead.employment_type.lower() in employment_values)
-            ]
-
-        # Apply CIBIL score filter
-        if cibil_score:
-            cibil_ranges = self._parse_cibil_score_range(cibil_score)
-            if cibil_ranges:
-                filtered = [
-                    lead
-                    for lead in filtered
-                    if (
-                        lead.cibil_score is not None
-                        and any(
-                            min_range <= lead.cibil_score <= max_range
-                            for min_range, max_range in cibil_ranges
-                        )
-                    )
-                ]
-
-        # Apply sources filter
-        if sources:
-            sources_lower = {s.lower() for s in sources}
-
-            # If "website" is one of the sources, include special sources
-            if "website" in sources_lower:
-                sources_lower |= {"beehiiv", "strapi_loan", "strapi_cibil"}
-
-            filtered = [
-                lead
-                for lead in filtered
-                if (
-                    lead.lead_source and lead.lead_source.lower() in sources_lower
-                )  # No null sources allowed
-            ]
-        # Ensure `datetime.min` is timezone-aware
-        min_datetime = datetime.min.replace(tzinfo=timezone.utc)
-
-        # # Sort filtered leads by `created_at`, placing `None` values at the end
-        # filtered.sort(key=lambda lead: lead.created_at if lead.created_at is not None else min_datetime, reverse=True)
-
-        return filtered
-
     def _calculate_date_range(
         self, date_range: Optional[str], date_from: Optional[datetime], date_to: Optional[datetime]
     ) -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -334,22 +195,6 @@ class LeadService:
 
         return None, None  # Default to all time
 
-    def _parse_loan_amount_range(
-        self, loan_amount: Optional[str]
-    ) -> Tuple[Optional[float], Optional[float]]:
-        """Parse loan amount range from string representation"""
-        if not loan_amount:
-            return None, None
-
-        ranges = {
-            "up_to_25_lakhs": (1, 2500000),
-            "25_lakhs_to_2_crores": (2500000, 20000000),
-            "2_crores_to_10_crores": (20000000, 100000000),
-            "above_10_crores": (100000000, None),
-        }
-
-        return ranges.get(loan_amount, (None, None))
-
     def _parse_loan_amount_ranges(
         self, loan_amount: Optional[Union[str, List[str]]]
     ) -> List[Tuple[Optional[float], Optional[float]]]:
@@ -390,129 +235,40 @@ class LeadService:
 
         return result if result else []
 
-    async def _fetch_and_filter_all_sources(
-        self,
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_amount: Optional[float] = None,
-        max_amount: Optional[float] = None,
-        employment_type: Optional[str] = None,
-        min_score: Optional[int] = None,
-        max_score: Optional[int] = None,
-        sources: Optional[List[str]] = None,
-        cibil_score: Optional[str] = None,
-        loan_amount: Optional[str] = None,
-    ) -> List[UnifiedLeadBase]:
-        """Fetch data from all sources and apply filters"""
-
-        # Get all data from external sources
-        external_data = await self.external_repository.get_all_external_data()
-
-        # Process and filter external data
-        loan_applications = self._filter_loan_applications(
-            external_data["loan_applications"],
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            min_amount=min_amount,
-            max_amount=max_amount,
-            sources=sources,
-            cibil_score=cibil_score,
-            loan_amount=loan_amount,
-        )
-
-        cibil_users = self._filter_cibil_users(
-            external_data["cibil_users"],
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            min_score=min_score,
-            max_score=max_score,
-            sources=sources,
-            cibil_score=cibil_score,
-        )
-
-        subscribers = self._filter_subscribers(
-            external_data["subscribers"],
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            sources=sources,
-        )
-
-        # # NEW: Get direct CIBIL users from repository
-        # Filter direct CIBIL users
-        filtered_direct_cibil = await self._fetch_and_filter_direct_cibil_users(
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            min_score=min_score,
-            max_score=max_score,
-            sources=sources,
-            cibil_score=cibil_score,
-        )
-
-        # Convert all data to unified lead format and combine
-        combined_data = []
-
-        combined_data.extend(self._convert_loan_applications(loan_applications))
-        combined_data.extend(self._convert_cibil_users(cibil_users))
-        combined_data.extend(self._convert_subscribers(subscribers))
-        combined_data.extend(self._convert_direct_cibil_users(filtered_direct_cibil))
-
-        await self._store_consolidated_users_efficiently(combined_data)
-        # Get internal users data with base filters
-        internal_users = await self._get_filtered_internal_users(
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            min_amount=min_amount,
-            max_amount=max_amount,
-            employment_type=employment_type,
-            min_score=min_score,
-            max_score=max_score,
-            sources=sources,
-            cibil_score=cibil_score,
-            loan_amount=loan_amount,
-        )
-        combined_data = internal_users
-        # Consolidate leads to avoid duplicates
-        # consolidated_leads = self.consolidate_leads(combined_data)
+    async def store_external_leads(self, source: str, records: List[Dict]):
+        """
+        Convert raw records of an external source to unified leads and upsert
+        them into the users store.
 
-        return combined_data
+        Args:
+            source (str): One of strapi_loan, strapi_cibil, beehiiv or credit_reports.
+            records (List[Dict]): Records as returned by the source fetcher.
 
-    async def _fetch_and_filter_direct_cibil_users(
-        self,
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_score: Optional[int] = None,
-        max_score: Optional[int] = None,
-        sources: Optional[List[str]] = None,
-        cibil_score: Optional[str] = None,
-    ):
-        """Fetch and filter direct CIBIL users in a single step"""
-        direct_cibil_users = await self._fetch_cibil_users_for_combined_data()
-
-        return self._filter_direct_cibil_users(
-            direct_cibil_users,
-            search=search,
-            start_date=start_date,
-            end_date=end_date,
-            min_score=min_score,
-            max_score=max_score,
-            sources=sources,
-            cibil_score=cibil_score,
+        Returns:
+            Dict[str, int]: Number of `inserted` and `updated` users.
+        """
+        converters = {
+            "strapi_loan": self._convert_loan_applications,
+            "strapi_cibil": self._convert_cibil_users,
+            "beehiiv": self._convert_subscribers,
+            "credit_reports": self._convert_direct_cibil_users,
+        }
+        # Strapi CIBIL users are fetched again when they change, so their score wins
+        refresh_columns = ("cibil_score", "pan_number") if source == "strapi_cibil" else ()
+        return await self._store_consolidated_users_efficiently(
+            converters[source](records), refresh_columns=refresh_columns
         )
 
-    async def _store_consolidated_users_efficiently(self, users_data: List[UnifiedLeadBase]):
+    async def _store_consolidated_users_efficiently(
+        self, users_data: List[LeadRecord], refresh_columns: Sequence[str] = ()
+    ) -> Dict[str, int]:
         """Store consolidated users with optimized database operations
 
         Handles both users with phone numbers and those with only email identifiers.
+        Returns the number of `inserted` and `updated` users.
         """
         if not users_data:
-            return
+            return {"inserted": 0, "updated": 0}
 
         # Filter out leads with missing IDs and separate users with/without phone numbers
         users_with_phone = []
@@ -526,12 +282,13 @@ class LeadService:
                     users_without_phone.append(user)
 
         # Process users with phone numbers
-        if users_with_phone:
-            await self._process_users_with_phone(users_with_phone)
+        counts = await self._process_users_with_phone(users_with_phone, refresh_columns)
 
         # Process users without phone numbers but with email
         if users_without_phone:
-            await self._process_users_without_phone(users_without_phone)
+            counts["inserted"] += await self._process_users_without_phone(users_without_phone)
+
+        return counts
 
     class DateTimeEncoder(json.JSONEncoder):
         """Custom encoder for handling datetime objects in JSON"""
@@ -541,84 +298,76 @@ class LeadService:
                 return obj.isoformat()
             return super().default(obj)
 
-    async def _process_users_with_phone(self, users_with_phone: List[UnifiedLeadBase]):
-        if not users_with_phone:
-            return
+    async def _process_users_with_phone(
+        self, users_with_phone: List[LeadRecord], refresh_columns: Sequence[str] = ()
+    ) -> Dict[str, int]:
+        """
+        Merge leads with a phone number into the users store in one set-based upsert.
 
-        try:
-            # Prepare data as before
-            values_list = [
-                # Same data preparation code as you have...
-            ]
+        The leads are loaded with COPY into an ON COMMIT DROP temp table and merged
+        with INSERT ... ON CONFLICT (phone_number), existing values are kept and only
+        empty columns are filled in, except `refresh_columns` which take the new value.
 
-            if values_list:
-                async with database.transaction():
-                    # Create temporary table first
-                    await database.execute(
-                        """
-                        CREATE TEMPORARY TABLE IF NOT EXISTS temp_users (
-                            LIKE users INCLUDING ALL
-                        ) ON COMMIT DROP
-                    """
-                    )
+        Returns:
+            Dict[str, int]: Number of `inserted` and `updated` users.
+        """
+        if not users_with_phone:
+            return {"inserted": 0, "updated": 0}
 
-                    # Clear any existing data
-                    await database.execute("TRUNCATE TABLE temp_users")
-
-                    # Use batch size for insert into temp table
-                    BATCH_SIZE = 1000
-                    batches = [
-                        values_list[i : i + BATCH_SIZE]
-                        for i in range(0, len(values_list), BATCH_SIZE)
-                    ]
-
-                    # Insert all data into temp table
-                    for batch in batches:
-                        await database.execute_many(
-                            """INSERT INTO temp_users VALUES (
-                                :id, :phone_number, :full_name, :country_code, :email,
-                                :pan_number, :loan_amount, :employment_type, :company_name,
-                                :monthly_income, :loan_purpose, :loan_tenure, :raw_data,
-                                :cibil_score, :source, :created_on, :updated_on
-                            )""",
-                            batch,
-                        )
-
-                    # Single upsert from temp table to main table
-                    await database.execute(
-                        """
-                        INSERT INTO users
-                        SELECT * FROM temp_users
-                        ON CONFLICT (phone_number) DO UPDATE SET
-                            full_name = CASE WHEN users.full_name IS NULL THEN EXCLUDED.full_name ELSE users.full_name END,
-                            country_code = CASE WHEN users.country_code IS NULL THEN EXCLUDED.country_code ELSE users.country_code END,
-                            email = CASE WHEN users.email IS NULL THEN EXCLUDED.email ELSE users.email END,
-                            pan_number = CASE WHEN users.pan_number IS NULL THEN EXCLUDED.pan_number ELSE users.pan_number END,
-                            loan_amount = CASE WHEN users.loan_amount IS NULL THEN EXCLUDED.loan_amount ELSE users.loan_amount END,
-                            employment_type = CASE WHEN users.employment_type IS NULL THEN EXCLUDED.employment_type ELSE users.employment_type END,
-                            company_name = CASE WHEN users.company_name IS NULL THEN EXCLUDED.company_name ELSE users.company_name END,
-                            monthly_income = CASE WHEN users.monthly_income IS NULL THEN EXCLUDED.monthly_income ELSE users.monthly_income END,
-                            loan_purpose = CASE WHEN users.loan_purpose IS NULL THEN EXCLUDED.loan_purpose ELSE users.loan_purpose END,
-                            loan_tenure = CASE WHEN users.loan_tenure IS NULL THEN EXCLUDED.loan_tenure ELSE users.loan_tenure END,
-                            raw_data = CASE WHEN users.raw_data IS NULL THEN EXCLUDED.raw_data ELSE users.raw_data END,
-                            cibil_score = CASE WHEN users.cibil_score IS NULL THEN EXCLUDED.cibil_score ELSE users.cibil_score END,
-                            source = CASE WHEN users.source IS NULL THEN EXCLUDED.source ELSE users.source END,
-                            created_on = CASE WHEN users.created_on IS NULL THEN EXCLUDED.created_on ELSE users.created_on END,
-                            updated_on = EXCLUDED.updated_on
-                        """
-                    )
-        except Exception as e:
-            logging.error(f"Optimized batch processing failed: {str(e)}")
+        now = datetime.now(timezone.utc)
+        records = {}
+        for user in users_with_phone:
+            # ON CONFLICT can only touch a row once per statement, keep the first lead
+            if user.phone_number in records:
+                continue
+            records[user.phone_number] = {
+                "id": user.id or user.user_id,
+                "phone_number": user.phone_number,
+                "full_name": user.full_name or None,
+                "country_code": user.country_code or None,
+                "email": user.email or None,
+                "pan_number": user.pan_number or None,
+                "loan_amount": user.loan_amount or None,
+                "employment_type": user.employment_type or None,
+                "company_name": user.company_name or None,
+                "monthly_income": user.monthly_income or None,
+                "loan_purpose": user.loan_purpose or None,
+                "loan_tenure": user.loan_tenure or None,
+                "raw_data": self.convert_datetime_to_string(user.raw_data),
+                "cibil_score": int(user.cibil_score) if user.cibil_score else None,
+                "source": user.lead_source,
+                "is_active": True,
+                "created_on": user.created_at or now,
+                "updated_on": now,
+            }
+
+        merge_columns = [
+            column
+            for column in records[users_with_phone[0].phone_number]
+            if column not in ("id", "phone_number", "is_active", "updated_on")
+        ]
+        upserted = await self.user_repository.bulk_upsert(
+            list(records.values()),
+            merge_columns,
+            keep_existing=True,
+            refresh_columns=refresh_columns,
+        )
+
+        inserted = sum(1 for user in upserted if user["inserted"])
+        counts = {"inserted": inserted, "updated": len(upserted) - inserted}
+        logging.info(f"Merged {len(upserted)} leads with phone numbers: {counts}")
+        return counts
 
-    async def _process_users_without_phone(self, users_without_phone: List[UnifiedLeadBase]):
+    async def _process_users_without_phone(self, users_without_phone: List[LeadRecord]) -> int:
         """Process users that don't have phone numbers but have emails.
         Only inserts new users; skips users with duplicate emails.
+        Returns the number of inserted users.
         """
         # Extract all emails from the input users
         emails = [user.email for user in users_without_phone if user.email]
 
         if not emails:
-            return  # No users to process
+            return 0  # No users to process
 
         try:
             # Get existing emails from the database
@@ -668,42 +417,27 @@ class LeadService:
                     }
                 )
 
-            # Execute batch insert for new users
+            # Inserted through the repository, which drops the cached lead lists
             if values_list:
-                BATCH_SIZE = 1000  # Adjust batch size as needed
-                for i in range(0, len(values_list), BATCH_SIZE):
-                    batch = values_list[i : i + BATCH_SIZE]
-                    insert_query = """
-                    INSERT INTO users (
-                        id, phone_number, full_name, country_code, email, 
-                        pan_number, loan_amount, employment_type, company_name, 
-                        monthly_income, loan_purpose, loan_tenure, raw_data, 
-                        cibil_score, source, created_on, updated_on
-                    ) 
-                    VALUES (
-                        :id, :phone_number, :full_name, :country_code, :email, 
-                        :pan_number, :loan_amount, :employment_type, :company_name, 
-                        :monthly_income, :loan_purpose, :loan_tenure, :raw_data, 
-                        :cibil_score, :source, :created_on, :updated_on
-                    );
-                    """
-                    await database.execute_many(insert_query, batch)
+                await self.user_repository.insert_many(values_list)
+
+            return len(values_list)
 
         except Exception as e:
             # Log the exception
             logging.error(f"Error processing users without phone numbers: {str(e)}")
             raise  # Re-raise the exception if needed
 
-    def _convert_direct_cibil_users(self, direct_cibil_users: List[Dict]) -> List[UnifiedLeadBase]:
+    def _convert_direct_cibil_users(self, direct_cibil_users: List[Dict]) -> List[LeadRecord]:
         """Convert direct CIBIL users to unified lead format"""
         return [
-            UnifiedLeadBase(
-                id=user.get("id"),
-                user_id=user.get("user_id"),
+            LeadRecord(
+                id=self._safe_str(user.get("id")),
+                user_id=self._safe_str(user.get("user_id")),
                 full_name=user.get("full_name"),
-                phone_number=user.get("phone_number"),
+                phone_number=self._safe_str(user.get("phone_number")),
                 pan_number=user.get("pan_number"),
-                cibil_score=user.get("cibil_score"),
+                cibil_score=self._safe_float(user.get("cibil_score")),
                 lead_source="strapi_cibil",
                 created_at=self._parse_date(user.get("created_at")),
                 last_communicated=self._parse_date(
@@ -715,19 +449,25 @@ class LeadService:
             for user in direct_cibil_users
         ]
 
-    def consolidate_leads(self, leads: List[UnifiedLeadBase]) -> List[UnifiedLeadBase]:
+    def consolidate_leads(self, leads: List[LeadRecord]) -> List[LeadRecord]:
         """
         Consolidate leads with specific handling for strapi_cibil users:
         - If a matching user (by phone+PAN) exists with strapi_loan source, update their CIBIL score
         - Don't create new entries for strapi_cibil users that match existing strapi_loan users
         - Return the consolidated leads sorted by created_at field
+
+        Runs in O(n): strapi_loan leads are indexed by phone number, and phone-less
+        leads are de-duplicated by object identity instead of list membership.
         """
         # Create a new list for final results
         result_leads = []
 
-        # Keep track of processed leads by phone+PAN
+        # Keep track of processed leads by phone number
         processed_keys = set()
 
+        # strapi_loan leads per phone number, for patching their CIBIL score
+        loan_leads_by_phone: Dict[str, List[LeadRecord]] = {}
+
         # First pass: add all strapi_loan leads to the result and track their keys
         for lead in leads:
             if lead.lead_source == "strapi_loan" and lead.phone_number:
@@ -735,6 +475,10 @@ class LeadService:
                 key = lead.phone_number
                 result_leads.append(lead)
                 processed_keys.add(key)
+                loan_leads_by_phone.setdefault(key, []).append(lead)
+
+        # Phone-less leads already added, by identity
+        seen_ids = set()
 
         # Second pass: update CIBIL scores for existing loan leads and add non-matching leads
         for lead in leads:
@@ -745,12 +489,8 @@ class LeadService:
                 # If this is a strapi_cibil lead and we've already added a strapi_loan lead with same key
                 if lead.lead_source == "strapi_cibil" and key in processed_keys:
                     # Update CIBIL score for ALL matching strapi_loan leads
-                    for existing_lead in result_leads:
-                        if (
-                            existing_lead.phone_number == lead.phone_number
-                            and existing_lead.lead_source == "strapi_loan"
-                        ):
-                            existing_lead.cibil_score = lead.cibil_score
+                    for existing_lead in loan_leads_by_phone.get(key, ()):
+                        existing_lead.cibil_score = lead.cibil_score
 
                 # If this is a lead we haven't processed yet (not a matching strapi_cibil)
                 elif key not in processed_keys:
@@ -758,7 +498,8 @@ class LeadService:
                     processed_keys.add(key)
             else:
                 # If lead doesn't have a phone number, add it as a new lead
-                if lead not in result_leads:  # Avoid duplicates
+                if id(lead) not in seen_ids:  # Avoid duplicates
+                    seen_ids.add(id(lead))
                     result_leads.append(lead)
 
         # Sort the consolidated leads by created_at field
@@ -771,457 +512,22 @@ class LeadService:
 
         return result_leads
 
-    async def _get_filtered_internal_users(
-        self,
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_amount: Optional[float] = None,
-        max_amount: Optional[float] = None,
-        employment_type: Optional[str] = None,
-        min_score: Optional[int] = None,
-        max_score: Optional[int] = None,
-        sources: Optional[List[str]] = None,
-        cibil_score: Optional[str] = None,
-        loan_amount: Optional[str] = None,
-    ):
-        """Get and filter internal users"""
-        query = users.select().where(users.c.is_active == True)
-
-        # Apply text search filter
-        # Apply text search filter
-        if search:
-            search_term = f"%{search}%"
-
-            # First create the base query with standard search conditions
-            query = query.where(
-                or_(
-                    users.c.full_name.ilike(search_term),
-                    users.c.email.ilike(search_term),
-                    users.c.phone_number.ilike(search_term),
-                    users.c.loan_purpose.ilike(search_term),
-                    users.c.employment_type.ilike(search_term),
-                    users.c.source.ilike(search_term),
-                    text("raw_data->>'loan_type' ILIKE :search_term"),
-                    text("raw_data->>'email' ILIKE :search_term"),
-                    text("raw_data->>'phone_number' ILIKE :search_term"),
-                )
-            ).params(search_term=search_term)
-
-            # If 'website' is in the search term, add another condition separately
-            if "website" in search.lower():
-                query = query.where(users.c.source.in_(["strapi_loan", "strapi_cibil", "beehiiv"]))
-
-        if start_date:
-            query = query.where(users.c.created_on >= start_date)
-        if end_date:
-            query = query.where(users.c.created_on <= end_date)
-
-        # if start_date or end_date:
-        #     query = self.filter_users_by_most_recent_communication(start_date=start_date, end_date=end_date)
-
-        # Apply loan amount filter
-        if loan_amount:
-            loan_ranges = self._parse_loan_amount_ranges(loan_amount)
-
-            if loan_ranges:
-                loan_conditions = []
-                for min_amt, max_amt in loan_ranges:
-                    if min_amt is not None and max_amt is not None:
-                        loan_conditions.append(
-                            and_(users.c.loan_amount >= min_amt, users.c.loan_amount <= max_amt)
-                        )
-                    elif min_amt is not None:
-                        loan_conditions.append(users.c.loan_amount >= min_amt)
-
-                query = query.where(or_(*loan_conditions))
-
-        # Apply employment type filter
-        if employment_type:
-            employment_values = [emp.strip() for emp in employment_type.split(",")]
-            if len(employment_values) > 1:
-                query = query.where(users.c.employment_type.in_(employment_values))
-            else:
-                query = query.where(users.c.employment_type == employment_values[0])
-
-        cibil_ranges = self._parse_cibil_score_range(cibil_score)
-        if cibil_ranges and len(cibil_ranges) > 0:
-
-            cibil_conditions = []
-            for min_range, max_range in cibil_ranges:
-                # Include null/missing scores in the 300-500 range
-                # if min_range == 300 and max_range == 500:
-                #     cibil_conditions.append(
-                #         or_(
-                #             and_(
-                #                 users.c.cibil_score >= min_range, users.c.cibil_score <= max_range
-                #             ),
-                #             users.c.cibil_score.is_(None),
-                #         )
-                #     )
-                # else:
-                cibil_conditions.append(
-                    and_(users.c.cibil_score >= min_range, users.c.cibil_score <= max_range)
-                )
-            if cibil_conditions:
-                query = query.where(or_(*cibil_conditions))
-        else:
-            if min_score is not None:
-                query = query.where(users.c.cibil_score >= min_score)
-            if max_score is not None:
-                query = query.where(users.c.cibil_score <= max_score)
-
-        # Apply sources filter - Modified to support multiple sources
-        if sources and len(sources) > 0:
-            source_conditions = []
-            for source in sources:
-                source_conditions.append(users.c.source == source)
-            query = query.where(or_(*source_conditions))
-        # Apply ORDER BY updated_date in descending order (most recent first)
-        query = query.order_by(users.c.updated_on.desc())
-
-        # Execute query
-        result = await database.fetch_all(query)
-
-        # Fetch document counts for each user
-        user_leads = []
-        for user in result:
-            # doc_count = await self.document_repository.get_user_documents_count(user.id)
-            if user is not None:
-                lead = self._convert_internal_user_to_lead(user)
-                # lead.documents_count = doc_count
-                user_leads.append(lead)
-
-        return user_leads
-
     def filter_users_by_most_recent_communication(self, start_date=None, end_date=None):
-        # Build a subquery to get the most recent timestamp for each phone number within the date range
-        msg_query = select(
-            [messages.c.phone_number, func.max(messages.c.timestamp).label("last_communicated")]
-        ).group_by(messages.c.phone_number)
-
-        if start_date:
-            start_timestamp = str(int(time.mktime(start_date.timetuple())))
-            msg_query = msg_query.where(messages.c.timestamp >= start_timestamp)
-
-        if end_date:
-            end_timestamp = str(int(time.mktime(end_date.timetuple())))
-            msg_query = msg_query.where(messages.c.timestamp <= end_timestamp)
-
-        msg_query = msg_query.alias("msg_query")
-
-        # Select users matching these phone numbers and join with the latest communication data
-        query = select([users, msg_query.c.last_communicated]).join(
-            msg_query, users.c.phone_number == msg_query.c.phone_number
-        )
-
-        return query
-
-    def _filter_loan_applications(
-        self,
-        loan_applications: List[Dict],
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_amount: Optional[float] = None,
-        max_amount: Optional[float] = None,
-        sources: Optional[List[str]] = None,
-        cibil_score: Optional[str] = None,
-        loan_amount: Optional[str] = None,
-    ) -> List[Dict]:
-        """Filter loan applications"""
-        from datetime import timezone
-
-        filtered = loan_applications
-
-        if search:
-            search_term = search.lower()
-            special_sources = {"beehiiv", "strapi_loan", "strapi_cibil"}
-
-            filtered = [
-                app
-                for app in filtered
-                if (
-                    (app.get("name") and search_term in app.get("name", "").lower())
-                    or (app.get("email") and search_term in app.get("email", "").lower())
-                    or (
-                        app.get("phone_number")
-                        and search_term in app.get("phone_number", "").lower()
-                    )
-                    or (app.get("loan_type") and search_term in app.get("loan_type", "").lower())
-                    or (
-                        app.get("source") and search_term in app.get("source", "").lower()
-                    )  # Normal source search
-                    or (
-                        "website" in search_term and app.get("source") in special_sources
-                    )  # Fetch from all special sources when searching for "website"
-                )
-            ]
-
-        # Apply date range filter
-        if start_date:
-            if start_date.tzinfo is None:
-                start_date = start_date.replace(tzinfo=timezone.utc)
-
-            filtered = [
-                app
-                for app in filtered
-                if (
-                    app.get("createdAt")
-                    and self._parse_date(app.get("createdAt")) is not None
-                    and self._parse_date(app.get("createdAt")) >= start_date
-                )
-            ]
-
-        if end_date:
-            if end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=timezone.utc)
-
-            filtered = [
-                app
-                for app in filtered
-                if (
-                    app.get("createdAt")
-                    and self._parse_date(app.get("createdAt")) is not None
-                    and self._parse_date(app.get("createdAt")) <= end_date
-                )
-            ]
-
-        # Apply loan amount filter
-        # if min_amount is not None:
-        #     filtered = [
-        #         app
-        #         for app in filtered
-        #         if (app.get("amount") and self._safe_float(app.get("amount", 0)) >= min_amount)
-        #     ]
-
-        # if max_amount is not None:
-        #     filtered = [
-        #         app
-        #         for app in filtered
-        #         if (app.get("amount") and self._safe_float(app.get("amount", 0)) <= max_amount)
-        #     ]
-        if loan_amount:
-            loan_ranges = self._parse_loan_amount_ranges(loan_amount)
-
-            filtered = [
-                app
-                for app in filtered
-                if app.get("amount")
-                and any(
-                    (min_amt is None or self._safe_float(app.get("amount")) >= min_amt)
-                    and (max_amt is None or self._safe_float(app.get("amount")) <= max_amt)
-                    for min_amt, max_amt in loan_ranges
-                )
-            ]
-
-        cibil_ranges = self._parse_cibil_score_range(cibil_score)
-        if cibil_ranges and len(cibil_ranges) > 0:
-            range_filtered = []
-            for min_range, max_range in cibil_ranges:
-                for app in filtered:
-                    app_score = self._safe_int(app.get("cibil_score", 0))
-                    if app_score and min_range <= app_score <= max_range:
-                        range_filtered.append(app)
-            filtered = range_filtered
-
-        # Apply sources filter
-        if sources and len(sources) > 0:
-            if "strapi_loan" not in [s.lower() for s in sources]:
-                filtered = []
-        return filtered
-
-    def _filter_cibil_users(
-        self,
-        cibil_users: List[Dict],
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_score: Optional[int] = None,
-        max_score: Optional[int] = None,
-        sources: Optional[List[str]] = None,
-        cibil_score: Optional[str] = None,
-    ) -> List[Dict]:
-        """Filter CIBIL users"""
-        from datetime import timezone
-
-        filtered = cibil_users
-        cibil_ranges = self._parse_cibil_score_range(cibil_score)
-
-        if cibil_ranges and len(cibil_ranges) > 0:
-            range_filtered = []
-            for min_range, max_range in cibil_ranges:
-                for user in filtered:
-                    user_score = self._safe_int(user.get("cibil_score", 0))
-                    if user_score and min_range <= user_score <= max_range:
-                        range_filtered.append(user)
-            filtered = range_filtered
-        else:
-            if min_score is not None:
-                filtered = [
-                    user
-                    for user in filtered
-                    if (
-                        user.get("cibil_score")
-                        and self._safe_int(user.get("cibil_score", 0)) >= min_score
-                    )
-                ]
-
-            if max_score is not None:
-                filtered = [
-                    user
-                    for user in filtered
-                    if (
-                        user.get("cibil_score")
-                        and self._safe_int(user.get("cibil_score", 0)) <= max_score
-                    )
-                ]
-
-        if search:
-            search_term = search.lower()
-            special_sources = {"beehiiv", "strapi_loan", "strapi_cibil"}
-
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    (user.get("name") and search_term in user.get("name", "").lower())
-                    or (
-                        user.get("phone_number")
-                        and search_term in user.get("phone_number", "").lower()
-                    )
-                    or (
-                        user.get("pan_number") and search_term in user.get("pan_number", "").lower()
-                    )
-                    or (
-                        user.get("source") and search_term in user.get("source", "").lower()
-                    )  # Normal source search
-                    or (
-                        "website" in search_term and user.get("source") in special_sources
-                    )  # Fetch all special sources on 'website' search
-                )
-            ]
-
-        if start_date:
-            if start_date.tzinfo is None:
-                start_date = start_date.replace(tzinfo=timezone.utc)
-
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    user.get("createdAt")
-                    and self._parse_date(user.get("createdAt")) is not None
-                    and self._parse_date(user.get("createdAt")) >= start_date
-                )
-            ]
-
-        if end_date:
-            if end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=timezone.utc)
-
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    user.get("createdAt")
-                    and self._parse_date(user.get("createdAt")) is not None
-                    and self._parse_date(user.get("createdAt")) <= end_date
-                )
-            ]
-
-        if min_score is not None:
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    user.get("cibil_score")
-                    and self._safe_int(user.get("cibil_score", 0)) >= min_score
-                )
-            ]
-
-        if max_score is not None:
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    user.get("cibil_score")
-                    and self._safe_int(user.get("cibil_score", 0)) <= max_score
-                )
-            ]
-
-        # Updated to support multiple sources
-        if sources and len(sources) > 0:
-            # Only keep "strapi_cibil" records if "strapi_cibil" is in the sources list
-            if "strapi_cibil" not in [s.lower() for s in sources]:
-                filtered = []
-        return filtered
+        """
+        Build a query for the users whose latest message falls within a date range.
 
-    def _filter_subscribers(
-        self,
-        subscribers: List[Dict],
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        sources: Optional[List[str]] = None,  # Changed from source to sources
-    ) -> List[Dict]:
-        """Filter subscribers"""
-        from datetime import timezone
-
-        filtered = subscribers
-
-        if search:
-            search_term = search.lower()
-            special_sources = {"beehiiv", "strapi_loan", "strapi_cibil"}
-
-            filtered = [
-                sub
-                for sub in filtered
-                if (
-                    (sub.get("email") and search_term in sub.get("email", "").lower())
-                    or (
-                        sub.get("source") and search_term in sub.get("source", "").lower()
-                    )  # Normal source search
-                    or (
-                        "website" in search_term and sub.get("source") in special_sources
-                    )  # Fetch all special sources on 'website' search
-                )
-            ]
+        Reads the maintained `users.last_communicated` instead of aggregating the
+        messages table, so the range filter and the recency order use its index.
+        """
+        query = select([users]).where(users.c.last_communicated.isnot(None))
 
         if start_date:
-            if start_date.tzinfo is None:
-                start_date = start_date.replace(tzinfo=timezone.utc)
-
-            filtered = [
-                sub
-                for sub in filtered
-                if (
-                    sub.get("createdAt")
-                    and self._parse_date(sub.get("createdAt")) is not None
-                    and self._parse_date(sub.get("createdAt")) >= start_date
-                )
-            ]
+            query = query.where(users.c.last_communicated >= start_date)
 
         if end_date:
-            if end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=timezone.utc)
-
-            filtered = [
-                sub
-                for sub in filtered
-                if (
-                    sub.get("createdAt")
-                    and self._parse_date(sub.get("createdAt")) is not None
-                    and self._parse_date(sub.get("createdAt")) <= end_date
-                )
-            ]
+            query = query.where(users.c.last_communicated <= end_date)
 
-        # Updated to support multiple sources
-        if sources and len(sources) > 0:
-            # Only keep "beehiiv" records if "beehiiv" is in the sources list
-            if "beehiiv" not in [s.lower() for s in sources]:
-                filtered = []
-        return filtered
+        return query.order_by(users.c.last_communicated.desc().nullslast())
 
     def _convert_internal_user_to_lead(self, user) -> Union[UnifiedLeadBase, List[UnifiedLeadBase]]:
         """Convert internal user (or list of users) to unified lead format."""
@@ -1266,6 +572,7 @@ class LeadService:
             lead_source=user.source,
             last_communicated=last_communicated,
             created_at=user.created_on,
+            documents_count=user.documents_count,
             company_name=user.company_name,
             monthly_income=user.monthly_income,
             loan_purpose=user.loan_purpose,
@@ -1277,16 +584,16 @@ class LeadService:
             category=user.category,
         )
 
-    def _convert_loan_applications(self, loan_applications: List[Dict]) -> List[UnifiedLeadBase]:
+    def _convert_loan_applications(self, loan_applications: List[Dict]) -> List[LeadRecord]:
         """Convert loan applications to unified lead format"""
         return [
-            UnifiedLeadBase(
+            LeadRecord(
                 id=str(uuid.uuid4()),  # Generate unique ID
-                user_id=app.get("id"),
+                user_id=self._safe_str(app.get("id")),
                 document_name=app.get("documentId"),
                 full_name=app.get("name"),
-                email=app.get("email"),
-                phone_number=app.get("phone_number"),
+                email=self._valid_email(app.get("email")),
+                phone_number=self._safe_str(app.get("phone_number")),
                 loan_amount=self._safe_float(app.get("amount", 0)),
                 loan_type=app.get("loan_type"),
                 lead_source="strapi_loan",
@@ -1297,15 +604,15 @@ class LeadService:
             for app in loan_applications
         ]
 
-    def _convert_cibil_users(self, cibil_users: List[Dict]) -> List[UnifiedLeadBase]:
+    def _convert_cibil_users(self, cibil_users: List[Dict]) -> List[LeadRecord]:
         """Convert CIBIL users to unified lead format"""
         return [
-            UnifiedLeadBase(
+            LeadRecord(
                 id=str(uuid.uuid4()),  # Generate unique ID
-                user_id=user.get("id"),
+                user_id=self._safe_str(user.get("id")),
                 document_name=user.get("documentId"),
                 full_name=user.get("name"),
-                phone_number=user.get("phone_number"),
+                phone_number=self._safe_str(user.get("phone_number")),
                 pan_number=user.get("pan_number"),
                 cibil_score=self._safe_int(user.get("cibil_score", 0)),
                 lead_source="strapi_cibil",
@@ -1316,12 +623,12 @@ class LeadService:
             for user in cibil_users
         ]
 
-    def _convert_subscribers(self, subscribers: List[Dict]) -> List[UnifiedLeadBase]:
+    def _convert_subscribers(self, subscribers: List[Dict]) -> List[LeadRecord]:
         """Convert subscribers to unified lead format"""
         return [
-            UnifiedLeadBase(
+            LeadRecord(
                 id=str(uuid.uuid4()),  # Generate unique ID
-                email=sub.get("email"),
+                email=self._valid_email(sub.get("email")),
                 lead_source="beehiiv",
                 created_at=self._parse_date(sub.get("createdAt")),
                 subscription_status=sub.get("status"),
@@ -1331,82 +638,6 @@ class LeadService:
             for sub in subscribers
         ]
 
-    def _filter_direct_cibil_users(
-        self,
-        direct_cibil_users: List[Dict],
-        search: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        min_score: Optional[int] = None,
-        max_score: Optional[int] = None,
-        sources: Optional[List[str]] = None,
-        cibil_score: Optional[str] = None,
-    ) -> List[Dict]:
-        """Filter direct CIBIL users from repository"""
-        filtered = direct_cibil_users
-
-        # Apply search filter
-        if search:
-            search_term = search.lower()
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    (user.get("full_name") and search_term in user.get("full_name", "").lower())
-                    or (
-                        user.get("phone_number")
-                        and search_term in user.get("phone_number", "").lower()
-                    )
-                    or (
-                        user.get("pan_number") and search_term in user.get("pan_number", "").lower()
-                    )
-                    or (
-                        user.get("lead_source")
-                        and search_term in user.get("lead_source", "").lower()
-                    )
-                )
-            ]
-
-        # Apply date filters
-        if start_date:
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    user.get("created_at")
-                    and self._parse_date(user.get("created_at"))
-                    and self._parse_date(user.get("created_at")) >= start_date
-                )
-            ]
-
-        if end_date:
-            filtered = [
-                user
-                for user in filtered
-                if (
-                    user.get("created_at")
-                    and self._parse_date(user.get("created_at"))
-                    and self._parse_date(user.get("created_at")) <= end_date
-                )
-            ]
-
-        # Apply CIBIL score filters
-        cibil_ranges = self._parse_cibil_score_range(cibil_score)
-        if cibil_ranges:
-            range_filtered = []
-            for min_range, max_range in cibil_ranges:
-                for user in filtered:
-                    user_score = self._safe_int(user.get("cibil_score", 0))
-                    if user_score and min_range <= user_score <= max_range:
-                        range_filtered.append(user)
-            filtered = range_filtered
-
-        # Apply source filter
-        if sources and "strapi_cibil" not in [s.lower() for s in sources]:
-            filtered = []
-
-        return filtered
-
     def _parse_date(self, date_value: Optional[Union[str, datetime]]) -> Optional[datetime]:
         """
         Safely parse a date string or datetime object to a timezone-aware datetime object.
@@ -1460,6 +691,18 @@ class LeadService:
         except (ValueError, TypeError):
             return 0.0
 
+    def _safe_str(self, value) -> Optional[str]:
+        """Convert ids and phone numbers that sources send as numbers to strings"""
+        if value is None:
+            return None
+        return value if isinstance(value, str) else str(value)
+
+    def _valid_email(self, value) -> Optional[str]:
+        """Return the email if it looks valid, otherwise None"""
+        if isinstance(value, str) and EMAIL_RE.match(value.strip()):
+            return value.strip()
+        return None
+
     def _safe_int(self, value) -> Optional[int]:
         """Safely convert value to int"""
         if value is None:
@@ -1470,48 +713,42 @@ class LeadService:
         except (ValueError, TypeError):
             return 0
 
-    async def _fetch_cibil_users_for_combined_data(self) -> List[Dict]:
+    async def fetch_direct_cibil_users(self, since: Optional[datetime] = None) -> List[Dict]:
         """
         Fetch CIBIL report users directly from the credit_report_repository
         to include in the combined leads data.
 
-        This ensures CIBIL users are included in the leads table.
+        Reads the summary columns of every valid report updated after `since`,
+        CREDIT_REPORT_PAGE_SIZE reports per query.
         """
-        try:
-            # Import the credit report repository
-            from app.repository.credit_report_repository import credit_report_repository
-
-            # Get all credit reports (limit to 100 for performance)
-            reports = await credit_report_repository.get_all_reports(limit=100, skip=0)
+        from app.repository.credit_report_repository import credit_report_repository
 
-            # Transform reports to the unified lead format
-            cibil_leads = []
+        cibil_leads = []
+        cursor = None
+        while True:
+            reports, cursor = await credit_report_repository.get_report_summaries(
+                limit=settings.CREDIT_REPORT_PAGE_SIZE, cursor=cursor, updated_since=since
+            )
             for report in reports:
-                # Convert to dictionary if it's not already
-                if not isinstance(report, dict):
-                    report = dict(report)
-
-                # Create a lead object
-                lead = {
-                    "id": report.get("id"),
-                    "user_id": report.get("user_id"),
-                    "full_name": f"{report.get('first_name', '')} {report.get('last_name', '')}".strip(),
-                    "email": None,  # CIBIL reports may not have email
-                    "phone_number": report.get("phone_number"),
-                    "pan_number": report.get("pan_number"),
-                    "cibil_score": report.get("credit_score"),
-                    "lead_source": "strapi_cibil",
-                    "created_at": report.get("created_at"),
-                    "last_communicated": report.get("updated_at") or report.get("created_at"),
-                    "documents_count": 1,  # At least one CIBIL document
-                }
-
-                cibil_leads.append(lead)
-
-            return cibil_leads
-        except Exception as e:
-            logger.error(f"Error fetching CIBIL users for combined data: {str(e)}")
-            return []
+                full_name = f"{report['first_name'] or ''} {report['last_name'] or ''}"
+                cibil_leads.append(
+                    {
+                        "id": report["id"],
+                        "user_id": report["user_id"],
+                        "full_name": full_name.strip(),
+                        "email": None,  # CIBIL reports may not have email
+                        "phone_number": report["phone_number"],
+                        "pan_number": report["pan_number"],
+                        "cibil_score": report["credit_score"],
+                        "lead_source": "strapi_cibil",
+                        "created_at": report["created_at"],
+                        "updated_at": report["updated_at"],
+                        "last_communicated": report["updated_at"] or report["created_at"],
+                        "documents_count": 1,  # At least one CIBIL document
+                    }
+                )
+            if cursor is None:
+                return cibil_leads
 
 
 # Create singleton instance
@@ -2,6 +2,186 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from io import BytesIO
 
+# Kept free of app imports, the functions below also run in the PDF render worker processes
+
+PAGE_TOP = 750
+PAGE_BOTTOM = 50
+LEFT = 30
+
+
+def _cir_report_data(data):
+    """Get the CIRReportData section of the first report in an Equifax payload."""
+    equifax_report = (data or {}).get("Equifax_Report") or {}
+    report_list = (equifax_report.get("CCRResponse") or {}).get("CIRReportDataLst") or []
+    if not report_list:
+        return {}
+    return report_list[0].get("CIRReportData") or {}
+
+
+def _to_int(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def parsePersonalInfo(data):
+    """
+    Extract the identity of the consumer from an Equifax payload.
+
+    Returns:
+        dict: name, panNumber, phone, email, dob, gender, address, reportId and reportDate.
+    """
+    equifax_report = (data or {}).get("Equifax_Report") or {}
+    header = equifax_report.get("InquiryResponseHeader") or {}
+    contact_info = _cir_report_data(data).get("IDAndContactInfo") or {}
+    personal_info = contact_info.get("PersonalInfo") or {}
+    identity_info = contact_info.get("IdentityInfo") or {}
+
+    name = personal_info.get("Name") or {}
+    pan_ids = identity_info.get("PANId") or []
+    phones = contact_info.get("PhoneInfo") or []
+    emails = contact_info.get("EmailAddressInfo") or []
+    addresses = contact_info.get("AddressInfo") or []
+
+    address = None
+    if addresses:
+        first = addresses[0]
+        parts = (first.get("Address"), first.get("State"), first.get("Postal"))
+        address = ", ".join(str(part) for part in parts if part)
+
+    return {
+        "name": name.get("FullName")
+        or " ".join(part for part in (name.get("FirstName"), name.get("LastName")) if part)
+        or None,
+        "panNumber": pan_ids[0].get("IdNumber") if pan_ids else None,
+        "phone": phones[0].get("Number") if phones else None,
+        "email": emails[0].get("EmailAddress") if emails else None,
+        "dob": personal_info.get("DateOfBirth"),
+        "gender": personal_info.get("Gender"),
+        "address": address,
+        "reportId": header.get("ReportOrderNO"),
+        "reportDate": header.get("Date"),
+    }
+
+
+def parseCreditScore(data):
+    """
+    Extract the bureau score of an Equifax payload.
+
+    Returns:
+        dict: score (int or None), version and name of the scoring model.
+    """
+    score_details = _cir_report_data(data).get("ScoreDetails") or []
+    if not score_details:
+        return {"score": None, "version": None, "name": None}
+    score = score_details[0]
+    return {
+        "score": _to_int(score.get("Value")),
+        "version": score.get("Version"),
+        "name": score.get("Name") or score.get("Type"),
+    }
+
+
+def parseCreditSummary(data):
+    """
+    Extract the account and enquiry totals of an Equifax payload.
+
+    Returns:
+        dict: Account counts and amounts from RetailAccountsSummary plus enquiry counts.
+    """
+    report_data = _cir_report_data(data)
+    summary = report_data.get("RetailAccountsSummary") or {}
+    enquiry_summary = report_data.get("EnquirySummary") or {}
+
+    total_accounts = _to_int(summary.get("NoOfAccounts")) or 0
+    active_accounts = _to_int(summary.get("NoOfActiveAccounts")) or 0
+    return {
+        "totalAccounts": total_accounts,
+        "activeAccounts": active_accounts,
+        "closedAccounts": max(total_accounts - active_accounts, 0),
+        "pastDueAccounts": _to_int(summary.get("NoOfPastDueAccounts")) or 0,
+        "writeOffs": _to_int(summary.get("NoOfWriteOffs")) or 0,
+        "totalBalance": _to_int(summary.get("TotalBalanceAmount")),
+        "totalSanctionAmount": _to_int(summary.get("TotalSanctionAmount")),
+        "totalPastDue": _to_int(summary.get("TotalPastDue")),
+        "totalMonthlyPayment": _to_int(summary.get("TotalMonthlyPaymentAmount")),
+        "oldestAccount": summary.get("OldestAccount"),
+        "recentAccount": summary.get("RecentAccount"),
+        "totalEnquiries": _to_int(enquiry_summary.get("Total")) or 0,
+        "enquiriesPast12Months": _to_int(enquiry_summary.get("Past12Months")) or 0,
+    }
+
+
+def parseAccountDetails(data):
+    """
+    Extract the retail accounts of an Equifax payload.
+
+    Returns:
+        list: One dict per account, account numbers are masked to their last 4 characters.
+    """
+    accounts = []
+    for account in _cir_report_data(data).get("RetailAccountDetails") or []:
+        number = str(account.get("AccountNumber") or "")
+        accounts.append(
+            {
+                "institution": account.get("Institution"),
+                "accountType": account.get("AccountType"),
+                "accountNumber": f"XXXX{number[-4:]}" if number else None,
+                "ownership": account.get("OwnershipType"),
+                "status": account.get("AccountStatus"),
+                "open": account.get("Open"),
+                "sanctionAmount": _to_int(account.get("SanctionAmount")),
+                "balance": _to_int(account.get("Balance")),
+                "pastDueAmount": _to_int(account.get("PastDueAmount")),
+                "dateOpened": account.get("DateOpened"),
+                "dateReported": account.get("DateReported"),
+            }
+        )
+    return accounts
+
+
+def parseEnquiries(data):
+    """
+    Extract the credit enquiries of an Equifax payload.
+
+    Returns:
+        list: One dict per enquiry with institution, date, purpose and amount.
+    """
+    return [
+        {
+            "institution": enquiry.get("Institution"),
+            "date": enquiry.get("Date"),
+            "purpose": enquiry.get("RequestPurpose"),
+            "amount": _to_int(enquiry.get("Amount")),
+        }
+        for enquiry in _cir_report_data(data).get("Enquiries") or []
+    ]
+
+
+class _ReportWriter:
+    """Writes lines top to bottom and starts a new page when one is full."""
+
+    def __init__(self, c):
+        self.c = c
+        self.y = PAGE_TOP
+
+    def line(self, text, font="Helvetica", size=10, gap=16):
+        if self.y < PAGE_BOTTOM:
+            self.c.showPage()
+            self.y = PAGE_TOP
+        self.c.setFont(font, size)
+        self.c.drawString(LEFT, self.y, text)
+        self.y -= gap
+
+    def heading(self, text):
+        self.y -= 8
+        self.line(text, font="Helvetica-Bold", size=13, gap=20)
+
+
+def _value(value):
+    return "N/A" if value is None or value == "" else str(value)
+
 
 def generateCibilReportPDF(personal_info, credit_score, credit_summary, account_details, enquiries):
     """
@@ -12,23 +192,84 @@ def generateCibilReportPDF(personal_info, credit_score, credit_summary, account_
     """
     buffer = BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
+    writer = _ReportWriter(c)
 
     # Add header
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(30, 750, "CIBIL REPORT")
+    writer.line("CIBIL REPORT", font="Helvetica-Bold", size=16, gap=30)
 
     # Add personal info
-    c.setFont("Helvetica", 12)
-    c.drawString(30, 720, f"Name: {personal_info.get('name', 'N/A')}")
-    c.drawString(30, 700, f"PAN: {personal_info.get('panNumber', 'N/A')}")
-    c.drawString(30, 680, f"Phone: {personal_info.get('phone', 'N/A')}")
+    writer.line(f"Name: {_value(personal_info.get('name'))}", size=12, gap=20)
+    writer.line(f"PAN: {_value(personal_info.get('panNumber'))}", size=12, gap=20)
+    writer.line(f"Phone: {_value(personal_info.get('phone'))}", size=12, gap=20)
+    writer.line(f"Date of birth: {_value(personal_info.get('dob'))}")
+    writer.line(f"Address: {_value(personal_info.get('address'))}")
+    writer.line(
+        f"Report: {_value(personal_info.get('reportId'))} "
+        f"dated {_value(personal_info.get('reportDate'))}"
+    )
 
     # Add credit score
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(30, 640, f"Credit Score: {credit_score}")
+    writer.y -= 10
+    writer.line(
+        f"Credit Score: {_value(credit_score.get('score'))}",
+        font="Helvetica-Bold",
+        size=14,
+        gap=20,
+    )
+
+    writer.heading("Summary")
+    writer.line(
+        f"Accounts: {credit_summary['totalAccounts']} total, "
+        f"{credit_summary['activeAccounts']} active, {credit_summary['closedAccounts']} closed, "
+        f"{credit_summary['pastDueAccounts']} past due, {credit_summary['writeOffs']} written off"
+    )
+    writer.line(
+        f"Balance: {_value(credit_summary['totalBalance'])}  "
+        f"Sanctioned: {_value(credit_summary['totalSanctionAmount'])}  "
+        f"Past due: {_value(credit_summary['totalPastDue'])}"
+    )
+    writer.line(
+        f"Enquiries: {credit_summary['totalEnquiries']} total, "
+        f"{credit_summary['enquiriesPast12Months']} in the past 12 months"
+    )
+
+    writer.heading(f"Accounts ({len(account_details)})")
+    for account in account_details:
+        writer.line(
+            f"{_value(account['institution'])} - {_value(account['accountType'])} "
+            f"{_value(account['accountNumber'])}",
+            font="Helvetica-Bold",
+        )
+        writer.line(
+            f"    Status: {_value(account['status'])}  Opened: {_value(account['dateOpened'])}  "
+            f"Sanctioned: {_value(account['sanctionAmount'])}  "
+            f"Balance: {_value(account['balance'])}  Past due: {_value(account['pastDueAmount'])}"
+        )
 
-    # Add more content as needed
+    writer.heading(f"Enquiries ({len(enquiries)})")
+    for enquiry in enquiries:
+        writer.line(
+            f"{_value(enquiry['date'])}  {_value(enquiry['institution'])}  "
+            f"{_value(enquiry['purpose'])}  Amount: {_value(enquiry['amount'])}"
+        )
 
     c.save()
     buffer.seek(0)
     return buffer
+
+
+def renderCibilReportPDF(data):
+    """
+    Parse an Equifax payload and render its PDF, the unit of work of the render pool.
+
+    Returns:
+        bytes: The PDF document.
+    """
+    pdf_buffer = generateCibilReportPDF(
+        parsePersonalInfo(data),
+        parseCreditScore(data),
+        parseCreditSummary(data),
+        parseAccountDetails(data),
+        parseEnquiries(data),
+    )
+    return pdf_buffer.getvalue()
@@ -1,5 +1,4 @@
 import json
-import httpx
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 from datetime import datetime, timedelta
@@ -11,6 +10,7 @@ from app.repository.telecaller_repository import TelecallerRepository
 from app.repository.user_repository import user_repository
 from app.enum.telecaller_status import TelecallerStatus
 from app.core.config import settings
+from app.core.http_client import http_clients
 from app.core.websocket import websocket_manager
 from app.db.session import database
 from app.models.telecallers import call_log
@@ -89,42 +89,41 @@ class TelecallerService:
             }
 
             # Make the API call to Alohaa
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://outgoing-call.alohaa.ai/v1/external/click-2-call",
-                    json=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "x-metro-api-key": settings.ALOHAA_API_KEY,
-                    },
+            client = http_clients.get("alohaa")
+            response = await client.post(
+                "https://outgoing-call.alohaa.ai/v1/external/click-2-call",
+                json=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "x-metro-api-key": settings.ALOHAA_API_KEY,
+                },
+            )
+
+            response_data = response.json()
+
+            # Skip database logging if this is a test call
+            if response_data.get("success"):
+                # Direct database insert to avoid serialization issues
+                call_record = {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "lead_id": lead_id,
+                    "caller_number": caller_number,
+                    "receiver_number": receiver_number,
+                    "did_number": settings.ALOHAA_DID_NUMBER,
+                    "reference_id": response_data["response"]["reference_id"],
+                }
+
+                # Use direct SQL query to insert
+                query = call_log.insert().values(
+                    **call_record,
+                    call_start_time=datetime.now(),
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
                 )
+                await database.execute(query)
 
-                response_data = response.json()
-
-                # Skip database logging if this is a test call
-                if response_data.get("success"):
-                    # Direct database insert to avoid serialization issues
-                    call_record = {
-                        "id": str(uuid.uuid4()),
-                        "user_id": user_id,
-                        "lead_id": lead_id,
-                        "caller_number": caller_number,
-                        "receiver_number": receiver_number,
-                        "did_number": settings.ALOHAA_DID_NUMBER,
-                        "reference_id": response_data["response"]["reference_id"],
-                    }
-
-                    # Use direct SQL query to insert
-                    query = call_log.insert().values(
-                        **call_record,
-                        call_start_time=datetime.now(),
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
-                    )
-                    print(query)
-                    await database.execute(query)
-
-                return response_data
+            return response_data
 
         except Exception as e:
             return {"success": False, "error": {"code": 1000, "reason": f"Error: {str(e)}"}}
@@ -135,17 +134,17 @@ class TelecallerService:
         Get a signed URL for call recording
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://outgoing-call.alohaa.ai/v1/external/get-signed-url",
-                    json={"document_id": document_id},
-                    headers={
-                        "Content-Type": "application/json",
-                        "x-metro-api-key": settings.ALOHAA_API_KEY,
-                    },
-                )
-
-                return response.json()
+            client = http_clients.get("alohaa")
+            response = await client.post(
+                "https://outgoing-call.alohaa.ai/v1/external/get-signed-url",
+                json={"document_id": document_id},
+                headers={
+                    "Content-Type": "application/json",
+                    "x-metro-api-key": settings.ALOHAA_API_KEY,
+                },
+            )
+
+            return response.json()
 
         except Exception as e:
             return {"success": False, "error": {"code": 1000, "reason": f"Error: {str(e)}"}}
@@ -0,0 +1,146 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.security import ALGORITHM, derive_key
+from app.repository.documents_repository import document_repository
+from app.schemas.document import DocumentCreate, DocumentId, UploadSession, UploadSessionCreate
+from app.utils.blob_storage import blob_storage
+
+
+class UploadSessionService:
+    """
+    Service for uploads that go straight from the client to blob storage.
+
+    A session hands out a short-lived, create-only URL for a new blob and a
+    signed session token describing the expected file. The client PUTs the
+    file to the URL, then completes the session with the token, which records
+    the document once the blob's size and content type match. The token
+    carries all session state, so any API worker can complete it.
+    """
+
+    def __init__(self):
+        self._signing_key = derive_key("upload-session")
+
+    async def create_session(self, user_id: str, payload: UploadSessionCreate) -> UploadSession:
+        """
+        Start an upload of a user document.
+
+        Args:
+            user_id (str): The user the document belongs to.
+            payload (UploadSessionCreate): Type and size of the file to upload.
+
+        Returns:
+            UploadSession: Where and how to upload the file, and the token to complete it.
+        """
+        if payload.document_size > settings.UPLOAD_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Files may not be larger than {settings.UPLOAD_MAX_SIZE} bytes",
+            )
+        document_type = await document_repository.get_document_type_by_id(
+            payload.document_type_id
+        )
+        if not document_type:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="The document with this id does not exist in the database",
+            )
+
+        path = f"{user_id}/{document_type['document_key']}_{uuid.uuid4().hex}"
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=settings.UPLOAD_SESSION_TTL)
+        claims = {
+            # The upload may finish just before the URL expires, leave time to complete it
+            "exp": expires_at + timedelta(seconds=settings.UPLOAD_SESSION_TTL),
+            "user_id": user_id,
+            "document_path": path,
+            "document_type_id": payload.document_type_id,
+            "document_type": payload.document_type.value,
+            "document_size": payload.document_size,
+            "document_name": payload.document_name,
+        }
+        return UploadSession(
+            upload_url=blob_storage.upload_url(path, expires_at),
+            upload_headers={
+                "x-ms-blob-type": "BlockBlob",
+                "x-ms-blob-content-type": payload.document_type.value,
+            },
+            session_token=jwt.encode(claims, self._signing_key, algorithm=ALGORITHM),
+            document_path=path,
+            expires_at=expires_at,
+        )
+
+    async def complete_session(self, user_id: str, session_token: str) -> DocumentId:
+        """
+        Record the document of a finished upload.
+
+        A blob that does not match the session is deleted, so the client has
+        to start a new session.
+
+        Args:
+            user_id (str): The user completing the upload, must be the one who started it.
+            session_token (str): Token of the session.
+
+        Returns:
+            DocumentId: The recorded document.
+        """
+        try:
+            claims = jwt.decode(session_token, self._signing_key, algorithms=[ALGORITHM])
+        except jwt.InvalidTokenError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid or expired upload session",
+            )
+        if claims["user_id"] != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="This upload session belongs to another user",
+            )
+
+        path = claims["document_path"]
+        if await document_repository.get_document_by_path(path):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="This upload session is already complete",
+            )
+        try:
+            properties = await blob_storage.properties(path)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The file has not been uploaded",
+            )
+
+        if (
+            properties["size"] != claims["document_size"]
+            or properties["content_type"] != claims["document_type"]
+        ):
+            logger.warning(
+                f"Upload {path} does not match its session: {properties['size']} bytes "
+                f"of {properties['content_type']}, expected {claims['document_size']} bytes "
+                f"of {claims['document_type']}"
+            )
+            await blob_storage.delete(path)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The uploaded file does not match the declared size and type",
+            )
+
+        payload = DocumentCreate(
+            document_name=claims["document_name"],
+            document_type=claims["document_type"],
+            document_size=claims["document_size"],
+            status="pending",
+            user_id=user_id,
+            document_type_id=claims["document_type_id"],
+            document_path=path,
+        )
+        document_id = await document_repository.create(payload)
+        return DocumentId(**payload.dict(), id=document_id)
+
+
+upload_session_service = UploadSessionService()
@@ -1,26 +1,23 @@
 # app/utils/azure_storage.py
-from azure.storage.blob import BlobServiceClient, ContentSettings
 from app.core.config import settings
-import uuid
+from app.core.logger import logger
+from app.utils.blob_storage import blob_storage
 
 class AzureImageStorage:
     """
     Utility class for handling image operations with Azure Storage.
     
     This class provides methods for uploading, retrieving, and deleting images
-    from Azure Blob Storage with proper content types and direct URLs.
+    from Azure Blob Storage with proper content types and direct URLs. Transfers
+    go through `blob_storage`, so they do not block the event loop.
     """
     
-    def __init__(self):
-        self.connection_string = settings.CONNECTION_STRING
-        self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
-    
     async def upload_image(self, file_content, user_id, container_name, filename, content_type):
         """
         Upload an image to Azure Storage and return metadata including direct URL
         
         Args:
-            file_content (bytes): The binary content of the file
+            file_content (bytes | BinaryIO): The content of the file, or a file object
             user_id (str): The ID of the user the image belongs to
             container_name (str): The Azure container name
             filename (str): Name to use for the file
@@ -29,18 +26,13 @@ class AzureImageStorage:
         Returns:
             dict: Metadata about the uploaded image including URL
         """
-        # Get container client
-        container_client = self.blob_service_client.get_container_client(container_name)
-        
         # Set the full path for the blob
         blob_path = f"{user_id}/{filename}"
         
-        # Set content settings for proper content type
-        content_settings = ContentSettings(content_type=content_type)
-        
-        # Upload the file
-        blob_client = container_client.get_blob_client(blob_path)
-        blob_client.upload_blob(file_content, overwrite=True, content_settings=content_settings)
+        # Upload the file with its content type
+        await blob_storage.upload(
+            blob_path, file_content, content_type=content_type, container=container_name
+        )
         
         # Get the direct URL
         image_url = f"{settings.AZURE_STORAGE_PUBLIC_URL}/{blob_path}"
@@ -63,19 +55,17 @@ class AzureImageStorage:
             bool: True if deletion successful
         """
         try:
-            container_client = self.blob_service_client.get_container_client(container_name)
-            blob_client = container_client.get_blob_client(blob_path)
-            blob_client.delete_blob()
+            await blob_storage.delete(blob_path, container=container_name)
             return True
         except Exception as e:
-            print(f"Error deleting blob: {str(e)}")
+            logger.error(f"Error deleting blob: {str(e)}")
             return False
     async def upload_document(self, file_content, user_id, container_name, filename, content_type):
         """
         Upload a document to Azure Storage and return metadata including direct URL
         
         Args:
-            file_content (bytes): The binary content of the file
+            file_content (bytes | BinaryIO): The content of the file, or a file object
             user_id (str): The ID of the user the document belongs to
             container_name (str): The Azure container name
             filename (str): Name to use for the file
@@ -84,18 +74,13 @@ class AzureImageStorage:
         Returns:
             dict: Metadata about the uploaded document including URL
         """
-        # Get container client
-        container_client = self.blob_service_client.get_container_client(container_name)
-        
         # Set the full path for the blob
         blob_path = f"{user_id}/documents/{filename}"
         
-        # Set content settings for proper content type
-        content_settings = ContentSettings(content_type=content_type)
-        
-        # Upload the file
-        blob_client = container_client.get_blob_client(blob_path)
-        blob_client.upload_blob(file_content, overwrite=True, content_settings=content_settings)
+        # Upload the file with its content type
+        await blob_storage.upload(
+            blob_path, file_content, content_type=content_type, container=container_name
+        )
         
         # Get the direct URL
         document_url = f"{settings.AZURE_STORAGE_PUBLIC_URL}/{blob_path}"
@@ -106,6 +91,25 @@ class AzureImageStorage:
             "document_url": document_url
         }
         
+    def document_location(self, document_url):
+        """
+        Get the container and blob path of a document from its URL
+        
+        Args:
+            document_url (str): The URL of the document
+            
+        Returns:
+            tuple: The container name and the blob path
+        """
+        # Example: if URL is "https://storageaccount.blob.core.windows.net/container/user_id/documents/filename"
+        # We need to extract "user_id/documents/filename"
+        url_parts = document_url.split(settings.AZURE_STORAGE_PUBLIC_URL + '/')
+        if len(url_parts) != 2:
+            raise ValueError(f"Invalid document URL format: {document_url}")
+        
+        # Documents are uploaded to the profile picture container
+        return settings.PROFILEPICTURECONTAINER_NAME, url_parts[1]
+        
     async def download_document(self, document_url):
         """
         Download a document from Azure Storage based on its URL
@@ -117,31 +121,12 @@ class AzureImageStorage:
             bytes: The content of the document
         """
         try:
-            # Extract blob path from the URL
-            # Example: if URL is "https://storageaccount.blob.core.windows.net/container/user_id/documents/filename"
-            # We need to extract "user_id/documents/filename"
-            url_parts = document_url.split(settings.AZURE_STORAGE_PUBLIC_URL + '/')
-            if len(url_parts) != 2:
-                raise ValueError(f"Invalid document URL format: {document_url}")
-                
-            blob_path = url_parts[1]
-            
-            # Extract container name based on URL structure
-            # For most Azure Storage URLs, the container name is part of the hostname
-            # If you have a specific container, use that instead
-            container_name = settings.PROFILEPICTURECONTAINER_NAME  # Using the default container
-            
-            # Get the blob client
-            container_client = self.blob_service_client.get_container_client(container_name)
-            blob_client = container_client.get_blob_client(blob_path)
+            container_name, blob_path = self.document_location(document_url)
             
             # Download the blob
-            download_stream = blob_client.download_blob()
-            
-            # Return the content
-            return download_stream.readall()
+            return await blob_storage.download(blob_path, container=container_name)
         except Exception as e:
-            print(f"Error downloading document: {str(e)}")
+            logger.error(f"Error downloading document: {str(e)}")
             raise
         
     async def delete_document(self, document_url):
@@ -155,24 +140,14 @@ class AzureImageStorage:
             bool: True if deletion successful
         """
         try:
-            # Extract blob path from the URL
-            url_parts = document_url.split(settings.AZURE_STORAGE_PUBLIC_URL + '/')
-            if len(url_parts) != 2:
-                raise ValueError(f"Invalid document URL format: {document_url}")
-                
-            blob_path = url_parts[1]
-            
-            # Use the default container
-            container_name = settings.PROFILEPICTURECONTAINER_NAME
+            container_name, blob_path = self.document_location(document_url)
             
             # Delete the blob
-            container_client = self.blob_service_client.get_container_client(container_name)
-            blob_client = container_client.get_blob_client(blob_path)
-            blob_client.delete_blob()
+            await blob_storage.delete(blob_path, container=container_name)
             
             return True
         except Exception as e:
-            print(f"Error deleting document: {str(e)}")
+            logger.error(f"Error deleting document: {str(e)}")
             return False
 
 # Create a singleton instance
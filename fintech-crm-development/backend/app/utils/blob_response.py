@@ -0,0 +1,117 @@
+from typing import Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.utils.blob_storage import blob_storage
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    candidates = (value.strip() for value in header.split(","))
+    return any(value.removeprefix("W/") == etag.removeprefix("W/") for value in candidates)
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single `bytes=` range against a blob of `size` bytes.
+
+    Returns:
+        Optional[Tuple[int, int]]: First and last byte of the range, None when the
+        header is not a single byte range and the whole blob should be sent.
+
+    Raises:
+        ValueError: The range lies outside the blob.
+    """
+    unit, _, ranges = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    start, sep, end = ranges.strip().partition("-")
+    if not sep or not (start + end).isdigit():
+        return None
+
+    if not start:
+        # Suffix range, the last `end` bytes
+        length = int(end)
+        if length == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(size - length, 0), size - 1
+
+    first = int(start)
+    last = min(int(end), size - 1) if end else size - 1
+    if first >= size or first > last:
+        raise ValueError("Unsatisfiable range")
+    return first, last
+
+
+async def blob_response(
+    request: Request,
+    path: str,
+    container: Optional[str] = None,
+    media_type: str = "application/octet-stream",
+    filename: Optional[str] = None,
+    disposition: str = "attachment",
+) -> Response:
+    """
+    Stream a blob to the client, honouring `Range`, `If-Range` and `If-None-Match`.
+
+    The blob is sent chunk by chunk as it is read from storage, so a download
+    holds at most BLOB_CHUNK_SIZE bytes in memory. A single byte range is
+    answered with 206, other range requests get the whole blob.
+
+    Args:
+        request (Request): The incoming request, for its conditional and range headers.
+        path (str): Path of the blob in the container.
+        container (str, optional): Container, defaults to CONTAINER_NAME.
+        media_type (str): Content type of the response.
+        filename (str, optional): Sets Content-Disposition when given.
+        disposition (str): "attachment" or "inline".
+
+    Returns:
+        Response: 200, 206, 304 or 416 response.
+
+    Raises:
+        FileNotFoundError: The blob does not exist.
+    """
+    properties = await blob_storage.properties(path, container)
+    size, etag = properties["size"], properties["etag"]
+
+    headers = {"Accept-Ranges": "bytes"}
+    if etag:
+        headers["ETag"] = etag
+    if filename:
+        headers["Content-Disposition"] = f'{disposition}; filename="{filename}"'
+
+    if etag and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range == etag):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+    if size == 0:
+        return Response(b"", media_type=media_type, headers=headers)
+
+    status_code, offset, length = 200, 0, size
+    if byte_range is not None:
+        first, last = byte_range
+        status_code, offset, length = 206, first, last - first + 1
+        headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+    headers["Content-Length"] = str(length)
+
+    return StreamingResponse(
+        blob_storage.iter_chunks(path, container, offset=offset, length=length),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -0,0 +1,353 @@
+import asyncio
+import functools
+import hmac
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Optional, Union
+
+from urllib.parse import quote
+
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.storage.blob import (
+    BlobSasPermissions,
+    BlobServiceClient,
+    ContentSettings,
+    generate_blob_sas,
+)
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.security import derive_key
+
+BlobData = Union[bytes, BinaryIO]
+
+
+class AzureBlobBackend:
+    """
+    Blocking access to Azure Blob Storage, run by `BlobStorage` in its threads.
+
+    Blobs larger than BLOB_CHUNK_SIZE are transferred in blocks of that size,
+    BLOB_MAX_CONCURRENCY of them at a time. Missing blobs raise `FileNotFoundError`,
+    uploads without `overwrite` to an existing blob raise `FileExistsError`.
+    """
+
+    name = "azure"
+
+    def __init__(self, connection_string: str):
+        chunk_size = settings.BLOB_CHUNK_SIZE
+        self._client = BlobServiceClient.from_connection_string(
+            connection_string,
+            max_block_size=chunk_size,
+            max_single_put_size=chunk_size,
+            max_chunk_get_size=chunk_size,
+            max_single_get_size=chunk_size,
+        )
+
+    def _blob(self, container: str, path: str):
+        return self._client.get_blob_client(container, path)
+
+    def upload(
+        self,
+        container: str,
+        path: str,
+        data: BlobData,
+        content_type: Optional[str],
+        overwrite: bool,
+    ):
+        content_settings = ContentSettings(content_type=content_type) if content_type else None
+        try:
+            self._blob(container, path).upload_blob(
+                data,
+                overwrite=overwrite,
+                content_settings=content_settings,
+                max_concurrency=settings.BLOB_MAX_CONCURRENCY,
+            )
+        except ResourceExistsError:
+            raise FileExistsError(f"Blob exists: {container}/{path}")
+
+    def upload_url(self, container: str, path: str, expires_at: datetime) -> str:
+        # Create only, the URL cannot read blobs or overwrite an existing one
+        sas = generate_blob_sas(
+            self._client.account_name,
+            container,
+            path,
+            account_key=self._client.credential.account_key,
+            permission=BlobSasPermissions(create=True),
+            start=datetime.now(timezone.utc) - timedelta(minutes=5),
+            expiry=expires_at,
+        )
+        return f"{self._blob(container, path).url}?{sas}"
+
+    def download(self, container: str, path: str) -> bytes:
+        try:
+            stream = self._blob(container, path).download_blob(
+                max_concurrency=settings.BLOB_MAX_CONCURRENCY
+            )
+            return stream.readall()
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Blob not found: {container}/{path}")
+
+    def open_chunks(
+        self, container: str, path: str, offset: int, length: Optional[int]
+    ) -> Iterator[bytes]:
+        try:
+            stream = self._blob(container, path).download_blob(offset=offset, length=length)
+            return stream.chunks()
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Blob not found: {container}/{path}")
+
+    def properties(self, container: str, path: str) -> Dict[str, Any]:
+        try:
+            properties = self._blob(container, path).get_blob_properties()
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Blob not found: {container}/{path}")
+        return {
+            "size": properties.size,
+            "etag": properties.etag,
+            "content_type": properties.content_settings.content_type,
+        }
+
+    def delete(self, container: str, path: str):
+        try:
+            self._blob(container, path).delete_blob()
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Blob not found: {container}/{path}")
+
+    def list(self, container: str, prefix: str) -> List[str]:
+        container_client = self._client.get_container_client(container)
+        return [blob.name for blob in container_client.list_blobs(name_starts_with=prefix)]
+
+
+class LocalBlobBackend:
+    """
+    Blobs kept as files under `root/<container>/<path>`, for tests and local runs.
+
+    Has the same interface and errors as `AzureBlobBackend`. Content types are
+    kept in JSON files under `root/.properties`. Upload URLs point to the local
+    stand-in of the blob service, see `endpoints/local_blob_storage.py`.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str, base_url: str):
+        self._root = os.path.abspath(root)
+        self._base_url = base_url
+        self._signing_key = derive_key("local-blob-upload").encode()
+
+    def _file(self, container: str, path: str) -> str:
+        file_path = os.path.abspath(os.path.join(self._root, container, path))
+        if not file_path.startswith(os.path.join(self._root, container) + os.sep):
+            raise ValueError(f"Invalid blob path: {path}")
+        return file_path
+
+    def _properties_file(self, container: str, path: str) -> str:
+        self._file(container, path)
+        return os.path.join(self._root, ".properties", container, f"{path}.json")
+
+    def _sign(self, container: str, path: str, expires: int) -> str:
+        message = f"{container}/{path}:{expires}".encode()
+        return hmac.new(self._signing_key, message, "sha256").hexdigest()
+
+    def upload(
+        self,
+        container: str,
+        path: str,
+        data: BlobData,
+        content_type: Optional[str],
+        overwrite: bool,
+    ):
+        file_path = self._file(container, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb" if overwrite else "xb") as f:
+            if isinstance(data, bytes):
+                f.write(data)
+            else:
+                shutil.copyfileobj(data, f, settings.BLOB_CHUNK_SIZE)
+
+        properties_file = self._properties_file(container, path)
+        os.makedirs(os.path.dirname(properties_file), exist_ok=True)
+        with open(properties_file, "w") as f:
+            json.dump({"content_type": content_type}, f)
+
+    def upload_url(self, container: str, path: str, expires_at: datetime) -> str:
+        expires = int(expires_at.timestamp())
+        signature = self._sign(container, path, expires)
+        return f"{self._base_url}/{container}/{quote(path)}?se={expires}&sig={signature}"
+
+    def verify_upload_url(self, container: str, path: str, expires: int, signature: str) -> bool:
+        """Whether `expires` and `signature` come from an unexpired `upload_url`."""
+        if expires < time.time():
+            return False
+        return hmac.compare_digest(signature, self._sign(container, path, expires))
+
+    def download(self, container: str, path: str) -> bytes:
+        with open(self._file(container, path), "rb") as f:
+            return f.read()
+
+    def open_chunks(
+        self, container: str, path: str, offset: int, length: Optional[int]
+    ) -> Iterator[bytes]:
+        f = open(self._file(container, path), "rb")
+        f.seek(offset)
+
+        def chunks():
+            remaining = length
+            with f:
+                while remaining is None or remaining > 0:
+                    size = settings.BLOB_CHUNK_SIZE
+                    chunk = f.read(size if remaining is None else min(size, remaining))
+                    if not chunk:
+                        return
+                    if remaining is not None:
+                        remaining -= len(chunk)
+                    yield chunk
+
+        return chunks()
+
+    def properties(self, container: str, path: str) -> Dict[str, Any]:
+        stat = os.stat(self._file(container, path))
+        try:
+            with open(self._properties_file(container, path)) as f:
+                content_type = json.load(f).get("content_type")
+        except FileNotFoundError:
+            content_type = None
+        return {
+            "size": stat.st_size,
+            "etag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            "content_type": content_type,
+        }
+
+    def delete(self, container: str, path: str):
+        os.remove(self._file(container, path))
+        try:
+            os.remove(self._properties_file(container, path))
+        except FileNotFoundError:
+            pass
+
+    def list(self, container: str, prefix: str) -> List[str]:
+        container_root = os.path.join(self._root, container)
+        names = []
+        for directory, _, files in os.walk(container_root):
+            for filename in files:
+                name = os.path.relpath(os.path.join(directory, filename), container_root)
+                name = name.replace(os.sep, "/")
+                if name.startswith(prefix):
+                    names.append(name)
+        return sorted(names)
+
+
+class BlobStorage:
+    """
+    Async blob storage, every backend call runs in a dedicated thread pool.
+
+    Keeping the blocking SDK calls on BLOB_IO_THREADS threads leaves the event
+    loop free while large blobs are transferred, and keeps storage I/O from
+    starving the default executor. Methods default to the CONTAINER_NAME
+    container, missing blobs raise `FileNotFoundError`.
+    """
+
+    def __init__(self, backend, default_container: str):
+        self.backend = backend
+        self.container = default_container
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.BLOB_IO_THREADS, thread_name_prefix="blob-io"
+        )
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+
+    async def upload(
+        self,
+        path: str,
+        data: BlobData,
+        content_type: Optional[str] = None,
+        overwrite: bool = True,
+        container: Optional[str] = None,
+    ):
+        """
+        Upload a blob.
+
+        Args:
+            path (str): Path of the blob in the container.
+            data (bytes | BinaryIO): Content, file objects are read in chunks, so
+                an `UploadFile.file` is sent without being loaded in memory.
+            content_type (str, optional): MIME type stored with the blob.
+            overwrite (bool): Replace an existing blob instead of raising `FileExistsError`.
+            container (str, optional): Container, defaults to CONTAINER_NAME.
+        """
+        await self._run(
+            self.backend.upload, container or self.container, path, data, content_type, overwrite
+        )
+
+    def upload_url(
+        self, path: str, expires_at: datetime, container: Optional[str] = None
+    ) -> str:
+        """
+        Pre-signed URL a client can PUT a new blob to until `expires_at`.
+
+        The URL is computed locally and only allows creating the blob, it can
+        not read blobs or overwrite an existing one.
+        """
+        return self.backend.upload_url(container or self.container, path, expires_at)
+
+    async def download(self, path: str, container: Optional[str] = None) -> bytes:
+        """Download a whole blob, prefer `iter_chunks` for large ones."""
+        return await self._run(self.backend.download, container or self.container, path)
+
+    async def iter_chunks(
+        self,
+        path: str,
+        container: Optional[str] = None,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Download a blob, or a range of it, chunk by chunk.
+
+        Args:
+            path (str): Path of the blob in the container.
+            container (str, optional): Container, defaults to CONTAINER_NAME.
+            offset (int): First byte to read.
+            length (int, optional): Bytes to read, up to the end of the blob by default.
+
+        Returns:
+            AsyncIterator[bytes]: Chunks of at most BLOB_CHUNK_SIZE bytes.
+        """
+        chunks = await self._run(
+            self.backend.open_chunks, container or self.container, path, offset, length
+        )
+        while True:
+            chunk = await self._run(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    async def properties(self, path: str, container: Optional[str] = None) -> Dict[str, Any]:
+        """Size, quoted ETag and content type (None if unknown) of a blob."""
+        return await self._run(self.backend.properties, container or self.container, path)
+
+    async def delete(self, path: str, container: Optional[str] = None):
+        await self._run(self.backend.delete, container or self.container, path)
+
+    async def list(self, prefix: str, container: Optional[str] = None) -> List[str]:
+        """Names of the blobs whose path starts with `prefix`."""
+        return await self._run(self.backend.list, container or self.container, prefix)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+def _storage_backend():
+    if settings.BLOB_STORAGE_BACKEND == "local":
+        logger.info(f"Using local blob storage in {settings.BLOB_STORAGE_LOCAL_ROOT}")
+        base_url = f"{str(settings.SERVER_HOST).rstrip('/')}{settings.API_V1_STR}/blob-storage"
+        return LocalBlobBackend(settings.BLOB_STORAGE_LOCAL_ROOT, base_url)
+    return AzureBlobBackend(settings.CONNECTION_STRING)
+
+
+blob_storage = BlobStorage(_storage_backend(), settings.CONTAINER_NAME)
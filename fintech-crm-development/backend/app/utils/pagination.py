@@ -0,0 +1,119 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import Table, and_, or_, select, text
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+    return str(value)
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): The sort column values followed by the row id.
+
+    Returns:
+        str: URL safe cursor string.
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor created by `encode_cursor`, the sort value and the row id.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != 2:
+            raise ValueError("cursor payload must be a list of two values")
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset_paginate(
+    query,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True,
+):
+    """
+    Apply keyset pagination on (sort_column, id_column) to a select query.
+
+    One extra row is fetched so `split_page` can tell whether a next page exists.
+    The WHERE clause only needs the position of the previous page's last row,
+    so every page costs the same regardless of depth.
+    """
+    if cursor:
+        last_sort_value, last_id = decode_cursor(cursor)
+        if descending:
+            after = or_(
+                sort_column < last_sort_value,
+                and_(sort_column == last_sort_value, id_column < last_id),
+            )
+        else:
+            after = or_(
+                sort_column > last_sort_value,
+                and_(sort_column == last_sort_value, id_column > last_id),
+            )
+        query = query.where(after)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    return query.limit(limit + 1)
+
+
+def split_page(
+    rows: List[Any], limit: int, sort_key: str, id_key: str = "id"
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim the look-ahead row of a keyset page and build the next cursor.
+
+    Returns:
+        Tuple[List, Optional[str]]: The page rows and the cursor of the next page,
+        None when this is the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor([last[sort_key], last[id_key]])
+
+
+async def estimate_count(database, table: Table) -> int:
+    """
+    Approximate the number of rows in a table from the planner statistics.
+
+    This reads `pg_class.reltuples` instead of scanning the table, so it is
+    O(1) but only as fresh as the last ANALYZE/autovacuum run.
+    """
+    query = select([text("reltuples::bigint")]).select_from(text("pg_class")).where(
+        text("oid = to_regclass(:table_name)")
+    )
+    estimate = await database.fetch_val(query.params(table_name=table.name))
+    return max(int(estimate or 0), 0)
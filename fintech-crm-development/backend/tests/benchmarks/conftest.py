@@ -0,0 +1,24 @@
+import time
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if "benchmarks" in item.path.parts:
+            item.add_marker(pytest.mark.benchmark)
+
+
+@pytest.fixture
+def best_time():
+    """Best wall time in seconds of `repeat` calls of a function, the least noisy estimate."""
+
+    def best_time(function, repeat=5):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return best_time
@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.services.lead_record import LeadRecord
+from app.services.lead_service import lead_service
+
+LEADS = 50_000
+
+
+def make_leads(count):
+    """A sync-like mix: loan applications, CIBIL checks of the same phones, subscribers."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    leads = []
+    for index in range(count):
+        kind = index % 4
+        created_at = start + timedelta(minutes=index)
+        if kind == 3:
+            leads.append(
+                LeadRecord(
+                    id=str(uuid.uuid4()),
+                    email=f"subscriber{index}@example.com",
+                    lead_source="beehiiv",
+                    created_at=created_at,
+                )
+            )
+        else:
+            leads.append(
+                LeadRecord(
+                    id=str(uuid.uuid4()),
+                    # Every CIBIL check shares its phone number with a loan application
+                    phone_number=f"9{index // 2 % (count // 4):09d}",
+                    lead_source="strapi_cibil" if kind == 1 else "strapi_loan",
+                    cibil_score=700 if kind == 1 else None,
+                    created_at=created_at,
+                )
+            )
+    return leads
+
+
+def test_consolidate_leads_scales_linearly(best_time):
+    small, large = make_leads(LEADS // 10), make_leads(LEADS)
+
+    small_time = best_time(lambda: lead_service.consolidate_leads(small))
+    large_time = best_time(lambda: lead_service.consolidate_leads(large))
+
+    print(
+        f"\nconsolidate_leads: {LEADS // 10} leads in {small_time:.4f}s, "
+        f"{LEADS} leads in {large_time:.4f}s"
+    )
+    # Ten times the leads cost about ten times as much, a quadratic pass costs a hundred
+    assert large_time < small_time * 30
@@ -0,0 +1,61 @@
+import tracemalloc
+from datetime import datetime, timezone
+
+from app.schemas.user import UnifiedLeadBase
+from app.services.lead_record import LeadRecord
+
+LEADS = 20_000
+
+# A converted loan application, the typical lead of a sync
+VALUES = {
+    "id": "0b9f6c1e-8d1a-4a51-9b53-3c1f0c7a2d11",
+    "user_id": "1234",
+    "document_name": "abc123",
+    "full_name": "Jane Doe",
+    "email": "jane@example.com",
+    "phone_number": "9876543210",
+    "loan_amount": 2500000.0,
+    "loan_type": "business",
+    "lead_source": "strapi_loan",
+    "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "raw_data": {"id": 1234, "name": "Jane Doe"},
+    "documents_count": 0,
+}
+
+
+def build(lead_class):
+    return [lead_class(**VALUES) for _ in range(LEADS)]
+
+
+def allocated(function):
+    """Bytes still allocated by the result of a function."""
+    tracemalloc.start()
+    try:
+        result = function()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def test_lead_record_is_cheaper_to_build_than_the_pydantic_lead(best_time):
+    record_time = best_time(lambda: build(LeadRecord), repeat=3)
+    model_time = best_time(lambda: build(UnifiedLeadBase), repeat=3)
+
+    print(
+        f"\n{LEADS} leads built in {record_time:.3f}s as LeadRecord, "
+        f"{model_time:.3f}s as UnifiedLeadBase"
+    )
+    assert record_time < model_time
+
+
+def test_lead_record_allocates_less_than_the_pydantic_lead():
+    record_bytes = allocated(lambda: build(LeadRecord))
+    model_bytes = allocated(lambda: build(UnifiedLeadBase))
+
+    print(
+        f"\n{LEADS} leads hold {record_bytes / 2**20:.1f} MiB as LeadRecord, "
+        f"{model_bytes / 2**20:.1f} MiB as UnifiedLeadBase"
+    )
+    assert record_bytes < model_bytes
@@ -0,0 +1,55 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+
+from app.schemas.user import UnifiedLeadBase
+from app.services import lead_service as lead_service_module
+from app.services.lead_record import LeadRecord
+from app.services.lead_service import lead_service
+
+LEADS = 2_000
+
+
+def lead_values(index, prefix):
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": f"{prefix}-{index}",
+        "full_name": f"Lead {index}",
+        "phone_number": f"{prefix}{index:09d}",
+        "loan_amount": 2500000.0,
+        "lead_source": "strapi_loan",
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "raw_data": {"id": index},
+    }
+
+
+def test_set_based_upsert_beats_the_per_row_store(pg_database, monkeypatch):
+    monkeypatch.setattr(lead_service_module, "database", pg_database)
+    monkeypatch.setattr(lead_service.user_repository, "database", pg_database)
+    # Distinct phone numbers per path, each one only inserts new users
+    per_row = [UnifiedLeadBase(**lead_values(index, "8")) for index in range(LEADS)]
+    set_based = [LeadRecord(**lead_values(index, "9")) for index in range(LEADS)]
+
+    async def timed(coroutine):
+        start = time.perf_counter()
+        await coroutine
+        return time.perf_counter() - start
+
+    async def scenario():
+        await pg_database.connect()
+        try:
+            return (
+                await timed(lead_service.store_users(per_row)),
+                await timed(lead_service._process_users_with_phone(set_based)),
+            )
+        finally:
+            await pg_database.disconnect()
+
+    per_row_time, set_based_time = asyncio.run(scenario())
+
+    print(
+        f"\n{LEADS} leads stored in {per_row_time:.3f}s by store_users, "
+        f"{set_based_time:.3f}s by _process_users_with_phone"
+    )
+    assert set_based_time < per_row_time
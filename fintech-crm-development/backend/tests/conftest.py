@@ -0,0 +1,90 @@
+import importlib
+import os
+import pkgutil
+
+import pytest
+
+# Settings without defaults, so the app modules import without a .env file
+TEST_SETTINGS = {
+    "DATABASE_USER": "test",
+    "DATABASE_PASSWORD": "test",
+    "DATABASE_HOST": "localhost",
+    "DATABASE_PORT": "5432",
+    "DATABASE_NAME": "test",
+    "STRAPI_API_URL": "http://strapi.test",
+    "STRAPI_API_TOKEN": "test",
+    "SECRET_KEY": "test",
+    "REFRESH_SECRET_KEY": "test",
+    "BEEHIIV_PUBLICATION_ID": "test",
+    "BEEHIIV_API_KEY": "test",
+    "SERVER_HOST": "http://localhost",
+    "CLIENT_HOST": "http://localhost",
+    "CONNECTION_STRING": (
+        "DefaultEndpointsProtocol=https;AccountName=test;AccountKey=dGVzdA==;"
+        "EndpointSuffix=core.windows.net"
+    ),
+    "CONTAINER_NAME": "test",
+    "PROFILEPICTURECONTAINER_NAME": "test-pictures",
+    "KAFKA_BOOTSTRAP_SERVERS": "localhost:9092",
+    "KAFKA_GROUP_ID": "test",
+    "KAFKA_WEBSOCKET_GROUP_ID": "test",
+    "TEXTLOCAL_KEY": "test",
+    "TEXTLOCAL_SENDER": "test",
+    "TEXTLOCAL_URL": "http://textlocal.test",
+    "AZURE_APPINSIGHTS_INSTRUMENTATIONKEY": (
+        "InstrumentationKey=00000000-0000-0000-0000-000000000000"
+    ),
+    "AZURE_STORAGE_PUBLIC_URL": "http://storage.test",
+    "EMAIL_RESET_TOKEN_EXPIRE_MINUTES": "10",
+}
+for name, value in TEST_SETTINGS.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture(scope="session")
+def pg_engine():
+    """
+    Engine of the Postgres database in TEST_DATABASE_URL, with every table created.
+
+    Tests using it are skipped when the variable is not set. The database needs
+    the pg_trgm extension available, as in production.
+    """
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    import sqlalchemy
+
+    import app.models
+    from app.db.session import metadata
+
+    for module in pkgutil.iter_modules(app.models.__path__):
+        importlib.import_module(f"app.models.{module.name}")
+
+    engine = sqlalchemy.create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def pg_conn(pg_engine):
+    """Connection whose changes are rolled back after the test."""
+    with pg_engine.connect() as conn:
+        transaction = conn.begin()
+        yield conn
+        transaction.rollback()
+
+
+@pytest.fixture
+def pg_database(pg_engine):
+    """
+    `databases` client of the TEST_DATABASE_URL database, as used by the repositories.
+
+    All its connections share one transaction, rolled back on disconnect.
+    """
+    import databases
+
+    return databases.Database(os.environ["TEST_DATABASE_URL"], force_rollback=True)
@@ -0,0 +1,18 @@
+import asyncio
+import os
+import tempfile
+
+from app.services.bulk_import_service import BulkImportService
+
+
+def test_unreadable_csv_fails_the_job_and_removes_the_upload():
+    service = BulkImportService()
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    os.close(fd)
+    job = service.create_job("empty.csv")
+
+    asyncio.run(service.run_import_job(job.job_id, path))
+
+    assert job.status == "failed"
+    assert job.finished_at is not None
+    assert not os.path.exists(path)
@@ -0,0 +1,55 @@
+import asyncio
+
+from app.core.cache import LocalCacheBackend, ResponseCache
+
+
+def make_cache():
+    return ResponseCache("test", LocalCacheBackend(maxsize=10, ttl=60))
+
+
+def test_response_is_built_once_then_served_from_the_cache():
+    cache = make_cache()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return b"page"
+
+    async def scenario():
+        return [await cache.get_or_set("key", build) for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [(b"page", False), (b"page", True)]
+    assert len(builds) == 1
+    assert cache.stats() == {
+        "backend": "local",
+        "hits": 1,
+        "misses": 1,
+        "hit_ratio": 0.5,
+        "size": 1,
+    }
+
+
+def test_invalidate_drops_cached_responses():
+    cache = make_cache()
+
+    async def scenario():
+        await cache.get_or_set("key", lambda: asyncio.sleep(0, b"old"))
+        await cache.invalidate()
+        return await cache.get_or_set("key", lambda: asyncio.sleep(0, b"new"))
+
+    assert asyncio.run(scenario()) == (b"new", False)
+
+
+def test_response_built_during_an_invalidation_is_not_served():
+    cache = make_cache()
+
+    async def scenario():
+        async def build_while_invalidating():
+            # A write lands while the response is being built from the old data
+            await cache.invalidate()
+            return b"stale"
+
+        await cache.get_or_set("key", build_while_invalidating)
+        return await cache.get_or_set("key", lambda: asyncio.sleep(0, b"fresh"))
+
+    assert asyncio.run(scenario()) == (b"fresh", False)
@@ -0,0 +1,31 @@
+import asyncio
+import os
+
+from app.db.metrics import InstrumentedDatabase, RequestDBMetrics, request_db_metrics
+
+
+def test_raw_connection_statements_are_counted(pg_engine):
+    # Without force_rollback, which replaces the instrumented connections with a plain one
+    database = InstrumentedDatabase(os.environ["TEST_DATABASE_URL"])
+    metrics = RequestDBMetrics()
+
+    async def scenario():
+        request_db_metrics.set(metrics)
+        await database.connect()
+        try:
+            async with database.connection() as connection:
+                raw_connection = connection.raw_connection
+                await raw_connection.execute("CREATE TEMP TABLE metrics_test (id int)")
+                await raw_connection.copy_records_to_table(
+                    "metrics_test", records=[(1,), (2,)], columns=["id"]
+                )
+                await raw_connection.executemany(
+                    "INSERT INTO metrics_test VALUES ($1)", [(3,), (4,)]
+                )
+                return await connection.fetch_val("SELECT count(*) FROM metrics_test")
+        finally:
+            await database.disconnect()
+
+    assert asyncio.run(scenario()) == 4
+    assert metrics.query_count == 4
+    assert metrics.db_time > 0
@@ -0,0 +1,54 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+
+from app.core.http_client import http_clients
+from app.service.external_service import ExternalDataRepository
+
+
+def test_strapi_pages_share_one_snapshot_window(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.params)
+        page = int(request.url.params["pagination[page]"])
+        return httpx.Response(
+            200,
+            json={"data": [{"id": page}], "meta": {"pagination": {"pageCount": 3}}},
+        )
+
+    monkeypatch.setitem(
+        http_clients._clients, "strapi", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    users = asyncio.run(ExternalDataRepository().fetch_strapi_cibil_users(since=since))
+
+    assert [user["id"] for user in users] == [1, 2, 3]
+    assert {params["filters[updatedAt][$gte]"] for params in requests} == {since.isoformat()}
+    # Every page is read with the upper bound taken before the first one
+    assert len({params["filters[updatedAt][$lte]"] for params in requests}) == 1
+    assert all(params.get_list("sort[1]") == ["id:asc"] for params in requests)
+
+
+def test_beehiiv_delta_rereads_the_watermark_second(monkeypatch):
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    watermark = int(since.timestamp())
+    subscribers = [
+        {"id": "sub-3", "created": watermark + 1},
+        {"id": "sub-2", "created": watermark},
+        {"id": "sub-1", "created": watermark - 1},
+    ]
+
+    def handler(request):
+        return httpx.Response(200, json={"data": subscribers, "pagination": {"has_more": False}})
+
+    monkeypatch.setitem(
+        http_clients._clients, "beehiiv", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    fetched = asyncio.run(ExternalDataRepository().fetch_beehiiv_subscribers(since=since))
+
+    # sub-2 shares the watermark second but may have been created after the last run
+    assert [subscriber["id"] for subscriber in fetched] == ["sub-3", "sub-2"]
@@ -0,0 +1,65 @@
+import asyncio
+
+from app.services.lead_ingestion_service import LeadIngestionService
+
+
+class FakeSyncStateRepository:
+    def __init__(self):
+        self.watermarks = {}
+
+    async def get_watermark(self, source):
+        return None
+
+    async def set_watermark(self, source, last_synced_at, cursor=None):
+        self.watermarks[source] = last_synced_at
+
+
+class FakeLeadService:
+    def __init__(self, failing_source):
+        self.failing_source = failing_source
+        self.storing = 0
+        self.overlapped = False
+
+    async def store_external_leads(self, source, records):
+        self.storing += 1
+        self.overlapped |= self.storing > 1
+        await asyncio.sleep(0.01)
+        self.storing -= 1
+        if source == self.failing_source:
+            raise RuntimeError("deadlock detected")
+
+    def _parse_date(self, value):
+        return None
+
+
+def make_service(monkeypatch, failing_source=None):
+    service = LeadIngestionService()
+    service.sync_state_repository = FakeSyncStateRepository()
+    service.lead_service = FakeLeadService(failing_source)
+    records = [{"id": 1}]
+
+    async def fetch(since):
+        return records
+
+    monkeypatch.setattr(
+        service, "_sources", lambda: {"strapi_loan": fetch, "strapi_cibil": fetch}
+    )
+    return service
+
+
+def test_sources_are_stored_one_after_another(monkeypatch):
+    service = make_service(monkeypatch)
+
+    result = asyncio.run(service.run_once())
+
+    assert result == {"strapi_loan": 1, "strapi_cibil": 1}
+    assert not service.lead_service.overlapped
+
+
+def test_failing_store_keeps_its_watermark_and_the_pass_going(monkeypatch):
+    service = make_service(monkeypatch, failing_source="strapi_loan")
+
+    result = asyncio.run(service.run_once())
+
+    assert result == {"strapi_loan": 0, "strapi_cibil": 1}
+    assert list(service.sync_state_repository.watermarks) == ["strapi_cibil"]
@@ -0,0 +1,52 @@
+from app.models.user import users
+from app.repository.lead_query_builder import LeadQueryBuilder
+
+
+def insert_users(conn, *names):
+    conn.execute(
+        users.insert(),
+        [
+            {"id": f"user-{index}", "full_name": name, "is_active": True}
+            for index, name in enumerate(names)
+        ],
+    )
+
+
+def test_ranked_search_runs_on_postgres(pg_conn):
+    insert_users(pg_conn, "Jon Smyth", "John Smith", "Alice Doe")
+
+    rows = pg_conn.execute(LeadQueryBuilder().ranked("jon", 10)).fetchall()
+
+    names = [row["full_name"] for row in rows]
+    assert names[0] == "Jon Smyth"
+    assert "Alice Doe" not in names
+    assert rows[0]["score"] == 1
+
+
+def test_ranked_search_matches_misspelled_terms(pg_conn):
+    insert_users(pg_conn, "John Smith", "Alice Doe")
+
+    # No substring match, only the trigram word similarity finds it
+    rows = pg_conn.execute(LeadQueryBuilder().ranked("johnn", 10)).fetchall()
+
+    assert [row["full_name"] for row in rows] == ["John Smith"]
+
+
+def test_ranked_search_keeps_other_filters(pg_conn):
+    insert_users(pg_conn, "John Smith")
+    pg_conn.execute(users.update().values(is_active=False))
+
+    rows = pg_conn.execute(LeadQueryBuilder().ranked("john", 10)).fetchall()
+
+    assert rows == []
+
+
+def test_keyset_count_matches_the_pages(pg_conn):
+    insert_users(pg_conn, "John Smith", "Jane Smith", "Alice Doe")
+    pg_conn.execute(users.update().where(users.c.id == "user-2").values(updated_on=None))
+    builder = LeadQueryBuilder()
+
+    paged = pg_conn.execute(builder.keyset(None, 10)).fetchall()
+
+    assert pg_conn.execute(builder.count(keyset=True)).scalar() == len(paged) == 2
+    assert pg_conn.execute(builder.count()).scalar() == 3
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+import app.repository.lead_repository as lead_repository_module
+from app.models.leads import leads
+from app.repository.lead_repository import lead_repository
+from app.schemas.leads import LeadCreate, LeadSource, LeadStatus
+
+
+@pytest.fixture
+def run(pg_database, monkeypatch):
+    """Run a coroutine with the lead repository on the test database."""
+    monkeypatch.setattr(lead_repository_module, "database", pg_database)
+
+    def run(coroutine_function):
+        async def main():
+            await pg_database.connect()
+            try:
+                return await coroutine_function()
+            finally:
+                await pg_database.disconnect()
+
+        return asyncio.run(main())
+
+    return run
+
+
+async def all_leads():
+    query = leads.select().order_by(leads.c.created_at)
+    return await lead_repository_module.database.fetch_all(query)
+
+
+def test_new_synced_lead_merges_into_lead_with_same_phone(run):
+    async def scenario():
+        existing_id = await lead_repository.create(
+            LeadCreate(source=LeadSource.WHATSAPP, phone_number="9876543210")
+        )
+        counts = await lead_repository.upsert_by_source_id(
+            [
+                LeadCreate(
+                    source=LeadSource.STRAPI,
+                    source_id="42",
+                    phone_number="9876543210",
+                    full_name="Jane Doe",
+                )
+            ]
+        )
+        return existing_id, counts, await all_leads()
+
+    existing_id, counts, rows = run(scenario)
+
+    assert counts == {"inserted": 0, "updated": 0, "merged": 1}
+    assert [(row["id"], row["full_name"]) for row in rows] == [(existing_id, "Jane Doe")]
+
+
+def test_new_synced_leads_sharing_an_email_become_one_lead(run):
+    async def scenario():
+        await lead_repository.upsert_by_source_id(
+            [
+                LeadCreate(source=LeadSource.BEEHIIV, source_id=source_id, email="a@b.com")
+                for source_id in ("sub-1", "sub-2")
+            ]
+        )
+        return await all_leads()
+
+    rows = run(scenario)
+
+    assert [(row["source_id"], row["email"]) for row in rows] == [("sub-1", "a@b.com")]
+
+
+def test_synced_lead_is_refreshed_on_its_source_id(run):
+    async def scenario():
+        lead = LeadCreate(source=LeadSource.STRAPI, source_id="7", full_name="Old")
+        await lead_repository.upsert_by_source_id([lead])
+        counts = await lead_repository.upsert_by_source_id(
+            [LeadCreate(source=LeadSource.STRAPI, source_id="7", full_name="New")]
+        )
+        return counts, await all_leads()
+
+    counts, rows = run(scenario)
+
+    assert counts == {"inserted": 0, "updated": 1, "merged": 0}
+    assert [row["full_name"] for row in rows] == ["New"]
+
+
+def test_merge_keeps_the_status_of_a_worked_lead(run):
+    async def scenario():
+        await lead_repository.create(
+            LeadCreate(
+                source=LeadSource.WHATSAPP, phone_number="9876543210", status=LeadStatus.CONTACTED
+            )
+        )
+        await lead_repository.merge_leads_bulk(
+            [LeadCreate(source=LeadSource.WHATSAPP, phone_number="9876543210", full_name="Jane")]
+        )
+        return await all_leads()
+
+    rows = run(scenario)
+
+    assert [(row["full_name"], row["status"]) for row in rows] == [("Jane", "contacted")]
+
+
+def test_merge_applies_an_explicit_status(run):
+    async def scenario():
+        await lead_repository.create(
+            LeadCreate(source=LeadSource.WHATSAPP, phone_number="9876543210")
+        )
+        await lead_repository.merge_leads_bulk(
+            [
+                LeadCreate(
+                    source=LeadSource.WHATSAPP,
+                    phone_number="9876543210",
+                    status=LeadStatus.QUALIFIED,
+                )
+            ]
+        )
+        return await all_leads()
+
+    rows = run(scenario)
+
+    assert [row["status"] for row in rows] == ["qualified"]
@@ -0,0 +1,29 @@
+import asyncio
+
+from app.core.cache import lead_list_cache
+from app.models.user import users
+from app.services import lead_service as lead_service_module
+from app.services.lead_record import LeadRecord
+from app.services.lead_service import lead_service
+
+
+def test_storing_leads_without_phone_invalidates_the_lead_list(pg_database, monkeypatch):
+    monkeypatch.setattr(lead_service_module, "database", pg_database)
+    monkeypatch.setattr(lead_service.user_repository, "database", pg_database)
+    lead = LeadRecord(id="sub-1", email="jane@example.com", lead_source="beehiiv")
+
+    async def scenario():
+        await pg_database.connect()
+        try:
+            generation = await lead_list_cache.backend.get_generation()
+            inserted = await lead_service._process_users_without_phone([lead])
+            stored = await pg_database.fetch_all(users.select())
+            return inserted, stored, await lead_list_cache.backend.get_generation() - generation
+        finally:
+            await pg_database.disconnect()
+
+    inserted, stored, generations = asyncio.run(scenario())
+
+    assert inserted == 1
+    assert [row["email"] for row in stored] == ["jane@example.com"]
+    assert generations == 1
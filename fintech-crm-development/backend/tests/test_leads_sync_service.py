@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+import app.service.leads_sync_service as leads_sync_module
+from app.core.http_client import http_clients
+from app.service.leads_sync_service import LeadSyncService
+
+
+class FakeLeadRepository:
+    def __init__(self):
+        self.synced = []
+
+    async def upsert_by_source_id(self, leads_in):
+        self.synced.extend(leads_in)
+        return {"inserted": len(leads_in), "updated": 0, "merged": 0}
+
+    async def merge_leads_bulk(self, leads_in):
+        return [None for _ in leads_in]
+
+
+class FakeSyncStateRepository:
+    def __init__(self, watermark=None):
+        self.watermarks = {}
+        self.watermark = watermark
+
+    async def get_watermark(self, source):
+        return self.watermark
+
+    async def set_watermark(self, source, last_synced_at, cursor=None):
+        self.watermarks[source] = last_synced_at
+
+
+@pytest.fixture
+def lead_repository(monkeypatch):
+    repository = FakeLeadRepository()
+    monkeypatch.setattr(leads_sync_module, "lead_repository", repository)
+    return repository
+
+
+@pytest.fixture
+def service(lead_repository):
+    service = LeadSyncService()
+    service.sync_state_repository = FakeSyncStateRepository(
+        datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    return service
+
+
+def mock_client(monkeypatch, name, handler):
+    monkeypatch.setitem(
+        http_clients._clients, name, httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+def test_strapi_sync_reads_every_page_oldest_first(service, lead_repository, monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.params)
+        page = int(request.url.params["pagination[page]"])
+        lead = {"id": page, "attributes": {"createdAt": f"2024-01-0{page + 1}T00:00:00Z"}}
+        return httpx.Response(
+            200, json={"data": [lead], "meta": {"pagination": {"pageCount": 3}}}
+        )
+
+    mock_client(monkeypatch, "strapi", handler)
+
+    counts = asyncio.run(service.sync_strapi_leads())
+
+    assert counts["fetched"] == 3
+    assert [lead.source_id for lead in lead_repository.synced] == ["1", "2", "3"]
+    assert all(params["sort[0]"] == "createdAt:asc" for params in requests)
+    assert {params["filters[createdAt][$gte]"] for params in requests} == {
+        "2024-01-01T00:00:00+00:00"
+    }
+    assert list(service.sync_state_repository.watermarks.values()) == [
+        datetime(2024, 1, 4, tzinfo=timezone.utc)
+    ]
+
+
+def test_beehiiv_sync_follows_the_page_cursor(service, monkeypatch):
+    pages = {
+        None: {"data": [{"id": "sub-1", "created": 1704153600}], "next_cursor": "c2"},
+        "c2": {"data": [{"id": "sub-2", "created": 1704240000}], "next_cursor": None},
+    }
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.params)
+        page = pages[request.url.params.get("cursor")]
+        return httpx.Response(
+            200,
+            json={
+                "data": page["data"],
+                "pagination": {
+                    "next_cursor": page["next_cursor"],
+                    "has_more": bool(page["next_cursor"]),
+                },
+            },
+        )
+
+    mock_client(monkeypatch, "beehiiv", handler)
+
+    counts = asyncio.run(service.sync_beehiiv_subscribers())
+
+    assert counts["fetched"] == 2
+    assert all(params["direction"] == "asc" for params in requests)
+    assert list(service.sync_state_repository.watermarks.values()) == [
+        datetime.fromtimestamp(1704240000, tz=timezone.utc)
+    ]
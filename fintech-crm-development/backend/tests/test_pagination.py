@@ -0,0 +1,24 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.user import users
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_paginate
+
+
+def test_cursor_round_trips_the_sort_key():
+    values = [datetime(2024, 1, 1, tzinfo=timezone.utc), "user-1"]
+
+    assert decode_cursor(encode_cursor(values)) == values
+
+
+@pytest.mark.parametrize("payload", [b"[1]", b"[1, 2, 3]", b'{"a": 1}', b"not json"])
+def test_malformed_cursor_is_a_bad_request(payload):
+    cursor = base64.urlsafe_b64encode(payload).decode("ascii")
+
+    with pytest.raises(HTTPException) as error:
+        keyset_paginate(users.select(), users.c.updated_on, users.c.id, cursor=cursor, limit=10)
+
+    assert error.value.status_code == 400
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime, timezone
+
+from app.api.api_v1.endpoints import user as user_endpoints
+
+
+class Record(dict):
+    """Row read both as a mapping and by attribute, like a `databases` record."""
+
+    __getattr__ = dict.__getitem__
+
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+USER = Record(id="user-1", phone_number="9876543210", created_on=NOW)
+DOCUMENT = {
+    "id": 1,
+    "document_type": "application/pdf",
+    "document_size": 200,
+    "container": "documents",
+    "document_path": "user-1/pancard_1",
+    "created_on": NOW,
+    "updated_on": NOW,
+    "user_id": "user-1",
+    "document_type_id": 3,
+    "status": "pending",
+    "is_active": True,
+    "document_name": "scan.pdf",
+    "document_file_name": "PAN Card",
+}
+
+
+def test_get_by_phone_keeps_the_type_name_in_document_name(monkeypatch):
+    async def get_by_phone(phone):
+        return USER
+
+    async def get_user_documents_with_types(user_id):
+        return [DOCUMENT]
+
+    monkeypatch.setattr(user_endpoints.user_repository, "get_by_phone", get_by_phone)
+    monkeypatch.setattr(
+        user_endpoints.document_repository,
+        "get_user_documents_with_types",
+        get_user_documents_with_types,
+    )
+
+    user = asyncio.run(
+        user_endpoints.get_user_detail_using_phone("9876543210", current_user=None)
+    )
+
+    [document] = user.dict()["documents"]
+    assert document["document_name"] == "PAN Card"
+    assert document["file_name"] == "scan.pdf"
@@ -0,0 +1,47 @@
+import asyncio
+
+from app.models.user import users
+from app.repository.user_repository import user_repository
+
+
+def test_bulk_upsert_inserts_new_users_with_server_defaults(pg_database, monkeypatch):
+    monkeypatch.setattr(user_repository, "database", pg_database)
+
+    async def scenario():
+        await pg_database.connect()
+        try:
+            upserted = await user_repository.bulk_upsert(
+                [{"id": "user-1", "phone_number": "9876543210", "full_name": "Jane"}],
+                ["full_name"],
+            )
+            return upserted, await pg_database.fetch_all(users.select())
+        finally:
+            await pg_database.disconnect()
+
+    upserted, rows = asyncio.run(scenario())
+
+    assert [row["inserted"] for row in upserted] == [True]
+    assert [(row["full_name"], row["documents_count"]) for row in rows] == [("Jane", 0)]
+
+
+def test_bulk_upsert_merges_on_phone_number(pg_database, monkeypatch):
+    monkeypatch.setattr(user_repository, "database", pg_database)
+
+    async def scenario():
+        await pg_database.connect()
+        try:
+            await pg_database.execute(
+                users.insert().values(id="user-1", phone_number="9876543210", full_name="Jane")
+            )
+            upserted = await user_repository.bulk_upsert(
+                [{"id": "user-2", "phone_number": "9876543210", "full_name": "Jane Doe"}],
+                ["full_name"],
+            )
+            return upserted, await pg_database.fetch_all(users.select())
+        finally:
+            await pg_database.disconnect()
+
+    upserted, rows = asyncio.run(scenario())
+
+    assert [(row["id"], row["inserted"]) for row in upserted] == [("user-1", False)]
+    assert [row["full_name"] for row in rows] == ["Jane Doe"]
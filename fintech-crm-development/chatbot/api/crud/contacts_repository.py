@@ -7,6 +7,7 @@ from api.schemas.message_schema import MessageBase
 from sqlalchemy import select, func, and_, over, or_
 from sqlalchemy.sql import text
 from sqlalchemy import cast, TIMESTAMP, Numeric
+from api.utilis import to_epoch_string
 
 
 
@@ -96,7 +97,7 @@ async def get_contacts(unnamed: bool = False, unread: bool = False):
     
     query = query.order_by(
     func.coalesce(
-        func.to_timestamp(cast(latest_messages.c.timestamp, Numeric)),  
+        latest_messages.c.timestamp,
         cast(contacts.c.created_at, TIMESTAMP)                          
     ).desc(),
     contacts.c.created_at.desc()
@@ -118,7 +119,7 @@ async def get_contacts(unnamed: bool = False, unread: bool = False):
                 "message_id": row["message_message_id"],
                 "message_type": row["message_type"],
                 "message_sender": row["message_sender"],
-                "timestamp": row["timestamp"],
+                "timestamp": to_epoch_string(row["timestamp"]),
                 "media_id": row["media_id"],
                 "latitude": row["latitude"],
                 "longitude": row["longitude"]
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 
 from api.db_utils import database, messages, templates
 from api.schemas.message_schema import MessageBase
+from api.utilis import to_epoch_string, to_message_time
 
 
 from sqlalchemy import select, outerjoin, text
@@ -18,7 +19,7 @@ async def create_message(message: MessageBase):
         'message_id': message.message_id,
         'message_type': message.message_type,
         'message_sender': message.message_sender,
-        'timestamp': message.timestamp,
+        'timestamp': to_message_time(message.timestamp),
         'read':message.read,
     }
 
@@ -79,7 +80,7 @@ async def get_message_list(phone_number: str, message_id: int = None, limit: int
             "message_id": row.message_id,
             "message_type": row.message_type,
             "message_sender": row.message_sender,
-            "timestamp": row.timestamp,
+            "timestamp": to_epoch_string(row.timestamp),
             "media_id": row.media_id,
             "latitude": row.latitude,
             "variables": row.variables,
@@ -125,7 +126,7 @@ async def search_messages(keyword: str, phone_number: str = None, limit: int = 1
             "message_id": row.message_id,
             "message_type": row.message_type,
             "message_sender": row.message_sender,
-            "timestamp": row.timestamp,
+            "timestamp": to_epoch_string(row.timestamp),
             "media_id": row.media_id,
             "latitude": row.latitude,
             "longitude": row.longitude,
@@ -150,10 +151,10 @@ async def filter_messages(
     ).where(messages.c.phone_number == phone_number)
 
     if start_time:
-        query = query.where(text("CAST(timestamp AS INTEGER) >= :start_time").bindparams(start_time=start_time))
+        query = query.where(messages.c.timestamp >= to_message_time(start_time))
 
     if end_time:
-        query = query.where(text("CAST(timestamp AS INTEGER) <= :end_time").bindparams(end_time=end_time))
+        query = query.where(messages.c.timestamp <= to_message_time(end_time))
 
     if attachments is not None:
         query = query.where(messages.c.media_id.isnot(None) if attachments else messages.c.media_id.is_(None))
@@ -170,7 +171,7 @@ async def filter_messages(
             "message_id": row.message_id,
             "message_type": row.message_type,
             "message_sender": row.message_sender,
-            "timestamp": row.timestamp,
+            "timestamp": to_epoch_string(row.timestamp),
             "media_id": row.media_id,
             "latitude": row.latitude,
             "longitude": row.longitude,
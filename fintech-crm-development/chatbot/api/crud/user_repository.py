@@ -6,6 +6,7 @@ from sqlalchemy import func, select
 
 from api.db_utils import database
 from api.db_utils import users
+from api.utilis import to_epoch_string, to_message_time
 from api.schemas.user import UserCreate, UserCreateKafka, UserUpdate, UserUpdateDeatils
 from api.schemas.user import UserCreateManual
 from api.schemas.user import UserCreateManual
@@ -123,7 +124,7 @@ class UserRepository:
         elif name_order == "Z-A":
             query = query.where(users.c.full_name.isnot(None)).order_by(users.c.full_name.desc())
         else:
-            query = query.order_by(users.c.last_communicated.desc())
+            query = query.order_by(users.c.last_communicated.desc().nullslast())
 
         if search_query:
             for column, value in search_query.items():
@@ -170,11 +171,11 @@ class UserRepository:
 
     async def update_last_communication(self, phone_number: str, response: str):
         """
-        Update last communication details in the system.
+        Move the last communication time of a user forward to a newer message.
 
         Args:
             phone_number (str): The phone number of the user to update.
-            response: The timestamps.
+            response: The message time in epoch seconds.
 
         Returns:
             str: The ID of the user.
@@ -183,7 +184,10 @@ class UserRepository:
             users.update()
             .where(phone_number == users.c.phone_number)
             .values(
-                last_communicated=response,
+                # GREATEST skips NULL, so the first message sets the time
+                last_communicated=func.greatest(
+                    users.c.last_communicated, to_message_time(response)
+                ),
             )
             .returning(users.c.id)
         )
@@ -509,7 +513,7 @@ class UserRepository:
         
         query = query.order_by(
             func.coalesce(
-                func.to_timestamp(cast(latest_messages.c.timestamp, Numeric)),  
+                latest_messages.c.timestamp,
                 cast(users.c.created_on, TIMESTAMP)                           
             ).desc(),
             users.c.created_on.desc()
@@ -532,7 +536,7 @@ class UserRepository:
                     "message_id": row["message_message_id"],
                     "message_type": row["message_type"],
                     "message_sender": row["message_sender"],
-                    "timestamp": row["timestamp"],
+                    "timestamp": to_epoch_string(row["timestamp"]),
                     "media_id": row["media_id"],
                     "latitude": row["latitude"],
                     "longitude": row["longitude"]
@@ -619,7 +623,7 @@ class UserRepository:
             .where(users.c.auditor_id.isnot(None))  # Added this line
             .order_by(
                 func.coalesce(
-                    func.to_timestamp(cast(latest_messages.c.timestamp, Numeric)),
+                    latest_messages.c.timestamp,
                     cast(users.c.created_on, TIMESTAMP)
                 ).desc(),
                 users.c.created_on.desc()
@@ -643,7 +647,7 @@ class UserRepository:
                     "message_id": row["message_message_id"],
                     "message_type": row["message_type"],
                     "message_sender": row["message_sender"],
-                    "timestamp": row["timestamp"],
+                    "timestamp": to_epoch_string(row["timestamp"]),
                     "media_id": row["media_id"],
                     "latitude": row["latitude"],
                     "longitude": row["longitude"]
@@ -9,6 +9,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import ARRAY
 
 
+from api.logger import logger
 from api.settings import settings
 
 load_dotenv()
@@ -31,12 +32,16 @@ messages = sqlalchemy.Table(
     sqlalchemy.Column("message_id", sqlalchemy.String),
     sqlalchemy.Column("message_type", sqlalchemy.String),
     sqlalchemy.Column("message_sender", sqlalchemy.String),
-    sqlalchemy.Column("timestamp", sqlalchemy.String),
+    sqlalchemy.Column("timestamp", sqlalchemy.DateTime(timezone=True)),
     sqlalchemy.Column("media_id", sqlalchemy.String, nullable=True),  
     sqlalchemy.Column("latitude", sqlalchemy.Float, nullable=True),  
     sqlalchemy.Column("longitude", sqlalchemy.Float, nullable=True),  
     sqlalchemy.Column("read", sqlalchemy.Boolean, default=False),
     sqlalchemy.Column("variables", ARRAY(sqlalchemy.String), nullable=True),
+    # Conversation history and the latest message of a phone number
+    sqlalchemy.Index(
+        "ix_messages_phone_number_timestamp", "phone_number", sqlalchemy.text('"timestamp" DESC')
+    ),
 )
 
 templates = sqlalchemy.Table(
@@ -111,7 +116,7 @@ users = sqlalchemy.Table(
     sqlalchemy.Column("status", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("is_active", sqlalchemy.Boolean),
     sqlalchemy.Column("role", sqlalchemy.String, nullable=True),
-    sqlalchemy.Column("last_communicated", sqlalchemy.String),
+    sqlalchemy.Column("last_communicated", sqlalchemy.DateTime(timezone=True), nullable=True),
     sqlalchemy.Column("source", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("loan_amount", sqlalchemy.Float, nullable=True),
     sqlalchemy.Column("employment_type", sqlalchemy.String, nullable=True),
@@ -170,3 +175,27 @@ documents_type = sqlalchemy.Table(
 
 engine = sqlalchemy.create_engine(settings.DATABASE_URL)
 metadata.create_all(engine)
+
+
+def create_search_indexes():
+    """
+    Create the pg_trgm GIN indexes used by the contact search, so ILIKE '%term%'
+    no longer scans the whole table. Search keeps working without them.
+    """
+    statements = [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_contacts_name_trgm ON contacts USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_contacts_phone_number_trgm ON contacts "
+        "USING gin (phone_number gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_contacts_email_id_trgm ON contacts "
+        "USING gin (email_id gin_trgm_ops)",
+    ]
+    try:
+        with engine.begin() as connection:
+            for statement in statements:
+                connection.execute(sqlalchemy.text(statement))
+    except sqlalchemy.exc.SQLAlchemyError as e:
+        logger.warning(f"Could not create contact search indexes: {e}")
+
+
+create_search_indexes()
@@ -18,6 +18,7 @@ from api.schemas.message_schema import MessageBase
 from api.schemas.razorpay_schema import RazorPayCreate
 from api.settings import settings
 from api.utilis import convert_datetime_to_timezone
+from bot.message import close_session, get_session
 from bot.message_flow import message_process
 from bot.message_handler import extract_whatsapp_message
 from bot.whatsapp import obj_whatsapp
@@ -96,7 +97,10 @@ async def startup():
     try:
         await database.connect()
         logger.info("Database connected successfully.")
-        
+
+        # Open the shared WhatsApp HTTP session
+        get_session()
+
         # Start the reminder checker as a background task
         asyncio.create_task(check_reminders())
         logger.info("Reminder checker started.")
@@ -112,6 +116,7 @@ async def shutdown():
     Shutdown event to disconnect from the database.
     """
     try:
+        await close_session()
         await database.disconnect()
         logger.info("Database disconnected successfully.")
     
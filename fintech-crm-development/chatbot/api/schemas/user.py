@@ -54,7 +54,7 @@ class UserUpdate(UserCreate):
 
 class UserId(UserBase):
     id: str
-    last_communicated: Optional[str] = None
+    last_communicated: Optional[datetime] = None
     documents_count: Optional[int] = None
     created_on: datetime
 
@@ -260,7 +260,7 @@ class UserFull(UserBase):
     id: str
     created_on: datetime
     updated_on: datetime
-    last_communicated: Optional[str] = None
+    last_communicated: Optional[datetime] = None
     phone_number: Optional[str] = None  # Make phone_number optional
     is_active: Optional[bool] = True
     role: Optional[str] = "User"
@@ -24,6 +24,13 @@ class Settings(BaseSettings):
     CONNECTION_STRING: str
     AZURE_CONTAINER_NAME: str = "whatsapp-media"
 
+    # Shared outbound HTTP session
+    HTTP_CLIENT_TIMEOUT: float = 30.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 60.0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -29,3 +29,17 @@ def convert_datetime_to_timezone(datetime_str, timezone_str):
         return target_datetime_str
     except (ValueError, TypeError) as e:
         logging.log("Error while converting timezone:", e)
+
+
+def to_message_time(value):
+    """Read a WhatsApp message timestamp (epoch seconds) as an aware UTC datetime."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromtimestamp(float(value), tz=UTC)
+
+
+def to_epoch_string(value):
+    """Format a stored message time as the epoch seconds string the API returns."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(int(value.timestamp()))
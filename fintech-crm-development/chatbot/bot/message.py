@@ -1,8 +1,12 @@
 import json
 import logging
 import re
+from typing import Optional
+
 import aiohttp
 
+from api.settings import settings
+
 
 # Logging
 logging.basicConfig(
@@ -13,16 +17,43 @@ async def headers(WA_TOKEN):
     return {"Content-Type": "application/json", "Authorization": f"Bearer {WA_TOKEN}"}
 
 
+# Shared by every outgoing WhatsApp message so connections to the Graph API are reused
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get the shared client session, opening it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                limit_per_host=settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=settings.HTTP_CLIENT_TIMEOUT, connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT
+            ),
+        )
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
 async def post_data(url, headers, data):
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, data=data) as response:
-                if response.status == 200:
-                    response_text = await response.text()
-                    return response_text
-                else:
-                    # Handle non-200 status codes
-                    logging.error(f"Request failed with status code: {response.status}")
+        async with get_session().post(url, headers=headers, data=data) as response:
+            if response.status == 200:
+                response_text = await response.text()
+                return response_text
+            else:
+                # Handle non-200 status codes
+                logging.error(f"Request failed with status code: {response.status}")
     except aiohttp.ClientError as e:
         # Handle aiohttp exceptions (e.g., connection errors, timeouts)
         logging.exception(f"Aiohttp error occurred: {e}")